@@ -0,0 +1,19 @@
+import React from "react";
+
+// Follows the `next` link of a paged list (see utils/pagination.js)
+const LoadMoreButton = ({ hasMore, isLoading, onClick, label = "Load more" }) => {
+  if (!hasMore) return null;
+  return (
+    <div className="flex justify-center pt-4">
+      <button
+        onClick={onClick}
+        disabled={isLoading}
+        className="px-6 py-2 rounded-xl bg-white/5 border border-white/10 text-slate-300 font-semibold hover:bg-white/10 transition-all disabled:opacity-50"
+      >
+        {isLoading ? "Loading..." : label}
+      </button>
+    </div>
+  );
+};
+
+export default LoadMoreButton;
@@ -14,12 +14,15 @@ import {
   X
 } from "lucide-react";
 import axios from 'axios';
+import { usePagedList } from '../utils/pagination';
+import LoadMoreButton from '../components/LoadMoreButton';
 import { toast } from "react-toastify";
 import "./Home.css";
 
 const Companies = () => {
   const { user } = useOutletContext();
-  const [jobs, setJobs] = useState([]);
+  // Drives are paged; companies are grouped from the drives loaded so far
+  const { rows: jobs, hasMore, isLoadingMore, loadFirst, loadMore } = usePagedList();
   const [isLoading, setIsLoading] = useState(true);
   const [searchQuery, setSearchQuery] = useState("");
   const [showCreateForm, setShowCreateForm] = useState(false);
@@ -43,8 +46,7 @@ const Companies = () => {
   useEffect(() => {
     const fetchJobs = async () => {
       try {
-        const response = await axios.get("http://127.0.0.1:8000/api/placement/jobs/");
-        setJobs(response.data);
+        await loadFirst("http://127.0.0.1:8000/api/placement/jobs/");
       } catch (error) {
         console.error("Error fetching jobs:", error);
         toast.error("Failed to load companies");
@@ -90,8 +92,7 @@ const Companies = () => {
         qualification: '', responsibilities: '', requirements: ''
       });
       // Refresh
-      const response = await axios.get("http://127.0.0.1:8000/api/placement/jobs/");
-      setJobs(response.data);
+      await loadFirst("http://127.0.0.1:8000/api/placement/jobs/");
     } catch (error) {
       toast.error("Failed to schedule interview");
     }
@@ -194,6 +195,12 @@ const Companies = () => {
               </div>
             )}
           </div>
+          <LoadMoreButton
+            hasMore={hasMore}
+            isLoading={isLoadingMore}
+            label="Load more drives"
+            onClick={() => loadMore().catch(() => toast.error("Failed to load more companies"))}
+          />
         </div>
       </section>
 
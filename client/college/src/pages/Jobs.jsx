@@ -17,12 +17,14 @@ import {
   FileText
 } from "lucide-react";
 import axios from 'axios';
+import { usePagedList } from '../utils/pagination';
+import LoadMoreButton from '../components/LoadMoreButton';
 import { toast } from "react-toastify";
 import "./Home.css";
 
 const Jobs = () => {
   const { user } = useOutletContext();
-  const [jobs, setJobs] = useState([]);
+  const { rows: jobs, hasMore, isLoadingMore, loadFirst, loadMore } = usePagedList();
   const [isLoading, setIsLoading] = useState(true);
   const [searchQuery, setSearchQuery] = useState("");
   const [selectedJob, setSelectedJob] = useState(null);
@@ -51,8 +53,7 @@ const Jobs = () => {
   useEffect(() => {
     const fetchJobs = async () => {
       try {
-        const response = await axios.get("http://127.0.0.1:8000/api/placement/jobs/");
-        setJobs(response.data);
+        await loadFirst("http://127.0.0.1:8000/api/placement/jobs/");
       } catch (error) {
         console.error("Error fetching jobs:", error);
         toast.error("Failed to load jobs");
@@ -88,8 +89,7 @@ const Jobs = () => {
         meeting_link: '', department: '', attachment: null
       });
       // Refresh jobs list
-      const response = await axios.get("http://127.0.0.1:8000/api/placement/jobs/");
-      setJobs(response.data);
+      await loadFirst("http://127.0.0.1:8000/api/placement/jobs/");
     } catch (error) {
       toast.error("Failed to create job drive");
     }
@@ -207,6 +207,12 @@ const Jobs = () => {
                   <p className="text-slate-400">No jobs matching your search.</p>
                 </div>
               )}
+              <LoadMoreButton
+                hasMore={hasMore}
+                isLoading={isLoadingMore}
+                label="Load more jobs"
+                onClick={() => loadMore().catch(() => toast.error("Failed to load more jobs"))}
+              />
             </div>
 
             {/* Job Details Sidebar / Selection */}
@@ -3,11 +3,15 @@ import axios from "axios";
 import { Bell, CheckCircle, AlertTriangle, Info, Trash2, Clock,Users, User, ExternalLink } from "lucide-react";
 import { motion } from "framer-motion";
 import { toast } from "react-toastify";
+import { usePagedList } from "../utils/pagination";
+import LoadMoreButton from "../components/LoadMoreButton";
 import "./Notifications.css";
 import "./Home.css";
 
 const Notifications = () => {
-  const [notifications, setNotifications] = React.useState([]);
+  // Newest first; older notifications load through `next`. Keyset cursors
+  // stay valid when rows above them are approved or deleted.
+  const { rows: notifications, setRows: setNotifications, hasMore, isLoadingMore, loadFirst, loadMore } = usePagedList();
   const [isLoading, setIsLoading] = React.useState(true);
   const [actionLoading, setActionLoading] = React.useState(null);
   const [expandedNotifs, setExpandedNotifs] = React.useState(new Set());
@@ -21,8 +25,7 @@ const Notifications = () => {
       try {
         const phone = user?.user_id || user?.phone;
         if (!phone) return;
-        const response = await axios.get(`http://127.0.0.1:8000/api/accounts/notifications/?phone=${phone}`);
-        setNotifications(response.data || []);
+        await loadFirst(`http://127.0.0.1:8000/api/accounts/notifications/?phone=${phone}`);
       } catch (error) {
         console.error("Error fetching notifications:", error);
       } finally {
@@ -450,6 +453,14 @@ const Notifications = () => {
               <p>You're all caught up!</p>
             </div>
           )}
+          {!isLoading && (
+            <LoadMoreButton
+              hasMore={hasMore}
+              isLoading={isLoadingMore}
+              label="Load older notifications"
+              onClick={() => loadMore().catch(() => toast.error("Failed to load older notifications"))}
+            />
+          )}
         </div>
       </div>
     </div>
@@ -24,6 +24,8 @@ import {
 } from "lucide-react";
 import { useOutletContext, useNavigate } from 'react-router-dom';
 import axios from 'axios';
+import { usePagedList } from '../../utils/pagination';
+import LoadMoreButton from '../../components/LoadMoreButton';
 import { toast } from "react-toastify";
 import { 
   BarChart, 
@@ -47,13 +49,15 @@ const PlacementOfficer = () => {
     const navigate = useNavigate();
     const [stats, setStats] = useState([]);
     const [isLoading, setIsLoading] = useState(true);
-    const [activeJobs, setActiveJobs] = useState([]);
+    const activeJobPages = usePagedList();
+    const activeJobs = activeJobPages.rows;
     const [showCreateForm, setShowCreateForm] = useState(false);
     const [expandedJob, setExpandedJob] = useState(null);
     const [jobApplicants, setJobApplicants] = useState({});
     
     // Poster States
-    const [posters, setPosters] = useState([]);
+    const posterPages = usePagedList();
+    const posters = posterPages.rows;
     const [isPostersLoading, setIsPostersLoading] = useState(false);
     const [showPosterModal, setShowPosterModal] = useState(false);
     const [posterFormData, setPosterFormData] = useState({
@@ -100,14 +104,12 @@ const PlacementOfficer = () => {
 
     const fetchData = async () => {
         try {
-            const [statsRes, jobsRes, postersRes] = await Promise.all([
+            const [statsRes] = await Promise.all([
                 axios.get("http://127.0.0.1:8000/api/placement/dashboard/"),
-                axios.get("http://127.0.0.1:8000/api/placement/jobs/"),
-                axios.get("http://127.0.0.1:8000/api/placement/posters/")
+                activeJobPages.loadFirst("http://127.0.0.1:8000/api/placement/jobs/"),
+                posterPages.loadFirst("http://127.0.0.1:8000/api/placement/posters/")
             ]);
             setStats(statsRes.data.stats || []);
-            setActiveJobs(jobsRes.data || []);
-            setPosters(postersRes.data || []);
         } catch (error) {
             console.error("Error fetching placement data:", error);
             toast.error("Failed to load dashboard data");
@@ -217,7 +219,7 @@ const PlacementOfficer = () => {
             if (!jobApplicants[jobId]) {
                 try {
                     const res = await axios.get(`http://127.0.0.1:8000/api/placement/jobs/${jobId}/applicants/`);
-                    setJobApplicants(prev => ({ ...prev, [jobId]: res.data }));
+                    setJobApplicants(prev => ({ ...prev, [jobId]: res.data.applicants }));
                 } catch (error) {
                     toast.error("Failed to fetch applicants");
                 }
@@ -255,15 +257,11 @@ const PlacementOfficer = () => {
         setIsStatsLoading(true);
         
         try {
-            let endpoint;
-            if (label === "Students Registered") {
-                endpoint = "students/";
-            } else if (label === "Teachers Registered") {
-                endpoint = "teachers/";
-            } else {
-                endpoint = "applications/";
-            }
-            const res = await axios.get(`http://127.0.0.1:8000/api/placement/${endpoint}`);
+            // The modal filters by department and exports the whole list, so it
+            // streams the table in one response rather than walking its pages
+            const endpoint = label === "Students Registered" ? "students/"
+                : label === "Teachers Registered" ? "teachers/" : "applications/";
+            const res = await axios.get(`http://127.0.0.1:8000/api/placement/${endpoint}?stream=json`);
             setStatsModalData(res.data);
         } catch (error) {
             toast.error(`Failed to fetch ${label.toLowerCase()}`);
@@ -590,6 +588,9 @@ const PlacementOfficer = () => {
                                                                 <tr className="text-slate-400 text-sm">
                                                                     <th className="pb-3 pr-4">Name</th>
                                                                     <th className="pb-3 pr-4">CGPA</th>
+                                                                    <th className="pb-3 pr-4">Backlogs</th>
+                                                                    <th className="pb-3 pr-4">ATS</th>
+                                                                    <th className="pb-3 pr-4">Match</th>
                                                                     <th className="pb-3 pr-4">Status</th>
                                                                     <th className="pb-3">Action</th>
                                                                 </tr>
@@ -597,8 +598,11 @@ const PlacementOfficer = () => {
                                                             <tbody className="text-slate-300">
                                                                 {jobApplicants[job.id].map((app) => (
                                                                     <tr key={app.id} className="border-t border-white/5">
-                                                                        <td className="py-3 pr-4">{app.job_details?.student_name || "Student"}</td>
-                                                                        <td className="py-3 pr-4 font-mono">{app.job_details?.student_cgpa || "N/A"}</td>
+                                                                        <td className="py-3 pr-4">{app.student_name || "Student"}</td>
+                                                                        <td className="py-3 pr-4 font-mono">{app.cgpa ?? "N/A"}</td>
+                                                                        <td className="py-3 pr-4 font-mono">{app.backlogs}</td>
+                                                                        <td className="py-3 pr-4 font-mono">{app.ats_score != null ? `${app.ats_score}%` : "N/A"}</td>
+                                                                        <td className="py-3 pr-4 font-mono">{app.match_score != null ? `${app.match_score}%` : "N/A"}</td>
                                                                         <td className="py-3 pr-4">
                                                                             <span className="px-2 py-0.5 rounded-full text-xs bg-brand-lime/10 text-brand-sea border border-brand-lime/20">
                                                                                 {app.status}
@@ -621,6 +625,12 @@ const PlacementOfficer = () => {
                                 </AnimatePresence>
                             </div>
                         ))}
+                        <LoadMoreButton
+                            hasMore={activeJobPages.hasMore}
+                            isLoading={activeJobPages.isLoadingMore}
+                            label="Load more drives"
+                            onClick={() => activeJobPages.loadMore().catch(() => toast.error("Failed to load more job drives"))}
+                        />
                     </div>
 
                     {/* Posters List */}
@@ -669,6 +679,12 @@ const PlacementOfficer = () => {
                             </div>
                         )}
                     </div>
+                    <LoadMoreButton
+                        hasMore={posterPages.hasMore}
+                        isLoading={posterPages.isLoadingMore}
+                        label="Load more posters"
+                        onClick={() => posterPages.loadMore().catch(() => toast.error("Failed to load more posters"))}
+                    />
 
                     {/* Create Job Modal */}
                     <AnimatePresence>
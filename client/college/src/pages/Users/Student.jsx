@@ -57,7 +57,8 @@ const Student = () => {
         setUpcomingDrives(dashRes.data.upcoming_drives || []);
         setAllDriveDates(dashRes.data.all_drive_dates || []);
         setRecommendations(dashRes.data.recommendations || null);
-        setPosters(postersRes.data || []);
+        if (dashRes.data.recommendations?.ai_status === 'pending') pollAiSuggestions(phone);
+        setPosters(postersRes.data.results || []);
       } catch (error) {
         console.error("Error fetching student dashboard data:", error);
         setStats([]); 
@@ -71,6 +72,20 @@ const Student = () => {
     }
   }, [user]);
 
+  // AI suggestions are generated in the background; attach them once ready
+  const pollAiSuggestions = async (phone, attempt = 0) => {
+    try {
+      const res = await axios.get(`http://127.0.0.1:8000/api/student/ai-suggestions/?phone=${phone}`);
+      const { ai_status, ai_suggestions } = res.data;
+      setRecommendations(prev => prev ? { ...prev, ai_status, ai_suggestions } : prev);
+      if (ai_status === 'pending' && attempt < 10) {
+        setTimeout(() => pollAiSuggestions(phone, attempt + 1), 1500);
+      }
+    } catch (error) {
+      console.error("AI suggestions poll error:", error);
+    }
+  };
+
   const handleApply = async (jobId) => {
     setApplyingId(jobId);
     try {
@@ -403,6 +418,7 @@ const Student = () => {
         isOpen={isCalendarOpen} 
         onClose={() => setIsCalendarOpen(false)} 
         drives={allDriveDates}
+        phone={user?.user_id || user?.phone}
       />
     </div>
   );
@@ -472,9 +488,22 @@ const DriveCard = ({ drive }) => (
   </div>
 );
 
-const CalendarModal = ({ isOpen, onClose, drives }) => {
+const CalendarModal = ({ isOpen, onClose, drives, phone }) => {
   const [currentDate, setCurrentDate] = React.useState(new Date());
-  
+  const [entries, setEntries] = React.useState(null);
+
+  // Drives and interviews for the visible month; the browser revalidates
+  // repeat visits with the ETag the calendar endpoint sends
+  React.useEffect(() => {
+    if (!isOpen) return;
+    const month = `${currentDate.getFullYear()}-${String(currentDate.getMonth() + 1).padStart(2, '0')}`;
+    let cancelled = false;
+    axios.get(`http://127.0.0.1:8000/api/student/calendar/?phone=${phone}&month=${month}`)
+      .then(res => { if (!cancelled) setEntries(res.data.entries); })
+      .catch(() => { if (!cancelled) setEntries(null); });
+    return () => { cancelled = true; };
+  }, [isOpen, currentDate, phone]);
+
   if (!isOpen) return null;
 
   const daysInMonth = (year, month) => new Date(year, month + 1, 0).getDate();
@@ -484,7 +513,7 @@ const CalendarModal = ({ isOpen, onClose, drives }) => {
   const month = currentDate.getMonth();
   const monthName = currentDate.toLocaleString('default', { month: 'long' });
 
-  const driveMap = drives.reduce((acc, drive) => {
+  const driveMap = (entries || drives).reduce((acc, drive) => {
     acc[drive.date] = acc[drive.date] || [];
     acc[drive.date].push(drive);
     return acc;
@@ -547,7 +576,7 @@ const CalendarModal = ({ isOpen, onClose, drives }) => {
                 <div key={day} className="relative group">
                   <div 
                     className={`h-10 flex items-center justify-center rounded-lg text-sm transition-all
-                      ${dayDrives ? 'bg-blue-600 text-white font-bold shadow-lg shadow-blue-600/20' : 'text-slate-400 hover:bg-white/5'}
+                      ${dayDrives ? (dayDrives.some(d => d.type !== 'interview') ? 'bg-blue-600 shadow-blue-600/20' : 'bg-purple-600 shadow-purple-600/20') + ' text-white font-bold shadow-lg' : 'text-slate-400 hover:bg-white/5'}
                       ${isToday && !dayDrives ? 'border border-blue-500/30' : ''}
                     `}
                   >
@@ -561,9 +590,9 @@ const CalendarModal = ({ isOpen, onClose, drives }) => {
                     <div className="invisible group-hover:visible absolute bottom-full left-1/2 -translate-x-1/2 mb-2 w-48 p-3 bg-slate-800 border border-white/10 rounded-xl shadow-2xl z-50 pointer-events-none">
                       <p className="text-[10px] text-blue-400 font-bold uppercase mb-2">Drives on {day} {monthName}</p>
                       {dayDrives.map(d => (
-                        <div key={d.id} className="mb-2 last:mb-0">
-                          <p className="text-xs font-bold text-white leading-tight">{d.role}</p>
-                          <p className="text-[10px] text-slate-400">{d.company}</p>
+                        <div key={`${d.type || 'drive'}-${d.id}`} className="mb-2 last:mb-0">
+                          <p className="text-xs font-bold text-white leading-tight">{d.type === 'interview' ? `Interview: ${d.role || d.company}` : d.role}</p>
+                          <p className="text-[10px] text-slate-400">{d.company}{d.time ? ` · ${d.time}` : ''}</p>
                         </div>
                       ))}
                     </div>
@@ -579,6 +608,10 @@ const CalendarModal = ({ isOpen, onClose, drives }) => {
                 <div className="w-2 h-2 bg-blue-600 rounded-full"></div>
                 <span className="text-[10px] text-slate-400 uppercase font-medium">Scheduled Drive</span>
               </div>
+              <div className="flex items-center gap-2">
+                <div className="w-2 h-2 bg-purple-600 rounded-full"></div>
+                <span className="text-[10px] text-slate-400 uppercase font-medium">Interview</span>
+              </div>
               <div className="flex items-center gap-2">
                 <div className="w-2 h-2 border border-blue-500/30 rounded-full"></div>
                 <span className="text-[10px] text-slate-400 uppercase font-medium">Today</span>
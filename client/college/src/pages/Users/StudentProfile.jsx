@@ -156,6 +156,7 @@ const StudentProfile = () => {
       
       const updatedProfile = response.data;
       setProfile(updatedProfile);
+      if (isStudent && updatedProfile.ats_status === 'pending') pollAtsStatus(phone);
       setSuccess(true);
       setTimeout(() => setSuccess(false), 3000);
       
@@ -177,6 +178,20 @@ const StudentProfile = () => {
     }
   };
 
+  // ATS scoring runs in the background after a resume upload; poll until it lands
+  const pollAtsStatus = async (phone, attempt = 0) => {
+    try {
+      const res = await axios.get(`http://127.0.0.1:8000/api/student/ats-status/?phone=${phone}`);
+      const { ats_status, ats_score } = res.data;
+      setProfile(prev => ({ ...prev, ats_status, ats_score }));
+      if ((ats_status === 'pending' || ats_status === 'running') && attempt < 30) {
+        setTimeout(() => pollAtsStatus(phone, attempt + 1), 2000);
+      }
+    } catch (err) {
+      console.error("ATS status poll error:", err);
+    }
+  };
+
   const getPhone = () => {
     // Priority: local state > context user > localStorage user > localStorage userId
     const localUser = JSON.parse(localStorage.getItem('user') || '{}');
@@ -276,7 +291,8 @@ const StudentProfile = () => {
                        <div className="flex justify-between items-center text-sm pt-2 border-t border-white/5">
                          <span className="text-slate-400">ATS Score</span>
                          <span className={`font-bold ${parseFloat(profile.ats_score) > 50 ? 'text-green-400' : 'text-orange-400'}`}>
-                           {profile.ats_score !== undefined && profile.ats_score !== null ? 
+                           {(profile.ats_status === 'pending' || profile.ats_status === 'running') ? 'Scoring...' :
+                            profile.ats_score !== undefined && profile.ats_score !== null ? 
                              (profile.ats_score > 0 || (resumeFile || profile.resume)) ? `${profile.ats_score}%` : 'Not Checked'
                              : 'Not Checked'}
                          </span>
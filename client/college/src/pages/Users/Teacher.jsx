@@ -27,7 +27,7 @@ const Teacher = () => {
             ]);
             setStats(dashRes.data.stats || []);
             setIncompleteProfiles(dashRes.data.incomplete_profiles || 0);
-            setPosters(postersRes.data || []);
+            setPosters(postersRes.data.results || []);
         } catch (error) {
             console.error("Error fetching teacher dashboard data:", error);
         } finally {
@@ -0,0 +1,34 @@
+import { useState } from 'react';
+import axios from 'axios';
+
+// List endpoints return keyset pages: { next, previous, count_estimate, count_exact, results }.
+// Holds the rows loaded so far; loadFirst() fetches the first page and
+// loadMore() appends the page behind the `next` link, so a view only fetches
+// what the user scrolls to. Views that need a whole table use ?stream=json.
+// Both loaders throw on failure so the caller can show its own toast.
+export const usePagedList = () => {
+  const [rows, setRows] = useState([]);
+  const [next, setNext] = useState(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+
+  const loadFirst = async (url, config) => {
+    const response = await axios.get(url, config);
+    setRows(response.data.results);
+    setNext(response.data.next);
+  };
+
+  const loadMore = async () => {
+    if (!next || isLoadingMore) return;
+    setIsLoadingMore(true);
+    try {
+      // `next` already carries the query string
+      const response = await axios.get(next);
+      setRows(prev => [...prev, ...response.data.results]);
+      setNext(response.data.next);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
+  return { rows, setRows, hasMore: Boolean(next), isLoadingMore, loadFirst, loadMore };
+};
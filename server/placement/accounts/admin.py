@@ -1,8 +1,9 @@
 from django.contrib import admin
-from .models import User, Student, Teacher, PlacementOfficer
+from .models import User, Student, Teacher, PlacementOfficer, Department
 
 # Register your models here.
 admin.site.register(User)
 admin.site.register(Student)
 admin.site.register(Teacher)
 admin.site.register(PlacementOfficer)
+admin.site.register(Department)
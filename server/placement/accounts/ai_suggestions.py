@@ -0,0 +1,182 @@
+import hashlib
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+FALLBACK_SUGGESTION = "Ensure clear formatting, quantifiable achievements, and concise bullet points."
+
+
+# ==========================
+# Backends
+# ==========================
+
+class HuggingFaceBackend:
+    """
+    Hosted flan-t5 through the HuggingFace Inference API. Needs
+    HUGGINGFACE_API_KEY; the HTTP call itself is bounded by `timeout`.
+    """
+    model = "google/flan-t5-large"
+
+    def __init__(self):
+        import os
+        self.api_key = os.environ.get("HUGGINGFACE_API_KEY", "")
+
+    def suggest(self, resume_text, timeout):
+        from huggingface_hub import InferenceClient
+        prompt = f"Analyze this resume and suggest improvements to make it ATS friendly:\n\n{resume_text[:2000]}"
+        client = InferenceClient(api_key=self.api_key, timeout=timeout)
+        return client.text_generation(prompt, model=self.model)
+
+
+class LocalBackend:
+    """
+    Deterministic offline stand-in: the same resume text always yields the
+    same advice. AI_SUGGESTION_LOCAL_DELAY and AI_SUGGESTION_LOCAL_FAIL let
+    slow and failing inference be exercised without network access.
+    """
+
+    def __init__(self):
+        self.delay = getattr(settings, 'AI_SUGGESTION_LOCAL_DELAY', 0)
+        self.fail = getattr(settings, 'AI_SUGGESTION_LOCAL_FAIL', False)
+
+    def suggest(self, resume_text, timeout):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("Local AI backend configured to fail")
+
+        text = resume_text.lower()
+        tips = []
+        if not any(ch.isdigit() for ch in text.replace("cgpa", "")):
+            tips.append("Quantify your work with numbers, e.g. team size, users or performance gains.")
+        if "•" not in resume_text and "- " not in resume_text:
+            tips.append("Use bullet points so each achievement is easy to scan.")
+        if len(text.split()) < 150:
+            tips.append("Expand your projects with the tools used and your own contribution.")
+        if "summary" not in text and "objective" not in text:
+            tips.append("Open with a two line summary tailored to the role.")
+        if not tips:
+            tips.append("Make sure to improve resume summary, add measurable achievements, and use bullet points for clarity.")
+        return " ".join(tips)
+
+
+BACKENDS = {
+    'huggingface': HuggingFaceBackend,
+    'local': LocalBackend,
+}
+
+
+def get_backend():
+    """
+    Instantiates AI_SUGGESTION_BACKEND: a name from BACKENDS or a dotted path
+    to a class with a `suggest(resume_text, timeout)` method. Without an API
+    key the HuggingFace backend falls back to the local one.
+    """
+    name = getattr(settings, 'AI_SUGGESTION_BACKEND', 'huggingface')
+    backend_class = BACKENDS[name] if name in BACKENDS else import_string(name)
+    backend = backend_class()
+    if isinstance(backend, HuggingFaceBackend) and not backend.api_key:
+        return LocalBackend()
+    return backend
+
+
+# ==========================
+# Async execution
+# ==========================
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'AI_SUGGESTION_WORKERS', 2),
+                    thread_name_prefix='ai-suggestions',
+                )
+    return _executor
+
+
+def _cache():
+    # Shared across processes (settings.SHARED_CACHE_URL): the executor runs
+    # in the process that submitted the job, polls may land on any other
+    return caches['ai_suggestions']
+
+
+def _deadline():
+    return getattr(settings, 'AI_SUGGESTION_TIMEOUT', 8)
+
+
+def suggestion_key(resume_hash):
+    return f"ai:{resume_hash}"
+
+
+def _store(key, status, text=None, started=None):
+    entry = {"status": status, "text": text, "started": started}
+    if status == 'ready':
+        _cache().set(key, entry)
+    else:
+        # Failures are only remembered briefly so a later page load retries
+        _cache().set(key, entry, getattr(settings, 'AI_SUGGESTION_RETRY_AFTER', 300))
+    return entry
+
+
+def _run(key, resume_text, started):
+    try:
+        text = get_backend().suggest(resume_text, _deadline())
+        if time.time() - started > _deadline():
+            # Arrived after the deadline; the request already gave up on it
+            _store(key, 'timeout', started=started)
+        else:
+            _store(key, 'ready', text=text, started=started)
+    except Exception as e:
+        print(f"AI Recommendation Error: {e}")
+        traceback.print_exc()
+        _store(key, 'failed', started=started)
+
+
+def request_ai_suggestions(resume_text, resume_hash=None):
+    """
+    Returns {"status", "text"} for the resume without waiting on inference.
+    The first call submits the job and reports `pending`; later calls return
+    `ready` with the text, or `timeout`/`failed` once the hard deadline
+    (AI_SUGGESTION_TIMEOUT seconds) has passed without a result.
+    """
+    if not resume_hash:
+        resume_hash = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()
+    key = suggestion_key(resume_hash)
+
+    entry = _cache().get(key)
+    if entry is None:
+        started = time.time()
+        # add() so concurrent page loads submit the job only once
+        if _cache().add(key, {"status": 'pending', "text": None, "started": started}, _deadline() * 2):
+            _get_executor().submit(_run, key, resume_text, started)
+        entry = _cache().get(key) or {"status": 'pending', "text": None, "started": started}
+
+    if entry["status"] == 'pending' and time.time() - entry["started"] > _deadline():
+        entry = _store(key, 'timeout', started=entry["started"])
+
+    return {"status": entry["status"], "text": entry["text"]}
+
+
+def get_ai_suggestions(resume_text, timeout=None):
+    """
+    Blocking variant for scripts and shells: waits up to `timeout` seconds
+    (default AI_SUGGESTION_TIMEOUT) and falls back to a generic tip.
+    """
+    timeout = _deadline() if timeout is None else timeout
+    future = _get_executor().submit(get_backend().suggest, resume_text, timeout)
+    try:
+        return future.result(timeout=timeout)
+    except Exception as e:
+        print(f"AI Recommendation Error: {e}")
+        return FALLBACK_SUGGESTION
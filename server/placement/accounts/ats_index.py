@@ -0,0 +1,103 @@
+from collections import defaultdict
+
+from django.db.models import Count, Max
+
+from .models import Job, JobApplication, ResumeText
+from .departments import branch_code
+from .ats_utils import calculate_ats_score, fit_tfidf_corpus, forget_jd_vector, score_resumes
+
+# (latest Job.text_updated_at, job count) the shared vectorizer was fitted on
+_corpus_version = {"value": None}
+
+
+def job_text(job):
+    """The text a job is scored against: its description plus required skills."""
+    return f"{job.description}\n{job.skills_required}"
+
+
+def job_vector_key(job_id):
+    return f"job:{job_id}"
+
+
+def ensure_corpus():
+    """
+    Fits the shared TF-IDF vectorizer over every Job text and DEFAULT_JD.
+    Refits only when a job was added or deleted or its text edited since the
+    last fit, which one aggregate query detects (also across worker
+    processes); deadline and other edits keep the fit.
+    """
+    agg = Job.objects.aggregate(last=Max('text_updated_at'), count=Count('id'))
+    version = (agg['last'], agg['count'])
+    if version == _corpus_version["value"]:
+        return
+
+    texts = [
+        f"{description}\n{skills}"
+        for description, skills in Job.objects.values_list('description', 'skills_required')
+    ]
+    fit_tfidf_corpus(texts)
+    _corpus_version["value"] = version
+    print(f"ATS Debug: TF-IDF corpus fitted over {len(texts)} jobs")
+
+
+def invalidate_job(job_id):
+    """Drops the cached JD vector of an edited or deleted job."""
+    forget_jd_vector(job_vector_key(job_id))
+
+
+def score_resume_for_job(resume_text, job, branch="CT"):
+    """ATS score of a resume against a specific job, reusing its cached JD vector."""
+    ensure_corpus()
+    return calculate_ats_score(resume_text, job_text(job), branch=branch, jd_key=job_vector_key(job.pk))
+
+
+def score_applications(applications, batch_size=64):
+    """
+    Computes JobApplication.match_score for the given applications. They are
+    grouped by job so each JD vector is built once and each job's resumes
+    go through nlp.pipe together. Applicants without a readable resume keep
+    a NULL score, so they are listed as unscored rather than as 0. Returns
+    the number of applications scored.
+    """
+    from .resume_store import get_student_resume_text
+
+    applications = list(applications.select_related('job', 'student'))
+    if not applications:
+        return 0
+    ensure_corpus()
+
+    # Stored texts in one query; only resumes never seen by the store are parsed here
+    stored = dict(ResumeText.objects.filter(
+        sha256__in={a.student.resume_hash for a in applications if a.student.resume_hash}
+    ).values_list('sha256', 'text'))
+
+    by_job = defaultdict(list)
+    for application in applications:
+        by_job[application.job_id].append(application)
+
+    scored = 0
+    for job_applications in by_job.values():
+        job = job_applications[0].job
+        readable, items = [], []
+        for application in job_applications:
+            student = application.student
+            if student.resume_hash in stored:
+                text = stored[student.resume_hash]
+            else:
+                text = get_student_resume_text(student)
+            if not text.strip():
+                application.match_score = None
+                continue
+            readable.append(application)
+            items.append((text, branch_code(student)))
+        if not items:
+            continue
+
+        scores = score_resumes(items, batch_size=batch_size,
+                               job_description=job_text(job), jd_key=job_vector_key(job.pk))
+        for application, score in zip(readable, scores):
+            application.match_score = score
+        scored += len(readable)
+
+    JobApplication.objects.bulk_update(applications, ['match_score'], batch_size=500)
+    return scored
@@ -0,0 +1,185 @@
+import traceback
+from datetime import timedelta
+
+from django.utils import timezone
+
+from .models import AtsScoringJob, JobApplication, Student
+
+
+def needs_ats_scoring(student):
+    """
+    False when ats_score was already computed for these exact resume bytes
+    with the current ATS_MODEL_VERSION and the student's current branch,
+    whose keywords and default JD the score depends on.
+    """
+    from .ats_utils import ATS_MODEL_VERSION
+    from .departments import branch_code
+    return not (
+        student.resume_hash
+        and student.ats_scored_hash == student.resume_hash
+        and student.ats_model_version == ATS_MODEL_VERSION
+        and student.ats_scored_branch == branch_code(student)
+    )
+
+
+def exclude_current_scores(students):
+    """
+    needs_ats_scoring() in SQL: drops the students whose ats_score is still
+    valid. The branch is compared the way branch_code() derives it.
+    """
+    from django.db.models import F, Value
+    from django.db.models.functions import Coalesce, NullIf
+    from .ats_utils import ATS_MODEL_VERSION
+
+    return students.alias(
+        scoring_branch=Coalesce(F('branch__code'), NullIf(F('department'), Value('')), Value('CT')),
+    ).exclude(
+        ats_scored_hash=F('resume_hash'), ats_model_version=ATS_MODEL_VERSION,
+        ats_scored_branch=F('scoring_branch'),
+    )
+
+
+def enqueue_ats_scoring(student):
+    """
+    Queues an ATS scoring run for the student's current resume and returns the job.
+    Older jobs still waiting for this student are dropped, since they would
+    score a resume that has already been replaced.
+    """
+    AtsScoringJob.objects.filter(student=student, job__isnull=True, status='pending').delete()
+    return AtsScoringJob.objects.create(student=student, resume_hash=student.resume_hash)
+
+
+def enqueue_application_scoring(application):
+    """
+    Queues the job-specific match score of a single new application.
+    """
+    return AtsScoringJob.objects.create(
+        student_id=application.student_id, job_id=application.job_id,
+        resume_hash=application.student.resume_hash,
+    )
+
+
+def enqueue_job_rescoring(job):
+    """
+    Queues one batch run that rescores every application to `job` and
+    re-ranks its eligible students' matches, e.g. after its description or
+    required skills were edited or it opened to new students.
+    """
+    AtsScoringJob.objects.filter(job=job, student__isnull=True, status='pending').delete()
+    return AtsScoringJob.objects.create(job=job)
+
+
+def claim_jobs(limit=1):
+    """
+    Atomically moves up to `limit` pending jobs to running and returns them.
+    The conditional update makes it safe to run several workers side by side.
+    """
+    claimed = []
+    candidates = AtsScoringJob.objects.filter(status='pending').order_by('created_at').values_list('pk', flat=True)
+    for job_id in candidates[:limit * 4]:
+        updated = AtsScoringJob.objects.filter(pk=job_id, status='pending').update(
+            status='running', started_at=timezone.now()
+        )
+        if updated:
+            claimed.append(job_id)
+        if len(claimed) >= limit:
+            break
+    return claimed
+
+
+def requeue_stale_jobs(max_age=timedelta(minutes=10)):
+    """
+    Returns jobs left in `running` by a worker that died back to the queue.
+    """
+    cutoff = timezone.now() - max_age
+    return AtsScoringJob.objects.filter(status='running', started_at__lt=cutoff).update(
+        status='pending', started_at=None
+    )
+
+
+def run_scoring_job(job_id):
+    """
+    Extracts (or reuses) the resume text for a claimed job, scores it and
+    writes the result onto `Student.ats_score`, or onto the applications'
+    `match_score` for job-specific runs. Returns the final job status.
+    """
+    from .ats_index import ensure_corpus, score_applications
+    from .ats_utils import ATS_MODEL_VERSION, calculate_ats_score
+    from .resume_store import get_student_resume_text
+
+    job = AtsScoringJob.objects.select_related('student').get(pk=job_id)
+    student = job.student
+    try:
+        if job.job_id:
+            applications = JobApplication.objects.filter(job_id=job.job_id)
+            if student:
+                applications = applications.filter(student=student)
+            count = score_applications(applications)
+            if not student:
+                # The job is new, edited or open to new students; re-rank their matches
+                from .matching import rebuild_job_matches
+                rebuild_job_matches(students=Student.objects.filter(
+                    eligible_jobs__job_id=job.job_id, user__is_active=True,
+                ).exclude(resume=''))
+            job.status = 'done'
+            print(f"ATS Success: match scores for {count} application(s) to job {job.job_id}")
+        elif student.resume_hash != job.resume_hash:
+            # A newer upload has its own job queued; don't overwrite its score
+            job.status = 'failed'
+            job.error = "Superseded by a newer resume upload"
+        elif not needs_ats_scoring(student):
+            # Same bytes already scored by this model version for this branch;
+            # queued because the student's eligible jobs changed
+            from .matching import rebuild_job_matches
+            rebuild_job_matches(students=[student])
+            job.score = student.ats_score
+            job.status = 'done'
+        else:
+            # Raises for a resume over the extraction budgets; the job then
+            # fails with the reason instead of scoring it as blank
+            resume_text = get_student_resume_text(student, strict=True)
+            ensure_corpus()
+            from .departments import branch_code
+            branch = branch_code(student)
+            score = calculate_ats_score(resume_text, branch=branch) if resume_text else 0
+            # update() so a concurrent profile edit isn't clobbered by a stale instance
+            Student.objects.filter(pk=student.pk).update(
+                ats_score=score, ats_scored_hash=job.resume_hash, ats_model_version=ATS_MODEL_VERSION,
+                ats_scored_branch=branch,
+            )
+            from .dashboard_cache import invalidate_student_dashboard
+            invalidate_student_dashboard(student.pk)
+            job.score = score
+            job.status = 'done'
+            print(f"ATS Success ({branch}): {score}% for student {student.pk}")
+
+            # Refresh the student's ranked recommendations and the match
+            # scores of applications already made with the old resume
+            from .matching import rebuild_job_matches
+            rebuild_job_matches(students=[student])
+            score_applications(student.applications.all())
+
+            from .skill_index import index_resume_skills
+            index_resume_skills(student, resume_text)
+    except Exception as e:
+        traceback.print_exc()
+        job.status = 'failed'
+        job.error = str(e)
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'score', 'error', 'finished_at'])
+    return job.status
+
+
+def get_ats_status(student):
+    """
+    Returns the status payload polled by the client after a resume upload.
+    """
+    job = student.ats_jobs.filter(job__isnull=True).order_by('-created_at').first()
+    return {
+        "ats_status": job.status if job else None,
+        "ats_score": student.ats_score,
+        "job_id": job.pk if job else None,
+        "error": job.error if job and job.status == 'failed' else None,
+        "finished_at": job.finished_at if job else None,
+    }
@@ -1,15 +1,58 @@
-import docx
-import spacy
-from pdfminer.high_level import extract_text
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-
-# Load Spacy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except:
-    # Fallback if model not found (though we just installed it)
-    nlp = None
+import functools
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+
+# spaCy, sklearn, pdfminer and python-docx are imported on first use so that
+# manage.py commands, migrations and worker boots don't pay for them.
+
+SPACY_MODEL = "en_core_web_sm"
+
+# Bump whenever a change here alters scores (skills, weights, DEFAULT_JD, ...)
+# so stored ats_score values are recomputed instead of reused.
+ATS_MODEL_VERSION = "2"
+
+# Pipeline components the ATS never reads. The tagger/attribute_ruler (POS),
+# ner (entities) and their tok2vec are all that the scoring stages use.
+SPACY_EXCLUDE = ["parser", "lemmatizer"]
+
+_nlp = None
+_nlp_loaded = False
+_nlp_lock = threading.Lock()
+
+
+def get_nlp():
+    """
+    Returns the shared spaCy pipeline, loading it on first call.
+    Returns None if the model is not installed.
+    """
+    global _nlp, _nlp_loaded
+    if not _nlp_loaded:
+        with _nlp_lock:
+            if not _nlp_loaded:
+                try:
+                    import spacy
+                    _nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+                except Exception as e:
+                    # Fallback if model not found
+                    print(f"ATS Warning: spaCy model {SPACY_MODEL} unavailable: {e}")
+                    _nlp = None
+                _nlp_loaded = True
+    return _nlp
+
+
+def warm_up():
+    """
+    Loads the NLP model, fits the TF-IDF vectorizer and parses and vectorizes
+    the default JDs ahead of time.
+    Call it in a prefork server's master process (e.g. gunicorn --preload
+    with ATS_PRELOAD=1, see placement/wsgi.py) so workers share the loaded
+    model copy-on-write instead of each loading their own.
+    """
+    get_nlp()
+    for jd in DEFAULT_JD.values():
+        get_jd_vector(parse_document(jd).text)
 
 # Branch-wise Skill Database
 BRANCH_SKILLS = {
@@ -132,57 +175,429 @@ def normalize_text(text):
     if not isinstance(text, str):
         text = str(text)
     # Standardize whitespace and remove weird character artifacts
-    import re
     text = re.sub(r'\s+', ' ', text)
     return text.strip().lower()
 
-def extract_resume_text(file):
+class SkillMatcher:
+    """
+    Finds every skill of a list in a single regex pass over normalized text.
+    Skills only match as whole terms, so "c" no longer hits every word with a
+    "c" in it and "java" doesn't match "javascript".
+    """
+
+    # Characters that continue a term ("c" must not match inside "c++" or "c#")
+    _BEFORE = r"(?<![a-z0-9])"
+    _AFTER = r"(?![a-z0-9+#])"
+
+    def __init__(self, skills):
+        self.skills = list(dict.fromkeys(s.strip().lower() for s in skills if s and s.strip()))
+
+        # Accept simple plurals ("operating systems") for word-like skills
+        self.variants = {}
+        for skill in self.skills:
+            if len(skill) >= 4 and skill[-1].isalpha():
+                self.variants.setdefault(skill + "s", skill)
+        for skill in self.skills:
+            self.variants[skill] = skill
+
+        # Longest first, so "mongodb compass" wins over "mongodb" at the same position
+        alternatives = sorted(self.variants, key=len, reverse=True)
+        self.pattern = None
+        if alternatives:
+            # Zero-width lookahead lets matches overlap, still in one scan of the text
+            self.pattern = re.compile(
+                self._BEFORE + "(?=(" + "|".join(re.escape(s) for s in alternatives) + ")" + self._AFTER + ")"
+            )
+
+        # Shorter skills contained in a longer one ("mongodb" in "mongodb compass")
+        # are shadowed at the shared start position, so credit them explicitly.
+        self.implied = {}
+        for skill in self.skills:
+            self.implied[skill] = [
+                other for other in self.skills
+                if other != skill and re.search(self._BEFORE + re.escape(other) + self._AFTER, skill)
+            ]
+
+    def find(self, text):
+        """Returns the skills present in `text`, in skill-list order."""
+        if not self.pattern or not text:
+            return []
+        hits = set()
+        for match in self.pattern.finditer(text):
+            skill = self.variants[match.group(1)]
+            if skill not in hits:
+                hits.add(skill)
+                hits.update(self.implied[skill])
+        return [skill for skill in self.skills if skill in hits]
+
+
+@functools.lru_cache(maxsize=None)
+def get_branch_matcher(branch):
+    """Compiled matcher for a branch's BRANCH_SKILLS list, built once per branch."""
+    return SkillMatcher(BRANCH_SKILLS.get(branch, []))
+
+
+@functools.lru_cache(maxsize=256)
+def get_skill_matcher(skills):
+    """Compiled matcher for an ad-hoc skill list (a tuple), e.g. a job's skills."""
+    return SkillMatcher(skills)
+
+
+def parse_skill_list(text):
+    """Splits a free-text skills field ("Python, SQL; Git") into normalized skills."""
+    if not text:
+        return []
+    skills = [normalize_text(s) for s in re.split(r"[,;\n]", text)]
+    return list(dict.fromkeys(s for s in skills if s))
+
+
+# Parts of speech counted as meaningful terms in the term-overlap stage
+TERM_POS = ("NOUN", "PROPN", "ADJ")
+
+# Number of parsed documents kept in memory (resumes plus JDs)
+PARSE_CACHE_SIZE = 256
+
+
+class ParsedDocument:
+    """
+    A normalized text run through spaCy once. Only the features the ATS
+    stages need are kept, so cached entries don't pin whole Doc objects.
+    """
+
+    def __init__(self, text, doc=None):
+        self.text = text
+        self.terms = set()
+        self.entities = []
+        if doc is not None:
+            # Filter for nouns and adjectives to catch meaningful terms
+            self.terms = set(token.text for token in doc if token.pos_ in TERM_POS and not token.is_stop)
+            for ent in doc.ents:
+                # Add if it looks like a tech term (very basic heuristic)
+                if ent.label_ in ["ORG", "PRODUCT"] and len(ent.text) < 20:
+                    self.entities.append(ent.text.lower())
+        self.sections = check_resume_sections(text)
+
+
+_parse_cache = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _text_key(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def parse_document(text):
+    """
+    Returns the ParsedDocument for `text`, parsing it with spaCy only on a
+    cache miss. Repeated texts such as DEFAULT_JD[branch] are parsed once.
+    """
+    text = normalize_text(text)
+    key = _text_key(text)
+    with _parse_cache_lock:
+        parsed = _parse_cache.get(key)
+        if parsed is not None:
+            _parse_cache.move_to_end(key)
+            return parsed
+
+    nlp = get_nlp()
+    parsed = ParsedDocument(text, nlp(text) if nlp else None)
+
+    with _parse_cache_lock:
+        _parse_cache[key] = parsed
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+def forget_document(text):
+    """Drops a text's parsed document from the cache."""
+    with _parse_cache_lock:
+        _parse_cache.pop(_text_key(normalize_text(text)), None)
+
+
+def parse_documents(texts, batch_size=64):
+    """
+    Parses many texts at once with nlp.pipe. Cached documents are reused,
+    but new ones are not added to the cache: a batch of one-off resumes
+    would otherwise flush the JD entries that are worth keeping.
+    """
+    texts = [normalize_text(text) for text in texts]
+    results = [None] * len(texts)
+    missing = []
+    with _parse_cache_lock:
+        for i, text in enumerate(texts):
+            parsed = _parse_cache.get(_text_key(text))
+            if parsed is None:
+                missing.append(i)
+            else:
+                results[i] = parsed
+
+    nlp = get_nlp()
+    missing_texts = [texts[i] for i in missing]
+    docs = nlp.pipe(missing_texts, batch_size=batch_size) if nlp else [None] * len(missing_texts)
+    for i, doc in zip(missing, docs):
+        results[i] = ParsedDocument(texts[i], doc)
+    return results
+
+# Number of JD vectors kept in memory
+JD_VECTOR_CACHE_SIZE = 1024
+
+# One TF-IDF vectorizer fitted over the whole JD corpus (DEFAULT_JD plus every
+# Job text, see accounts/ats_index.py) and the transformed JD vectors. Each
+# fit bumps the generation; cached vectors carry the generation they were
+# transformed with, so one from an older vocabulary is never reused.
+_tfidf_vectorizer = None
+_tfidf_generation = 0
+_jd_vectors = OrderedDict()
+_tfidf_lock = threading.Lock()
+
+
+def fit_tfidf_corpus(documents=()):
+    """
+    Fits the shared TF-IDF vectorizer over DEFAULT_JD and `documents` and
+    drops every cached JD vector, since they belong to the old vocabulary.
+    """
+    global _tfidf_vectorizer, _tfidf_generation
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    corpus = [normalize_text(jd) for jd in DEFAULT_JD.values()]
+    corpus += [normalize_text(doc) for doc in documents if doc]
+    vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
+    vectorizer.fit(corpus)
+
+    with _tfidf_lock:
+        _tfidf_vectorizer = vectorizer
+        _tfidf_generation += 1
+        _jd_vectors.clear()
+    return vectorizer
+
+
+def get_fitted_vectorizer():
+    """
+    (vectorizer, generation) of the shared fit, read together so resumes and
+    JDs compared with each other are transformed with the same vocabulary.
+    """
+    with _tfidf_lock:
+        if _tfidf_vectorizer is not None:
+            return _tfidf_vectorizer, _tfidf_generation
+    fit_tfidf_corpus()
+    return get_fitted_vectorizer()
+
+
+def get_tfidf_vectorizer():
+    """Returns the shared vectorizer, fitting it on DEFAULT_JD alone if nothing else has."""
+    return get_fitted_vectorizer()[0]
+
+
+def get_jd_vector(job_description, key=None, fitted=None):
+    """
+    Returns the TF-IDF vector of a normalized JD. `key` names the JD (e.g.
+    "job:12") so it can be invalidated; the text hash is used otherwise.
+    `fitted` is a get_fitted_vectorizer() pair to transform with, the
+    current fit by default.
+    """
+    key = key or _text_key(job_description)
+    vectorizer, generation = fitted or get_fitted_vectorizer()
+    with _tfidf_lock:
+        entry = _jd_vectors.get(key)
+        if entry is not None and entry[0] == generation:
+            _jd_vectors.move_to_end(key)
+            return entry[1]
+
+    vector = vectorizer.transform([job_description])
+
+    with _tfidf_lock:
+        # A refit while transforming leaves this vector on the old vocabulary
+        if generation == _tfidf_generation:
+            _jd_vectors[key] = (generation, vector)
+            while len(_jd_vectors) > JD_VECTOR_CACHE_SIZE:
+                _jd_vectors.popitem(last=False)
+    return vector
+
+
+def forget_jd_vector(key):
+    """Drops a cached JD vector, e.g. after the job's text was edited."""
+    with _tfidf_lock:
+        _jd_vectors.pop(key, None)
+
+
+def tfidf_similarity(resume_text, job_description, jd_key=None):
+    """
+    Cosine similarity (0-100) between a normalized resume and JD: one sparse
+    transform of the resume and one dot product against the cached JD vector.
+    """
+    fitted = get_fitted_vectorizer()
+    jd_vector = get_jd_vector(job_description, jd_key, fitted)
+    resume_vector = fitted[0].transform([resume_text])
+    # TfidfVectorizer rows are L2-normalized, so the dot product is the cosine
+    return resume_vector.dot(jd_vector.T)[0, 0] * 100
+
+# Extraction budgets. Anything past them is not a resume worth parsing in
+# full; portfolios are cut off instead of costing as much as 100 resumes.
+RESUME_MAX_PAGES = 6
+RESUME_MAX_BYTES = 8 * 1024 * 1024
+RESUME_MAX_CHARS = 30000
+
+# boxes_flow=None skips pdfminer's text box grouping, by far the most
+# expensive layout step and unneeded since only the text is kept.
+PDF_LAPARAMS = {
+    "line_margin": 0.5,
+    "char_margin": 2.0,
+    "word_margin": 0.1,
+    "boxes_flow": None,
+    "detect_vertical": False,
+    "all_texts": False,
+}
+
+
+class ExtractionResult:
+    """
+    Text pulled out of a resume file along with what the extraction cost.
+    """
+
+    def __init__(self, text="", pages=0, elapsed_ms=0, truncated=False, error=""):
+        self.text = text
+        self.pages = pages
+        self.elapsed_ms = elapsed_ms
+        self.truncated = truncated
+        # Why nothing was extracted (budget refused, unreadable file); "" otherwise
+        self.error = error
+
+
+def _heal_spacing(text):
+    # If extraction is weirdly formatted (extra spaces between chars), try to heal it
+    if text and len(text) > 10:
+        # Check for excessive spacing (e.g., "P y t h o n")
+        cleaned = re.sub(r'(\w)\s(?=\w)', r'\1', text)
+        if len(cleaned) < len(text) * 0.7: # Only if significant reduction
+            return cleaned
+    return text
+
+
+def _file_size(file):
+    size = getattr(file, 'size', None)
+    if size is None and hasattr(file, 'seek') and hasattr(file, 'tell'):
+        file.seek(0, 2)
+        size = file.tell()
+        file.seek(0)
+    return size
+
+
+def iter_pdf_pages(file, max_pages=RESUME_MAX_PAGES):
+    """
+    Yields the text of each PDF page in turn, at most max_pages of them, then
+    None if the document has pages left. Pages are parsed lazily and not
+    cached, so only the current page's objects are held in memory.
+    """
+    import io
+    from pdfminer.converter import TextConverter
+    from pdfminer.layout import LAParams
+    from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+    from pdfminer.pdfpage import PDFPage
+
+    resources = PDFResourceManager(caching=True)
+    out = io.StringIO()
+    device = TextConverter(resources, out, laparams=LAParams(**PDF_LAPARAMS))
+    interpreter = PDFPageInterpreter(resources, device)
+    try:
+        for number, page in enumerate(PDFPage.get_pages(file, caching=False)):
+            if max_pages and number >= max_pages:
+                # Looked up in the page tree only, never laid out
+                yield None
+                return
+            interpreter.process_page(page)
+            yield out.getvalue()
+            out.seek(0)
+            out.truncate(0)
+    finally:
+        device.close()
+
+
+def extract_resume(file, max_pages=RESUME_MAX_PAGES, max_bytes=RESUME_MAX_BYTES,
+                   max_chars=RESUME_MAX_CHARS, streaming=True):
+    """
+    Extracts resume text within the page/byte/character budgets and returns
+    an ExtractionResult. PDFs are read page by page straight from the upload
+    and stop at the first exhausted budget; streaming=False keeps the old
+    whole-document pdfminer path for comparison.
+    """
+    import time
+    started = time.perf_counter()
+    result = ExtractionResult()
+    filename = getattr(file, 'name', 'resume.pdf').lower()
     try:
         # Ensure we are at the start of the file if it's a file-like object
         if hasattr(file, 'seek'):
             file.seek(0)
-            
+
+        size = _file_size(file)
+        if max_bytes and size is not None and size > max_bytes:
+            result.error = f"Resume is {size} bytes, over the {max_bytes} byte budget"
+            print(f"ATS Warning: {filename}: {result.error}")
+            return result
+
         text = ""
-        filename = getattr(file, 'name', 'resume.pdf').lower()
-        
-        if filename.endswith(".pdf"):
+        if filename.endswith(".pdf") and streaming:
+            parts = []
+            length = 0
+            for page_text in iter_pdf_pages(file, max_pages):
+                if page_text is None:
+                    # Pages left past max_pages
+                    result.truncated = True
+                    break
+                page_text = _heal_spacing(page_text)
+                parts.append(page_text)
+                length += len(page_text)
+                result.pages += 1
+                if max_chars and length >= max_chars:
+                    result.truncated = True
+                    break
+            text = "".join(parts)
+        elif filename.endswith(".pdf"):
             import io
+            from pdfminer.high_level import extract_text
             # For some file-like objects, pdfminer needs a stream
             if hasattr(file, 'read'):
                 stream = io.BytesIO(file.read())
                 text = extract_text(stream)
             else:
                 text = extract_text(file)
+            text = _heal_spacing(text)
         elif filename.endswith(".docx"):
+            import docx
             doc = docx.Document(file)
-            text = "\n".join([p.text for p in doc.paragraphs])
+            text = _heal_spacing("\n".join([p.text for p in doc.paragraphs]))
         elif filename.endswith(".txt"):
             if hasattr(file, 'read'):
-                content = file.read()
+                content = file.read(max_bytes) if max_bytes else file.read()
                 if isinstance(content, bytes):
                     text = content.decode('utf-8', errors='ignore')
                 else:
                     text = content
-            
-        # If extraction is weirdly formatted (extra spaces between chars), try to heal it
-        if text and len(text) > 10:
-            import re
-            # Check for excessive spacing (e.g., "P y t h o n")
-            cleaned = re.sub(r'(\w)\s(?=\w)', r'\1', text)
-            if len(cleaned) < len(text) * 0.7: # Only if significant reduction
-                 text = cleaned
-                 
+            text = _heal_spacing(text)
+
+        if max_chars and len(text) > max_chars:
+            text = text[:max_chars]
+            result.truncated = True
+        result.text = text
+
         if not text:
              print(f"ATS Warning: No text extracted from {filename}")
-                 
-        return text
     except Exception as e:
         import traceback
         print(f"Extraction error for {getattr(file, 'name', 'unknown')}: {e}")
         traceback.print_exc()
-    return ""
+        result.text = ""
+        result.error = f"Could not read {filename}: {e}"
+    finally:
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000)
+    return result
+
 
-def calculate_ats_score(resume_text, job_description=None, branch="CT"):
+def extract_resume_text(file, streaming=True):
+    return extract_resume(file, streaming=streaming).text
+
+def calculate_ats_score(resume_text, job_description=None, branch="CT", jd_key=None, resume_doc=None):
     if not resume_text or len(resume_text.strip()) < 20:
         print("ATS Debug: Resume text too short or empty, returning 0.0 score.")
         return 0.0
@@ -200,12 +615,15 @@ def calculate_ats_score(resume_text, job_description=None, branch="CT"):
         else:
              job_description = DEFAULT_JD.get(branch, DEFAULT_JD["CT"])
 
-    resume_text = normalize_text(resume_text)
-    job_description = normalize_text(job_description)
+    # Each text is normalized and parsed once, then shared by every stage below
+    res_doc = resume_doc or parse_document(resume_text)
+    jd_doc = parse_document(job_description)
+    resume_text = res_doc.text
+    job_description = jd_doc.text
 
     # 1. Skill Match Score (50% Weight) - Critical for technical roles
-    res_skills = set(extract_skills(resume_text, branch))
-    jd_skills = set(extract_skills(job_description, branch))
+    res_skills = set(extract_skills(resume_text, branch, parsed=res_doc))
+    jd_skills = set(extract_skills(job_description, branch, parsed=jd_doc))
     
     print(f"ATS Debug ({branch}): Resume skills found: {res_skills}")
     print(f"ATS Debug ({branch}): Job skills found: {jd_skills}")
@@ -220,24 +638,13 @@ def calculate_ats_score(resume_text, job_description=None, branch="CT"):
 
     # 2. Key Term Overlap (Spacy) (30% Weight)
     spacy_score = 0
-    if nlp:
-        res_doc = nlp(resume_text)
-        jd_doc = nlp(job_description)
-        
-        # Filter for nouns and adjectives to catch meaningful terms
-        res_tokens = set([token.text for token in res_doc if token.pos_ in ["NOUN", "PROPN", "ADJ"] and not token.is_stop])
-        jd_tokens = set([token.text for token in jd_doc if token.pos_ in ["NOUN", "PROPN", "ADJ"] and not token.is_stop])
-        
-        if jd_tokens:
-            common = res_tokens.intersection(jd_tokens)
-            spacy_score = (len(common) / len(jd_tokens)) * 100
+    if jd_doc.terms:
+        common = res_doc.terms.intersection(jd_doc.terms)
+        spacy_score = (len(common) / len(jd_doc.terms)) * 100
     
     # 3. Content Similarity (TF-IDF) (20% Weight)
-    docs = [resume_text, job_description]
     try:
-        vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-        tfidf = vectorizer.fit_transform(docs)
-        similarity = cosine_similarity(tfidf[0:1], tfidf[1:2])[0][0] * 100
+        similarity = tfidf_similarity(resume_text, job_description, jd_key)
     except:
         similarity = spacy_score # Fallback
 
@@ -245,7 +652,7 @@ def calculate_ats_score(resume_text, job_description=None, branch="CT"):
     base_score = (skill_match_score * 0.5) + (spacy_score * 0.3) + (similarity * 0.2)
     
     # 4. Section Presence (Bonus/Penalty)
-    present, missing = check_resume_sections(resume_text)
+    present, missing = res_doc.sections
     # Penalty: only -2% per missing section, capped at 10%
     section_penalty = min(len(missing) * 2, 10)
     
@@ -263,41 +670,41 @@ def calculate_ats_score(resume_text, job_description=None, branch="CT"):
 
     return max(0, min(100, round(final_result, 2)))
 
-def extract_skills(text, branch="CT"):
-    text = normalize_text(text)
+def score_resumes(resumes, batch_size=64, job_description=None, jd_key=None):
+    """
+    Scores a batch of (resume_text, branch) pairs against `job_description`,
+    or their branch's DEFAULT_JD, parsing all resumes through nlp.pipe
+    instead of one by one.
+    """
+    parsed = parse_documents([text or "" for text, _ in resumes], batch_size=batch_size)
+    return [
+        calculate_ats_score(text, job_description, branch=branch, jd_key=jd_key, resume_doc=doc)
+        for (text, branch), doc in zip(resumes, parsed)
+    ]
+
+def extract_skills(text, branch="CT", parsed=None):
+    if parsed is None:
+        parsed = parse_document(text)
+    text = parsed.text
     branch = get_branch_code(branch)
     
-    skills_db = BRANCH_SKILLS.get(branch, [])
-    found = []
-    
-    # Simple keyword match
-    for skill in skills_db:
-        if skill in text:
-            found.append(skill)
+    # Keyword match, all branch skills in one pass
+    found = get_branch_matcher(branch).find(text)
             
     # Spacy entity extraction for potentially new skills (always helpful)
-    if nlp:
-        doc = nlp(text)
-        for ent in doc.ents:
-            if ent.label_ in ["ORG", "PRODUCT"] and ent.text.lower() not in found:
-                # Add if it looks like a tech term (very basic heuristic)
-                if len(ent.text) < 20:
-                    found.append(ent.text.lower())
+    for entity in parsed.entities:
+        if entity not in found:
+            found.append(entity)
 
     return list(set(found))
 
 def find_missing_skills(resume_skills, job_description, branch="CT"):
-    job_description = job_description.lower()
+    job_description = normalize_text(job_description)
     
     if branch not in BRANCH_SKILLS:
         branch = "CT"
         
-    skills_db = BRANCH_SKILLS.get(branch, [])
-    required = []
-
-    for skill in skills_db:
-        if skill in job_description:
-            required.append(skill)
+    required = get_branch_matcher(branch).find(job_description)
 
     missing = []
     for skill in required:
@@ -317,14 +724,9 @@ def check_resume_sections(text):
     return present, missing
 
 def get_missing_skills(resume_text, job):
-    resume_words = resume_text.lower()
-    required_skills = job.skills_required.lower().split(",")
-    missing = []
-    for skill in required_skills:
-        skill_clean = skill.strip()
-        if skill_clean and skill_clean not in resume_words:
-            missing.append(skill_clean)
-    return missing
+    required_skills = parse_skill_list(job.skills_required)
+    present = set(get_skill_matcher(tuple(required_skills)).find(normalize_text(resume_text)))
+    return [skill for skill in required_skills if skill not in present]
 
 def check_sections(resume_text):
     text_lower = resume_text.lower()
@@ -373,24 +775,9 @@ def generate_recommendations(student, resume_text, job):
     return suggestions
 
 def ai_recommendation(resume_text):
-    try:
-        import os
-        from huggingface_hub import InferenceClient
-        hf_key = os.environ.get("HUGGINGFACE_API_KEY", "")
-        # Dummy AI suggestion if no keys
-        prompt = f"Analyze this resume and suggest improvements to make it ATS friendly:\n\n{resume_text[:2000]}"
-        if hf_key:
-            client = InferenceClient(api_key=hf_key)
-            response = client.text_generation(
-                model="google/flan-t5-large",
-                inputs=prompt
-            )
-            return response
-        else:
-            return "Make sure to improve resume summary, add measurable achievements, and use bullet points for clarity."
-    except Exception as e:
-        print(f"AI Recommendation Error: {e}")
-        return "Ensure clear formatting, quantifiable achievements, and concise bullet points."
+    # Blocking, deadline-bounded call; web views use request_ai_suggestions instead
+    from .ai_suggestions import get_ai_suggestions
+    return get_ai_suggestions(resume_text)
 
 def final_recommendation(student, resume_text, job):
     rule_based = generate_recommendations(student, resume_text, job)
@@ -0,0 +1,87 @@
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import caches
+
+JOBS_VERSION_KEY = "dashboard:jobs_version"
+
+# Hit/miss counters of this process. Keeping them off the cache spares every
+# request a write; the stats endpoint reports the process that serves it.
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def _cache():
+    # A shared backend (settings.SHARED_CACHE_URL): the ATS worker and the
+    # management commands invalidate entries the web processes read
+    return caches['dashboard']
+
+
+def _new_jobs_version():
+    # A timestamp rather than a counter, so a culled version key can never
+    # come back as a value some stale entry was stored under
+    _cache().add(JOBS_VERSION_KEY, time.time_ns(), None)
+    return _cache().get(JOBS_VERSION_KEY)
+
+
+def dashboard_key(student_id):
+    return f"dashboard:{student_id}"
+
+
+def _count(outcome):
+    with _stats_lock:
+        _stats[outcome] += 1
+
+
+def get_cached_dashboard(student_id):
+    """
+    Returns (payload, jobs version) for a student; the payload is None on a
+    miss. Entries are stored with the jobs version they were built under, so
+    the entry and the version come back in one round trip.
+    """
+    key = dashboard_key(student_id)
+    values = _cache().get_many([key, JOBS_VERSION_KEY])
+    entry, version = values.get(key), values.get(JOBS_VERSION_KEY)
+    if version is None:
+        version = _new_jobs_version()
+    data = entry[1] if entry is not None and entry[0] == version else None
+    _count('hits' if data is not None else 'misses')
+    return data, version
+
+
+def cache_dashboard(student_id, data, version):
+    """
+    Stores a payload under the jobs version read before it was assembled,
+    so a job edited in the meantime leaves it stale rather than current.
+    """
+    # A payload still waiting on AI suggestions would freeze them as pending
+    recommendations = data.get("recommendations") or {}
+    if recommendations.get("ai_status") == 'pending':
+        return
+    _cache().set(dashboard_key(student_id), (version, data))
+
+
+def invalidate_student_dashboard(student_id):
+    _cache().delete(dashboard_key(student_id))
+
+
+def invalidate_student_dashboards(student_ids):
+    """invalidate_student_dashboard for many students in one round trip."""
+    _cache().delete_many([dashboard_key(student_id) for student_id in student_ids])
+
+
+def invalidate_all_dashboards():
+    """Every dashboard lists jobs, so any job change moves all keys at once."""
+    _cache().set(JOBS_VERSION_KEY, time.time_ns(), None)
+
+
+def get_dashboard_cache_stats():
+    with _stats_lock:
+        hits, misses = _stats['hits'], _stats['misses']
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / total, 3) if total else None,
+    }
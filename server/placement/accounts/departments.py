@@ -0,0 +1,113 @@
+import re
+
+from django.db.models import Q
+
+# allowed_departments values that open a job to every department
+ALL_DEPARTMENTS = ("all", "all departments", "all branches", "any")
+
+
+def _label(text):
+    return re.sub(r'\s+', ' ', text or '').strip().lower()
+
+
+def build_alias_table(rows):
+    """{label: department id} from (id, code, name, aliases) rows."""
+    table = {}
+    for pk, code, name, aliases in rows:
+        for label in [code, name] + (aliases or '').split(','):
+            label = _label(label)
+            if label:
+                table.setdefault(label, pk)
+    return table
+
+
+def match_department(text, table):
+    """Department id for a free-text department label, or None."""
+    label = _label(text)
+    if not label:
+        return None
+    if label in table:
+        return table[label]
+    # Longest alias appearing as whole words, e.g. "Dept. of Electronics"
+    for alias in sorted(table, key=len, reverse=True):
+        if len(alias) > 3 and re.search(rf'(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])', label):
+            return table[alias]
+    return None
+
+
+def match_departments(text, table):
+    """Department ids for a comma separated list such as Job.allowed_departments."""
+    ids = []
+    for part in re.split(r'[,;/\n]', text or ''):
+        if _label(part) in ALL_DEPARTMENTS:
+            return sorted(set(table.values()))
+        pk = match_department(part, table)
+        if pk and pk not in ids:
+            ids.append(pk)
+    return ids
+
+
+# Per-process lookup tables; cleared by the Department signals in accounts.signals
+_tables = {}
+
+
+def _get_tables():
+    if not _tables.get('codes'):
+        from .models import Department
+        rows = list(Department.objects.values_list('id', 'code', 'name', 'aliases'))
+        _tables['aliases'] = build_alias_table(rows)
+        _tables['codes'] = {pk: code for pk, code, _, _ in rows}
+    return _tables
+
+
+def clear_department_cache():
+    _tables.clear()
+
+
+def resolve_department(text):
+    return match_department(text, _get_tables()['aliases'])
+
+
+def resolve_departments(text):
+    return match_departments(text, _get_tables()['aliases'])
+
+
+def branch_code(obj):
+    """
+    ATS branch key of a Student (or anything with branch_id/department)
+    without a query: the Department code when resolved, else the raw
+    department text. The scorer maps free text onto a BRANCH_SKILLS code
+    through get_branch_code; the text is kept as is here so that
+    exclude_current_scores can derive the same key in SQL.
+    """
+    code = _get_tables()['codes'].get(obj.branch_id)
+    return code or obj.department or "CT"
+
+
+def department_q(department, branch_id):
+    """
+    Rows in the same department: an indexed FK equality when the department
+    is resolved, else the old case-insensitive text match.
+    """
+    if branch_id:
+        return Q(branch_id=branch_id)
+    return Q(department__iexact=department or '')
+
+
+def department_param_q(value):
+    """department_q for a department given as a query parameter."""
+    return department_q(value, resolve_department(value))
+
+
+def interview_department_q(department, branch_id):
+    """Interviews for a department, through Interview.branches when resolved."""
+    if branch_id:
+        return Q(branches=branch_id)
+    return Q(department__icontains=department or '')
+
+
+def job_department_q(department, branch_id):
+    """Jobs open to a department, through the indexed Job.branches join when resolved."""
+    if branch_id:
+        return Q(branches=branch_id)
+    return Q(allowed_departments__icontains=department or '')
@@ -0,0 +1,79 @@
+import calendar
+import hashlib
+import json
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+from .departments import interview_department_q
+from .models import Interview, Job
+
+MAX_WINDOW_DAYS = 366
+
+
+def parse_window(month=None, start=None, end=None):
+    """
+    [start, end) datetimes for ?month=YYYY-MM or ?start=YYYY-MM-DD&end=YYYY-MM-DD
+    (end inclusive), defaulting to the current month. Raises ValueError.
+    """
+    if month:
+        try:
+            first = datetime.strptime(month, '%Y-%m').date()
+        except ValueError:
+            raise ValueError("month must look like 2026-11")
+        last = first.replace(day=calendar.monthrange(first.year, first.month)[1])
+    elif start or end:
+        if not (start and end):
+            raise ValueError("start and end are both required")
+        first, last = date.fromisoformat(start), date.fromisoformat(end)
+        if last < first:
+            raise ValueError("end is before start")
+        if (last - first).days > MAX_WINDOW_DAYS:
+            raise ValueError(f"ranges are limited to {MAX_WINDOW_DAYS} days")
+    else:
+        first = timezone.localdate().replace(day=1)
+        last = first.replace(day=calendar.monthrange(first.year, first.month)[1])
+
+    tz = timezone.get_current_timezone()
+    try:
+        # The day after December 9999 is past date.max
+        after = last + timedelta(days=1)
+    except OverflowError:
+        raise ValueError("dates must be before 9999-12-31")
+    return datetime.combine(first, time.min, tzinfo=tz), datetime.combine(after, time.min, tzinfo=tz)
+
+
+def _entry(kind, pk, company, role, when):
+    when = timezone.localtime(when)
+    return {
+        "id": pk,
+        "type": kind,
+        "date": when.strftime('%Y-%m-%d'),
+        "time": when.strftime('%H:%M'),
+        "company": company,
+        "role": role or "",
+    }
+
+
+def calendar_entries(start, end, student=None):
+    """
+    Drive deadlines and interviews in [start, end), by date. Both come from
+    index range scans (accounts_job_deadline_idx, accounts_interview_date_idx)
+    reading only the columns shown. With a student, interviews are limited
+    to their department.
+    """
+    drives = Job.objects.filter(deadline__gte=start, deadline__lt=end).values_list('id', 'company', 'role', 'deadline')
+    interviews = Interview.objects.filter(date_time__gte=start, date_time__lt=end)
+    if student is not None:
+        interviews = interviews.filter(interview_department_q(student.department, student.branch_id))
+    interviews = interviews.values_list('id', 'company', 'role', 'date_time')
+
+    entries = [_entry('drive', *row) for row in drives] + [_entry('interview', *row) for row in interviews]
+    entries.sort(key=lambda e: (e['date'], e['time'], e['type'], e['id']))
+    return entries
+
+
+def calendar_etag(entries):
+    """Strong ETag over the entries, so unchanged windows revalidate with a 304."""
+    digest = hashlib.md5(json.dumps(entries, sort_keys=True).encode()).hexdigest()
+    return f'"{digest}"'
@@ -0,0 +1,122 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Job, JobEligibility, JobMatch, Student
+
+
+def _department_allowed(student, branch_ids, allowed_departments):
+    # Job.branches when the student's department is resolved, else the old text match
+    if student.branch_id:
+        return student.branch_id in branch_ids
+    department = (student.department or "").lower()
+    return bool(department) and department in (allowed_departments or "").lower()
+
+
+def check_eligibility(student, job):
+    """
+    The single eligibility rule shared by the materialized rows and
+    JobApplicationView. Returns (eligible, reason).
+    """
+    if student.is_blacklisted:
+        return False, "You have been blacklisted and cannot apply for jobs."
+    if job.deadline < timezone.now():
+        return False, "The application deadline for this job has passed"
+    if student.overall_cgpa < job.min_cgpa or student.total_backlogs > job.max_backlogs:
+        return False, "You are not eligible for this job"
+    branch_ids = {b.pk for b in job.branches.all()}
+    if not _department_allowed(student, branch_ids, job.allowed_departments):
+        return False, "This job is not open to your department"
+    return True, None
+
+
+def _replace_rows(existing, wanted, make_row, delete_filter):
+    """
+    Makes the rows exactly `wanted`. Matches for pairs that are no longer
+    eligible go too; returns the keys that were added.
+    """
+    stale = [key for key in existing if key not in wanted]
+    if stale:
+        JobEligibility.objects.filter(**delete_filter(stale)).delete()
+        JobMatch.objects.filter(**delete_filter(stale)).delete()
+    added = [key for key in wanted if key not in existing]
+    JobEligibility.objects.bulk_create([make_row(key) for key in added], ignore_conflicts=True)
+    return added
+
+
+def refresh_job_eligibility(job):
+    """
+    Recomputes the eligibility rows of one job, e.g. after it was saved.
+    CGPA, backlogs and blacklist are filtered in SQL; only the department
+    check runs in Python. Newly eligible students get their matches rebuilt
+    by the ATS worker.
+    """
+    branch_ids = set(job.branches.values_list('id', flat=True))
+    if job.deadline < timezone.now():
+        candidates = Student.objects.none()
+    else:
+        candidates = Student.objects.filter(
+            is_blacklisted=False,
+            overall_cgpa__gte=job.min_cgpa,
+            total_backlogs__lte=job.max_backlogs,
+        ).only('id', 'department', 'branch')
+    wanted = {s.pk for s in candidates if _department_allowed(s, branch_ids, job.allowed_departments)}
+
+    with transaction.atomic():
+        existing = set(JobEligibility.objects.filter(job=job).values_list('student_id', flat=True))
+        added = _replace_rows(
+            existing, wanted,
+            lambda student_id: JobEligibility(student_id=student_id, job=job, deadline=job.deadline),
+            lambda stale: {'job': job, 'student_id__in': stale},
+        )
+        JobEligibility.objects.filter(job=job).exclude(deadline=job.deadline).update(deadline=job.deadline)
+    if added:
+        from .ats_queue import enqueue_job_rescoring
+        enqueue_job_rescoring(job)
+    return len(wanted)
+
+
+def refresh_student_eligibility(student):
+    """
+    Recomputes the eligibility rows of one student, e.g. after their CGPA,
+    backlogs, blacklist status or department changed. Newly eligible jobs
+    reach their matches through a queued ATS run.
+    """
+    wanted = {}
+    if not student.is_blacklisted:
+        jobs = Job.objects.filter(
+            deadline__gte=timezone.now(),
+            min_cgpa__lte=student.overall_cgpa,
+            max_backlogs__gte=student.total_backlogs,
+        ).only('id', 'allowed_departments', 'deadline').prefetch_related('branches')
+        for job in jobs:
+            if _department_allowed(student, {b.pk for b in job.branches.all()}, job.allowed_departments):
+                wanted[job.pk] = job.deadline
+
+    with transaction.atomic():
+        existing = set(JobEligibility.objects.filter(student=student).values_list('job_id', flat=True))
+        added = _replace_rows(
+            existing, wanted,
+            lambda job_id: JobEligibility(student=student, job_id=job_id, deadline=wanted[job_id]),
+            lambda stale: {'student': student, 'job_id__in': stale},
+        )
+    if added and student.resume:
+        from .ats_queue import enqueue_ats_scoring
+        enqueue_ats_scoring(student)
+    return len(wanted)
+
+
+def rebuild_eligibility():
+    """Recomputes every row, one open job at a time. Returns the row count."""
+    total = 0
+    for job in Job.objects.filter(deadline__gte=timezone.now()):
+        total += refresh_job_eligibility(job)
+    JobEligibility.objects.filter(deadline__lt=timezone.now()).delete()
+    return total
+
+
+def eligible_jobs_for(student):
+    """Open jobs the student may apply to, newest first; one indexed query."""
+    return Job.objects.filter(
+        eligible_students__student=student,
+        eligible_students__deadline__gte=timezone.now(),
+    ).order_by('-posted_on')
@@ -0,0 +1,148 @@
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Job
+
+# External content FTS5 index over accounts_job, created by migration 0025
+# and kept in sync by triggers so bulk updates and raw SQL writes are
+# covered too
+FTS_TABLE = 'accounts_job_fts'
+# bm25() column weights: company, role, description, skills_required
+FTS_WEIGHTS = (4.0, 5.0, 1.0, 3.0)
+SEARCH_FIELDS = ('company', 'role', 'description', 'skills_required')
+MAX_TERMS = 8
+
+# The triggers of migration 0025. SQLite drops them whenever a migration
+# rebuilds accounts_job (e.g. an AlterField), so the post_migrate hook in
+# accounts.signals recreates them from this copy
+TRIGGERS = {
+    f'{FTS_TABLE}_ai': f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON accounts_job BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, company, role, description, skills_required)
+        VALUES (new.id, new.company, new.role, new.description, new.skills_required);
+    END
+    """,
+    f'{FTS_TABLE}_ad': f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON accounts_job BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, company, role, description, skills_required)
+        VALUES ('delete', old.id, old.company, old.role, old.description, old.skills_required);
+    END
+    """,
+    f'{FTS_TABLE}_au': f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF company, role, description, skills_required ON accounts_job BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, company, role, description, skills_required)
+        VALUES ('delete', old.id, old.company, old.role, old.description, old.skills_required);
+        INSERT INTO {FTS_TABLE}(rowid, company, role, description, skills_required)
+        VALUES (new.id, new.company, new.role, new.description, new.skills_required);
+    END
+    """,
+}
+
+
+def _has_fts_table(cursor):
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+    return cursor.fetchone() is not None
+
+
+def ensure_job_search_triggers(db_connection):
+    """
+    Recreates any sync trigger a table rebuild dropped, then re-reads the
+    jobs, since writes made without the triggers never reached the index.
+    Returns the names of the recreated triggers.
+    """
+    if db_connection.vendor != 'sqlite':
+        return []
+    with db_connection.cursor() as cursor:
+        if not _has_fts_table(cursor):
+            return []
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'accounts_job'"
+        )
+        missing = sorted(set(TRIGGERS) - {name for (name,) in cursor.fetchall()})
+        for name in missing:
+            cursor.execute(TRIGGERS[name])
+        if missing:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return missing
+
+
+_state = {}
+
+
+def fts_available():
+    """True when the database has the FTS5 job index (SQLite with FTS5)."""
+    if 'fts' not in _state:
+        available = False
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                available = _has_fts_table(cursor)
+        _state['fts'] = available
+    return _state['fts']
+
+
+def search_terms(query):
+    """Lowercased word tokens of a search box query, at most MAX_TERMS."""
+    return re.findall(r'\w+', (query or '').lower())[:MAX_TERMS]
+
+
+def match_expression(terms):
+    # Every term must match, each as a prefix: "pyth" finds "python"
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def _ranked_ids(terms, jobs, limit):
+    ids_sql, ids_params = jobs.values('id').query.sql_with_params()
+    weights = ', '.join(str(w) for w in FTS_WEIGHTS)
+    sql = (
+        f"SELECT rowid, bm25({FTS_TABLE}, {weights}) AS score FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH %s AND rowid IN ({ids_sql}) ORDER BY score LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [match_expression(terms), *ids_params, limit])
+        # bm25() is lower-is-better; flip it so higher scores rank first
+        return [(job_id, round(-score, 4)) for job_id, score in cursor.fetchall()]
+
+
+def search_jobs(query, student=None, limit=20):
+    """
+    Open jobs matching every term of `query` by company, role, description
+    or skills, best match first, as (job, score) pairs. With a student, only
+    jobs they are eligible for (JobEligibility) are searched.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return []
+
+    jobs = Job.objects.filter(deadline__gte=timezone.now())
+    if student is not None:
+        jobs = jobs.filter(eligible_students__student=student)
+
+    if fts_available():
+        ranked = _ranked_ids(terms, jobs, limit)
+        found = Job.objects.prefetch_related('branches').in_bulk([job_id for job_id, _ in ranked])
+        return [(found[job_id], score) for job_id, score in ranked if job_id in found]
+
+    # Without FTS5: substring match on every field, newest first, unranked
+    for term in terms:
+        q = Q()
+        for field in SEARCH_FIELDS:
+            q |= Q(**{f'{field}__icontains': term})
+        jobs = jobs.filter(q)
+    return [(job, None) for job in jobs.prefetch_related('branches').order_by('-posted_on')[:limit]]
+
+
+def rebuild_job_search():
+    """
+    Restores the sync triggers and re-reads every job into the FTS5 index.
+    Returns the indexed job count, or None without FTS5.
+    """
+    if not fts_available():
+        return None
+    ensure_job_search_triggers(connection)
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+    return Job.objects.count()
@@ -0,0 +1,268 @@
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from accounts import ats_utils
+from accounts.ats_utils import (
+    BRANCH_SKILLS,
+    calculate_ats_score,
+    extract_resume_text,
+    extract_skills,
+    forget_document,
+)
+
+FORMATS = ("pdf", "docx", "txt")
+STAGES = ("extract_resume_text", "extract_skills", "calculate_ats_score")
+
+FIRST_NAMES = ["Anjali", "Rahul", "Fathima", "Arjun", "Sneha", "Vishnu", "Meera", "Nikhil", "Aisha", "Gokul"]
+LAST_NAMES = ["Nair", "Menon", "Pillai", "Thomas", "Varghese", "Krishnan", "Joseph", "Rahman"]
+FILLER = [
+    "Designed and implemented {skill} modules for a college project with a team of four.",
+    "Improved the performance of an existing {skill} workflow by profiling and refactoring.",
+    "Documented test procedures and reviewed {skill} work done by junior students.",
+    "Presented a seminar on {skill} covering fundamentals and practical applications.",
+    "Maintained lab equipment and assisted faculty with {skill} practical sessions.",
+    "Built a prototype using {skill} and demonstrated it at the department tech fest.",
+]
+
+
+def _synthetic_resume(rng, branch, pages):
+    """Plain-text lines of a plausible diploma resume for one branch."""
+    skills = rng.sample(BRANCH_SKILLS[branch], k=min(len(BRANCH_SKILLS[branch]), rng.randint(5, 12)))
+    lines = [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        f"Email: student{rng.randint(100, 999)}@gmail.com | Phone: 9{rng.randint(100000000, 999999999)}",
+        "",
+        "SUMMARY",
+        f"Diploma student in {branch} looking for an entry level role where I can apply {skills[0]} and {skills[-1]}.",
+        "",
+        "SKILLS",
+        ", ".join(skills),
+        "",
+        "EDUCATION",
+        f"Diploma in Engineering ({branch}), Government Polytechnic College, CGPA {rng.uniform(6, 9.8):.2f}",
+    ]
+    for section in ("PROJECTS", "EXPERIENCE"):
+        lines += ["", section]
+        for _ in range(pages * rng.randint(6, 10)):
+            lines.append("- " + rng.choice(FILLER).format(skill=rng.choice(skills)))
+    lines += ["", "CERTIFICATIONS", f"Certificate course in {rng.choice(skills)}"]
+    return lines
+
+
+def _pdf_escape(line):
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def _build_pdf(lines, lines_per_page=55):
+    """Minimal multi-page PDF (Helvetica text only) written without extra dependencies."""
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+    objects = [None, None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page_lines in pages:
+        stream = "BT /F1 10 Tf 12 TL 50 790 Td " + " ".join(f"({_pdf_escape(l)}) Tj T*" for l in page_lines) + " ET"
+        stream = stream.encode("latin-1", errors="replace")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_id = len(objects)
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode())
+        page_ids.append(len(objects))
+    objects[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    kids = " ".join(f"{i} 0 R" for i in page_ids)
+    objects[1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode()
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def _build_docx(lines):
+    import docx
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def _build_file(lines, fmt):
+    if fmt == "pdf":
+        return _build_pdf(lines)
+    if fmt == "docx":
+        return _build_docx(lines)
+    return "\n".join(lines).encode("utf-8")
+
+
+def _upload(data, name):
+    file = io.BytesIO(data)
+    file.name = name
+    return file
+
+
+def _percentile(values, pct):
+    # Nearest-rank percentile; None without samples
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def _summary(timings, peaks):
+    total = sum(timings)
+    return {
+        "docs": len(timings),
+        "p50_ms": _ms(_percentile(timings, 50)),
+        "p95_ms": _ms(_percentile(timings, 95)),
+        "mean_ms": _ms(total / len(timings)) if timings else None,
+        "docs_per_sec": round(len(timings) / total, 2) if total else None,
+        "peak_mem_kb": round(max(peaks) / 1024, 1) if peaks else None,
+    }
+
+
+def _format_ms(value):
+    return f"{value:>9.3f} ms" if value is not None else f"{'n/a':>9}   "
+
+
+class Command(BaseCommand):
+    help = "Benchmarks extract_resume_text, extract_skills and calculate_ats_score on synthetic resumes."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=10, help="Resumes per branch and format.")
+        parser.add_argument('--pages', type=int, default=1, help="Approximate resume length in pages.")
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--formats', default=",".join(FORMATS), help="Comma separated subset of pdf,docx,txt.")
+        parser.add_argument('--whole-document', action='store_true',
+                            help="Use the old whole-document PDF extraction instead of page streaming.")
+        parser.add_argument('--no-memory', action='store_true', help="Skip the tracemalloc peak-memory pass.")
+        parser.add_argument('--output', default='ats_benchmark.json', help="Where to write the JSON results.")
+        parser.add_argument('--compare', help="Previous results JSON to print p50/p95 deltas against.")
+
+    def handle(self, *args, **options):
+        if options['count'] < 1:
+            raise CommandError("--count must be at least 1")
+        formats = [f.strip() for f in options['formats'].split(",") if f.strip()]
+        unknown = set(formats) - set(FORMATS)
+        if unknown:
+            raise CommandError(f"Unknown format(s): {', '.join(sorted(unknown))}")
+
+        rng = random.Random(options['seed'])
+        corpus = []
+        for branch in BRANCH_SKILLS:
+            for fmt in formats:
+                for i in range(options['count']):
+                    lines = _synthetic_resume(rng, branch, max(1, options['pages']))
+                    corpus.append((branch, fmt, f"resume_{branch}_{i}.{fmt}", _build_file(lines, fmt)))
+        self.stdout.write(f"Generated {len(corpus)} resumes ({len(BRANCH_SKILLS)} branches x {formats})")
+
+        # Model load, corpus fit and JD parses are startup costs, not per-document ones
+        ats_utils.warm_up()
+
+        timings = {stage: {fmt: [] for fmt in formats} for stage in STAGES}
+        peaks = {stage: {fmt: [] for fmt in formats} for stage in STAGES}
+        streaming = not options['whole_document']
+        passes = [False] if options['no_memory'] else [False, True]
+        for traced in passes:
+            if traced:
+                tracemalloc.start()
+            for branch, fmt, name, data in corpus:
+                text = self._measure(traced, timings, peaks, "extract_resume_text", fmt,
+                                     extract_resume_text, _upload(data, name), streaming)
+                # Each stage must parse the resume itself, as it would in production
+                forget_document(text)
+                self._measure(traced, timings, peaks, "extract_skills", fmt, extract_skills, text, branch)
+                forget_document(text)
+                self._measure(traced, timings, peaks, "calculate_ats_score", fmt, calculate_ats_score, text, None, branch)
+                forget_document(text)
+            if traced:
+                tracemalloc.stop()
+
+        results = {
+            "meta": {
+                "timestamp": timezone.now().isoformat(),
+                "python": platform.python_version(),
+                "spacy_model_loaded": ats_utils.get_nlp() is not None,
+                "count_per_branch_format": options['count'],
+                "pages": options['pages'],
+                "seed": options['seed'],
+                "pdf_streaming": streaming,
+            },
+            "stages": {},
+        }
+        for stage in STAGES:
+            results["stages"][stage] = {
+                fmt: _summary(timings[stage][fmt], peaks[stage][fmt]) for fmt in formats
+            }
+            all_timings = [t for fmt in formats for t in timings[stage][fmt]]
+            all_peaks = [p for fmt in formats for p in peaks[stage][fmt]]
+            results["stages"][stage]["all"] = _summary(all_timings, all_peaks)
+
+        with open(options['output'], 'w') as f:
+            json.dump(results, f, indent=2)
+
+        self._print(results, options['compare'])
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def _measure(self, traced, timings, peaks, stage, fmt, func, *args):
+        # The ATS debug prints are part of the cost but not of the report
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            return self._run(traced, timings, peaks, stage, fmt, func, *args)
+
+    def _run(self, traced, timings, peaks, stage, fmt, func, *args):
+        if traced:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            result = func(*args)
+            peaks[stage][fmt].append(tracemalloc.get_traced_memory()[1] - baseline)
+            return result
+
+        started = time.perf_counter()
+        result = func(*args)
+        timings[stage][fmt].append(time.perf_counter() - started)
+        return result
+
+    def _print(self, results, compare_path):
+        previous = None
+        if compare_path:
+            with open(compare_path) as f:
+                previous = json.load(f)["stages"]
+
+        for stage, by_format in results["stages"].items():
+            self.stdout.write(stage)
+            for fmt, summary in by_format.items():
+                line = (
+                    f"  {fmt:<5} p50 {_format_ms(summary['p50_ms'])}  p95 {_format_ms(summary['p95_ms'])}  "
+                    f"{summary['docs_per_sec'] or 0:>9.2f} docs/s"
+                )
+                if summary['peak_mem_kb'] is not None:
+                    line += f"  peak {summary['peak_mem_kb']:>9.1f} KiB"
+                old = (previous or {}).get(stage, {}).get(fmt)
+                if old and old.get('p50_ms') and summary['p50_ms'] is not None:
+                    change = (summary['p50_ms'] - old['p50_ms']) / old['p50_ms'] * 100
+                    line += f"  (p50 {change:+.1f}% vs previous)"
+                self.stdout.write(line)
@@ -0,0 +1,15 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.eligibility import rebuild_eligibility
+
+
+class Command(BaseCommand):
+    help = "Recomputes the materialized student/job eligibility rows for every open job."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        written = rebuild_eligibility()
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} eligible student/job pairs in {elapsed:.2f}s"))
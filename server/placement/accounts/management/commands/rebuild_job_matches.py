@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.matching import RECOMMENDATION_TOP_N, rebuild_job_matches
+
+
+class Command(BaseCommand):
+    help = "Recomputes the ranked job recommendations of every student in one batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=RECOMMENDATION_TOP_N, help="Matches stored per student.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        written = rebuild_job_matches(top_n=options['top'])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Stored {written} job matches in {elapsed:.2f}s"))
@@ -0,0 +1,18 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.job_search import rebuild_job_search
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the SQLite FTS5 index behind the student job search."
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        indexed = rebuild_job_search()
+        if indexed is None:
+            self.stdout.write(self.style.WARNING("No FTS5 job index on this database; search uses the icontains fallback"))
+            return
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} jobs in {elapsed:.2f}s"))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import ResumeText, Student
+from accounts.resume_store import get_student_resume_text
+from accounts.skill_index import index_profile_skills, index_resume_skills
+
+
+class Command(BaseCommand):
+    help = "Rebuilds the student skill index from profile skills and stored resume texts."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=200, help="Students loaded per chunk.")
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        chunk_size = max(1, options['chunk_size'])
+        student_ids = list(Student.objects.order_by('id').values_list('id', flat=True))
+
+        for offset in range(0, len(student_ids), chunk_size):
+            chunk = list(Student.objects.filter(id__in=student_ids[offset:offset + chunk_size]).only(
+                'id', 'skills', 'resume', 'resume_hash'
+            ))
+            stored = dict(ResumeText.objects.filter(
+                sha256__in=[s.resume_hash for s in chunk if s.resume_hash]
+            ).values_list('sha256', 'text'))
+            for student in chunk:
+                index_profile_skills(student)
+                text = stored[student.resume_hash] if student.resume_hash in stored else get_student_resume_text(student)
+                index_resume_skills(student, text)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(f"Indexed skills of {len(student_ids)} students in {elapsed:.2f}s"))
@@ -0,0 +1,161 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, time as dt_time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from accounts.ats_index import ensure_corpus
+from accounts.ats_queue import exclude_current_scores
+from accounts.dashboard_cache import invalidate_student_dashboards
+from accounts.departments import branch_code, department_param_q
+from accounts.ats_utils import ATS_MODEL_VERSION, score_resumes, warm_up
+from accounts.models import ResumeText, Student
+from accounts.resume_store import get_student_resume_text
+
+
+def _close_inherited_connections():
+    # Forked workers only score text; they must not touch the parent's DB handles
+    connections.close_all()
+
+
+def _split(items, parts):
+    size = -(-len(items) // parts)
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+class Command(BaseCommand):
+    help = "Recomputes Student.ats_score for stored resumes, e.g. after editing BRANCH_SKILLS or DEFAULT_JD."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--department', help="Only rescore students of this department.")
+        parser.add_argument('--changed-since', help="Only rescore resumes uploaded on or after this date (YYYY-MM-DD).")
+        parser.add_argument('--include-undated', action='store_true',
+                            help="With --changed-since, also rescore resumes uploaded before upload times "
+                                 "were recorded (resume_uploaded_at is empty).")
+        parser.add_argument('--force', action='store_true',
+                            help="Also rescore resumes already scored with the current ATS_MODEL_VERSION.")
+        parser.add_argument('--dry-run', action='store_true', help="Compute and report scores without saving them.")
+        parser.add_argument('--chunk-size', type=int, default=200, help="Students loaded and written per chunk.")
+        parser.add_argument('--batch-size', type=int, default=64, help="nlp.pipe batch size.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Scoring processes.")
+
+    def handle(self, *args, **options):
+        students = Student.objects.exclude(resume='').only(
+            'id', 'department', 'branch', 'resume', 'resume_hash', 'ats_score', 'ats_scored_hash',
+            'ats_model_version', 'ats_scored_branch',
+        ).order_by('id')
+
+        if not options['force']:
+            # Scores computed for the same bytes, model version and branch are still valid
+            students = exclude_current_scores(students)
+
+        if options['department']:
+            students = students.filter(department_param_q(options['department']))
+        if options['changed_since']:
+            try:
+                since = datetime.strptime(options['changed_since'], '%Y-%m-%d')
+            except ValueError:
+                raise CommandError("--changed-since must be a date in YYYY-MM-DD format")
+            since = timezone.make_aware(datetime.combine(since.date(), dt_time.min))
+            changed = Q(resume_uploaded_at__gte=since)
+            if options['include_undated']:
+                changed |= Q(resume_uploaded_at__isnull=True)
+            students = students.filter(changed)
+        elif options['include_undated']:
+            raise CommandError("--include-undated only applies with --changed-since")
+
+        chunk_size = max(1, options['chunk_size'])
+        workers = max(1, options['workers'])
+        dry_run = options['dry_run']
+
+        # Fit the corpus and load the model once, before forking, so every
+        # worker shares them copy-on-write
+        ensure_corpus()
+        warm_up()
+
+        pool = None
+        if workers > 1:
+            connections.close_all()
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_close_inherited_connections,
+            )
+
+        # Only the ids are held in memory; rows are loaded chunk by chunk. Not
+        # using .iterator() since SQLite can't isolate a cursor from the
+        # bulk_update writes made to the same table while it is open.
+        student_ids = list(students.values_list('id', flat=True))
+        self.stdout.write(f"Rescoring {len(student_ids)} resumes with {workers} worker(s), model version {ATS_MODEL_VERSION}")
+
+        started = time.perf_counter()
+        scored = changed = skipped = 0
+        try:
+            for offset in range(0, len(student_ids), chunk_size):
+                chunk = list(students.filter(id__in=student_ids[offset:offset + chunk_size]))
+                result = self._rescore_chunk(chunk, pool, workers, options['batch_size'], dry_run)
+                scored, changed, skipped = scored + result[0], changed + result[1], skipped + result[2]
+                self._report(scored, skipped, started)
+        finally:
+            if pool:
+                pool.shutdown()
+
+        elapsed = time.perf_counter() - started
+        rate = scored / elapsed if elapsed else 0
+        verb = "would change" if dry_run else "changed"
+        self.stdout.write(self.style.SUCCESS(
+            f"Rescored {scored} resumes in {elapsed:.2f}s ({rate:.1f} resumes/s); "
+            f"{verb} {changed}, skipped {skipped} without text"
+        ))
+
+    def _rescore_chunk(self, chunk, pool, workers, batch_size, dry_run):
+        # Stored texts in one query; only resumes never seen by the store are parsed here
+        stored = dict(ResumeText.objects.filter(
+            sha256__in=[s.resume_hash for s in chunk if s.resume_hash]
+        ).values_list('sha256', 'text'))
+
+        items = []
+        students = []
+        for student in chunk:
+            text = stored[student.resume_hash] if student.resume_hash in stored else get_student_resume_text(student)
+            if text:
+                items.append((text, branch_code(student)))
+                students.append(student)
+        if not items:
+            return 0, 0, len(chunk)
+
+        if pool:
+            scores = []
+            for part in pool.map(score_resumes, _split(items, workers), [batch_size] * workers):
+                scores.extend(part)
+        else:
+            scores = score_resumes(items, batch_size=batch_size)
+
+        changed = 0
+        for student, (_, branch), score in zip(students, items, scores):
+            if round(float(student.ats_score), 2) != round(float(score), 2):
+                changed += 1
+                if dry_run:
+                    self.stdout.write(f"Student {student.pk}: {student.ats_score} -> {score}")
+            student.ats_score = score
+            student.ats_scored_hash = student.resume_hash
+            student.ats_model_version = ATS_MODEL_VERSION
+            student.ats_scored_branch = branch
+
+        if students and not dry_run:
+            # Every scored row is written so its hash/version/branch stamp is current
+            Student.objects.bulk_update(
+                students, ['ats_score', 'ats_scored_hash', 'ats_model_version', 'ats_scored_branch']
+            )
+            invalidate_student_dashboards([student.pk for student in students])
+        return len(items), changed, len(chunk) - len(items)
+
+    def _report(self, scored, skipped, started):
+        elapsed = time.perf_counter() - started
+        rate = scored / elapsed if elapsed else 0
+        self.stdout.write(f"... {scored} scored, {skipped} skipped, {rate:.1f} resumes/s")
@@ -0,0 +1,69 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from accounts.ats_queue import claim_jobs, requeue_stale_jobs, run_scoring_job
+from accounts.ats_utils import warm_up
+
+
+def _close_inherited_connections():
+    # Forked workers must not reuse the parent's database handles
+    connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Processes queued ATS scoring jobs (resume uploads) in the background."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=1, help="Number of scoring processes (default: 1, inline).")
+        parser.add_argument('--poll-interval', type=float, default=2.0, help="Seconds to sleep when the queue is empty.")
+        parser.add_argument('--once', action='store_true', help="Drain the queue and exit instead of polling forever.")
+
+    def handle(self, *args, **options):
+        workers = max(1, options['workers'])
+        poll_interval = options['poll_interval']
+
+        pool = None
+        if workers > 1:
+            # Load the model before forking so the pool shares it copy-on-write
+            warm_up()
+            connections.close_all()
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_close_inherited_connections,
+            )
+
+        requeued = requeue_stale_jobs()
+        if requeued:
+            self.stdout.write(f"Requeued {requeued} stale job(s)")
+
+        self.stdout.write(f"ATS worker started with {workers} process(es)")
+        processed = 0
+        try:
+            while True:
+                job_ids = claim_jobs(limit=workers)
+                if not job_ids:
+                    if options['once']:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                if pool:
+                    statuses = list(pool.map(run_scoring_job, job_ids))
+                else:
+                    statuses = [run_scoring_job(job_id) for job_id in job_ids]
+
+                processed += len(job_ids)
+                for job_id, job_status in zip(job_ids, statuses):
+                    self.stdout.write(f"ATS job #{job_id}: {job_status}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if pool:
+                pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(f"ATS worker stopped after {processed} job(s)"))
@@ -0,0 +1,88 @@
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Job, JobEligibility, JobMatch, ResumeText, Student
+from .dashboard_cache import invalidate_student_dashboards
+from .ats_index import ensure_corpus, job_text, job_vector_key
+from .ats_utils import get_fitted_vectorizer, get_jd_vector, normalize_text
+from .resume_store import get_student_resume_text
+
+# Number of ranked jobs stored per student
+RECOMMENDATION_TOP_N = 10
+
+
+def _eligibility_mask(students, jobs):
+    """
+    Boolean students x jobs matrix read from the materialized JobEligibility
+    rows (department, CGPA, backlogs, blacklist; see accounts.eligibility).
+    """
+    import numpy as np
+
+    pairs = set(JobEligibility.objects.filter(
+        student__in=students, job__in=jobs
+    ).values_list('student_id', 'job_id'))
+    rows = {s.pk: i for i, s in enumerate(students)}
+    cols = {j.pk: i for i, j in enumerate(jobs)}
+    mask = np.zeros((len(students), len(jobs)), dtype=bool)
+    for student_id, job_id in pairs:
+        mask[rows[student_id], cols[job_id]] = True
+    return mask
+
+
+def rebuild_job_matches(students=None, top_n=RECOMMENDATION_TOP_N):
+    """
+    Scores every given student (default: all active students with a resume)
+    against every open job as one sparse matrix product of resume and JD
+    TF-IDF vectors, masks out ineligible pairs and stores the top N per
+    student. Returns the number of JobMatch rows written.
+    """
+    import numpy as np
+    from scipy.sparse import vstack
+
+    if students is None:
+        students = Student.objects.filter(user__is_active=True).exclude(resume='')
+    students = [s for s in students if s.resume]
+    if not students:
+        return 0
+
+    jobs = list(Job.objects.filter(deadline__gte=timezone.now()))
+    if not jobs:
+        JobMatch.objects.filter(student__in=students).delete()
+        return 0
+
+    ensure_corpus()
+    fitted = get_fitted_vectorizer()
+
+    # One query for every stored resume text; only legacy uploads fall back to parsing
+    stored = dict(ResumeText.objects.filter(
+        sha256__in=[s.resume_hash for s in students if s.resume_hash]
+    ).values_list('sha256', 'text'))
+    texts = [
+        normalize_text(stored[s.resume_hash] if s.resume_hash in stored else get_student_resume_text(s))
+        for s in students
+    ]
+
+    resume_matrix = fitted[0].transform(texts)
+    jd_matrix = vstack([get_jd_vector(normalize_text(job_text(j)), job_vector_key(j.pk), fitted) for j in jobs])
+    scores = (resume_matrix @ jd_matrix.T).toarray() * 100
+    scores[~_eligibility_mask(students, jobs)] = -1
+
+    matches = []
+    for row, student in enumerate(students):
+        ranked = np.argsort(-scores[row], kind='stable')[:top_n]
+        rank = 1
+        for col in ranked:
+            if scores[row, col] < 0:
+                break
+            matches.append(JobMatch(
+                student=student, job=jobs[col], score=round(float(scores[row, col]), 2), rank=rank
+            ))
+            rank += 1
+
+    with transaction.atomic():
+        JobMatch.objects.filter(student__in=students).delete()
+        JobMatch.objects.bulk_create(matches)
+
+    # Bulk writes send no signals; drop the dashboards that list these matches
+    invalidate_student_dashboards([student.pk for student in students])
+    return len(matches)
@@ -0,0 +1,30 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0014_job_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobMatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='student_matches', to='accounts.job')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_matches', to='accounts.student')),
+            ],
+            options={
+                'ordering': ['rank'],
+                'indexes': [models.Index(fields=['student', 'rank'], name='accounts_jo_student_b619d4_idx')],
+                'unique_together': {('student', 'job')},
+            },
+        ),
+    ]
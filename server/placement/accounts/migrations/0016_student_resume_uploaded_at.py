@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0015_jobmatch'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='resume_uploaded_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
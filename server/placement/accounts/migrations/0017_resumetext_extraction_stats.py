@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0016_student_resume_uploaded_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumetext',
+            name='extraction_ms',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='resumetext',
+            name='page_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='resumetext',
+            name='truncated',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 07:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0017_resumetext_extraction_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='ats_model_version',
+            field=models.CharField(blank=True, max_length=20),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='ats_scored_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
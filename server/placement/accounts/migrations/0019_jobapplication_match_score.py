@@ -0,0 +1,33 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0018_student_ats_model_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='atsscoringjob',
+            name='job',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='ats_jobs', to='accounts.job'),
+        ),
+        migrations.AddField(
+            model_name='jobapplication',
+            name='match_score',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True),
+        ),
+        migrations.AlterField(
+            model_name='atsscoringjob',
+            name='student',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='ats_jobs', to='accounts.student'),
+        ),
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['job', '-match_score'], name='accounts_app_job_match_idx'),
+        ),
+    ]
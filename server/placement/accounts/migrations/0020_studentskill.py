@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0019_jobapplication_match_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=100)),
+                ('source', models.CharField(choices=[('profile', 'Profile'), ('resume', 'Resume')], max_length=10)),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='accounts.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'student'], name='accounts_st_skill_840ed0_idx')],
+                'unique_together': {('student', 'skill', 'source')},
+            },
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0020_studentskill'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Department',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(max_length=10, unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('aliases', models.TextField(blank=True, help_text='Comma separated alternative names')),
+            ],
+            options={
+                'ordering': ['code'],
+            },
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='branch',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='interviews', to='accounts.department'),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='branches',
+            field=models.ManyToManyField(blank=True, related_name='jobs', to='accounts.department'),
+        ),
+        migrations.AddField(
+            model_name='registrationrequest',
+            name='branch',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='registration_requests', to='accounts.department'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='branch',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='students', to='accounts.department'),
+        ),
+        migrations.AddField(
+            model_name='teacher',
+            name='branch',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='teachers', to='accounts.department'),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:10
+
+import re
+
+from django.db import migrations
+
+# Frozen copies of the seed departments and the matcher in accounts.departments
+# as of this migration, so later edits there don't change what it does
+DEFAULT_DEPARTMENTS = [
+    ("CT", "Computer Technology", "computer technology, computer science, cse, cs, information technology, it, software"),
+    ("CM", "Computer Engineering", "computer engineering, computer"),
+    ("EL", "Electronics Engineering", "electronics, electronics engineering, electronics and communication, ece, ec"),
+    ("EEE", "Electrical and Electronics Engineering", "electrical, electrical engineering, electrical and electronics, ee"),
+    ("BME", "Biomedical Engineering", "biomedical, biomedical engineering"),
+    ("RPA", "Robotics and Process Automation", "robotics, automation, robotic process automation"),
+]
+ALL_DEPARTMENTS = ("all", "all departments", "all branches", "any")
+
+
+def _label(text):
+    return re.sub(r'\s+', ' ', text or '').strip().lower()
+
+
+def build_alias_table(rows):
+    """{label: department id} from (id, code, name, aliases) rows."""
+    table = {}
+    for pk, code, name, aliases in rows:
+        for label in [code, name] + (aliases or '').split(','):
+            label = _label(label)
+            if label:
+                table.setdefault(label, pk)
+    return table
+
+
+def match_department(text, table):
+    label = _label(text)
+    if not label:
+        return None
+    if label in table:
+        return table[label]
+    for alias in sorted(table, key=len, reverse=True):
+        if len(alias) > 3 and re.search(rf'(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])', label):
+            return table[alias]
+    return None
+
+
+def match_departments(text, table):
+    ids = []
+    for part in re.split(r'[,;/\n]', text or ''):
+        if _label(part) in ALL_DEPARTMENTS:
+            return sorted(set(table.values()))
+        pk = match_department(part, table)
+        if pk and pk not in ids:
+            ids.append(pk)
+    return ids
+
+
+def backfill_departments(apps, schema_editor):
+    Department = apps.get_model('accounts', 'Department')
+    for code, name, aliases in DEFAULT_DEPARTMENTS:
+        Department.objects.get_or_create(code=code, defaults={'name': name, 'aliases': aliases})
+    table = build_alias_table(Department.objects.values_list('id', 'code', 'name', 'aliases'))
+
+    # One UPDATE per distinct free-text value instead of per row
+    for model_name in ('Student', 'Teacher', 'Interview', 'RegistrationRequest'):
+        model = apps.get_model('accounts', model_name)
+        for department in model.objects.values_list('department', flat=True).distinct():
+            branch_id = match_department(department, table)
+            if branch_id:
+                model.objects.filter(department=department).update(branch_id=branch_id)
+
+    Job = apps.get_model('accounts', 'Job')
+    for job in Job.objects.only('id', 'allowed_departments'):
+        job.branches.set(match_departments(job.allowed_departments, table))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0021_department'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_departments, migrations.RunPython.noop),
+    ]
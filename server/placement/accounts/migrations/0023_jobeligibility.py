@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0022_backfill_departments'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobEligibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('deadline', models.DateTimeField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligible_students', to='accounts.job')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='eligible_jobs', to='accounts.student')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['student', 'deadline'], name='accounts_jo_student_8b8449_idx')],
+                'unique_together': {('student', 'job')},
+            },
+        ),
+    ]
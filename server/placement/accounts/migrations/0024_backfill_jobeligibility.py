@@ -0,0 +1,39 @@
+# Generated by Django 6.0.2 on 2026-10-18 09:48
+
+from django.db import migrations
+from django.utils import timezone
+
+
+def backfill_eligibility(apps, schema_editor):
+    # Mirrors accounts.eligibility.refresh_job_eligibility with historical models
+    Job = apps.get_model('accounts', 'Job')
+    Student = apps.get_model('accounts', 'Student')
+    JobEligibility = apps.get_model('accounts', 'JobEligibility')
+
+    rows = []
+    for job in Job.objects.filter(deadline__gte=timezone.now()):
+        branch_ids = set(job.branches.values_list('id', flat=True))
+        allowed = (job.allowed_departments or "").lower()
+        candidates = Student.objects.filter(
+            is_blacklisted=False, overall_cgpa__gte=job.min_cgpa, total_backlogs__lte=job.max_backlogs,
+        ).only('id', 'department', 'branch')
+        for student in candidates:
+            if student.branch_id:
+                eligible = student.branch_id in branch_ids
+            else:
+                department = (student.department or "").lower()
+                eligible = bool(department) and department in allowed
+            if eligible:
+                rows.append(JobEligibility(student_id=student.pk, job_id=job.pk, deadline=job.deadline))
+    JobEligibility.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0023_jobeligibility'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_eligibility, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 6.0.2 on 2026-10-18 11:20
+
+from django.db import migrations, transaction
+from django.db.utils import OperationalError
+
+# External content FTS5 index over accounts_job, kept in sync by triggers so
+# bulk updates and raw SQL writes are covered too. The DDL is frozen here;
+# accounts.job_search keeps its own copy of the triggers to restore them
+# after table rebuilds, and the bm25() column weights.
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE accounts_job_fts USING fts5(
+        company, role, description, skills_required,
+        content='accounts_job', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )
+    """,
+    """
+    CREATE TRIGGER accounts_job_fts_ai AFTER INSERT ON accounts_job BEGIN
+        INSERT INTO accounts_job_fts(rowid, company, role, description, skills_required)
+        VALUES (new.id, new.company, new.role, new.description, new.skills_required);
+    END
+    """,
+    """
+    CREATE TRIGGER accounts_job_fts_ad AFTER DELETE ON accounts_job BEGIN
+        INSERT INTO accounts_job_fts(accounts_job_fts, rowid, company, role, description, skills_required)
+        VALUES ('delete', old.id, old.company, old.role, old.description, old.skills_required);
+    END
+    """,
+    """
+    CREATE TRIGGER accounts_job_fts_au AFTER UPDATE OF company, role, description, skills_required ON accounts_job BEGIN
+        INSERT INTO accounts_job_fts(accounts_job_fts, rowid, company, role, description, skills_required)
+        VALUES ('delete', old.id, old.company, old.role, old.description, old.skills_required);
+        INSERT INTO accounts_job_fts(rowid, company, role, description, skills_required)
+        VALUES (new.id, new.company, new.role, new.description, new.skills_required);
+    END
+    """,
+    "INSERT INTO accounts_job_fts(accounts_job_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS accounts_job_fts_ai",
+    "DROP TRIGGER IF EXISTS accounts_job_fts_ad",
+    "DROP TRIGGER IF EXISTS accounts_job_fts_au",
+    "DROP TABLE IF EXISTS accounts_job_fts",
+]
+
+
+def create_job_search(apps, schema_editor):
+    # Other databases (and SQLite builds without FTS5) use the icontains fallback
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            with schema_editor.connection.cursor() as cursor:
+                for sql in CREATE_SQL:
+                    cursor.execute(sql)
+    except OperationalError as e:
+        print(f"FTS5 unavailable, job search will use the fallback: {e}")
+
+
+def drop_job_search(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        for sql in DROP_SQL:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0024_backfill_jobeligibility'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_job_search, drop_job_search),
+    ]
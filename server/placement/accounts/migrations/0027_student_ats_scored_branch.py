@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 14:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0026_calendar_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='ats_scored_branch',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+    ]
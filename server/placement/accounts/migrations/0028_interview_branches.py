@@ -0,0 +1,75 @@
+# Generated by Django 6.0.2 on 2026-10-18 15:20
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of the matcher in accounts.departments as of this migration,
+# so later edits there don't change what it does
+ALL_DEPARTMENTS = ("all", "all departments", "all branches", "any")
+
+
+def _label(text):
+    return re.sub(r'\s+', ' ', text or '').strip().lower()
+
+
+def build_alias_table(rows):
+    """{label: department id} from (id, code, name, aliases) rows."""
+    table = {}
+    for pk, code, name, aliases in rows:
+        for label in [code, name] + (aliases or '').split(','):
+            label = _label(label)
+            if label:
+                table.setdefault(label, pk)
+    return table
+
+
+def match_department(text, table):
+    label = _label(text)
+    if not label:
+        return None
+    if label in table:
+        return table[label]
+    for alias in sorted(table, key=len, reverse=True):
+        if len(alias) > 3 and re.search(rf'(?<![a-z0-9]){re.escape(alias)}(?![a-z0-9])', label):
+            return table[alias]
+    return None
+
+
+def match_departments(text, table):
+    ids = []
+    for part in re.split(r'[,;/\n]', text or ''):
+        if _label(part) in ALL_DEPARTMENTS:
+            return sorted(set(table.values()))
+        pk = match_department(part, table)
+        if pk and pk not in ids:
+            ids.append(pk)
+    return ids
+
+
+def backfill_interview_branches(apps, schema_editor):
+    Department = apps.get_model('accounts', 'Department')
+    Interview = apps.get_model('accounts', 'Interview')
+    table = build_alias_table(Department.objects.values_list('id', 'code', 'name', 'aliases'))
+    for interview in Interview.objects.only('id', 'department'):
+        interview.branches.set(match_departments(interview.department, table))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0027_student_ats_scored_branch'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='interview',
+            name='branch',
+        ),
+        migrations.AddField(
+            model_name='interview',
+            name='branches',
+            field=models.ManyToManyField(blank=True, related_name='interviews', to='accounts.department'),
+        ),
+        migrations.RunPython(backfill_interview_branches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-18 18:30
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_text_updated_at(apps, schema_editor):
+    # The last edit of any kind is the best bound there is for existing jobs
+    Job = apps.get_model('accounts', 'Job')
+    Job.objects.update(text_updated_at=F('updated_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0028_interview_branches'),
+    ]
+
+    operations = [
+        # Nullable without a default, so SQLite adds the column in place
+        # rather than rebuilding accounts_job and dropping the FTS5 triggers
+        migrations.AddField(
+            model_name='job',
+            name='text_updated_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_text_updated_at, migrations.RunPython.noop),
+    ]
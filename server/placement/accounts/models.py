@@ -33,6 +33,26 @@ class User(AbstractBaseUser, PermissionsMixin):
         return f"{self.full_name} - {self.role}"
 
 
+# ============================
+# DEPARTMENT
+# ============================
+class Department(models.Model):
+    """
+    Canonical department/branch. The free-text `department` fields and
+    Job.allowed_departments are resolved to these rows through `code`,
+    `name` and `aliases` (see accounts.departments).
+    """
+    code = models.CharField(max_length=10, unique=True)
+    name = models.CharField(max_length=100)
+    aliases = models.TextField(blank=True, help_text="Comma separated alternative names")
+
+    class Meta:
+        ordering = ['code']
+
+    def __str__(self):
+        return f"{self.code} - {self.name}"
+
+
 # ============================
 # STUDENT PROFILE
 # ============================
@@ -43,6 +63,7 @@ class Student(models.Model):
     gender = models.CharField(max_length=10)
     college = models.CharField(max_length=200)
     department = models.CharField(max_length=100)
+    branch = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, related_name="students")
     course = models.CharField(max_length=50)
     semester = models.CharField(max_length=20)
     roll_no = models.CharField(max_length=50)
@@ -57,8 +78,38 @@ class Student(models.Model):
     # Additional Info
     skills = models.TextField(blank=True)
     resume = models.FileField(upload_to='resumes/', null=True, blank=True)
+    resume_hash = models.CharField(max_length=64, blank=True, db_index=True)
+    resume_uploaded_at = models.DateTimeField(null=True, blank=True)
     is_blacklisted = models.BooleanField(default=False)
     ats_score = models.DecimalField(max_digits=5, decimal_places=2, default=0.00)
+    # Resume hash, ATS_MODEL_VERSION and branch code the ats_score was computed with
+    ats_scored_hash = models.CharField(max_length=64, blank=True)
+    ats_model_version = models.CharField(max_length=20, blank=True)
+    ats_scored_branch = models.CharField(max_length=100, blank=True)
+
+    # Fields the materialized JobEligibility rows depend on; the department
+    # text decides eligibility while branch_id is unresolved
+    ELIGIBILITY_FIELDS = ('overall_cgpa', 'total_backlogs', 'is_blacklisted', 'branch_id', 'department')
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._eligibility_state = instance.eligibility_state()
+        return instance
+
+    def eligibility_state(self):
+        """
+        Snapshot of ELIGIBILITY_FIELDS as loaded/saved, compared on save to
+        skip recomputing eligibility when none of them changed. Deferred
+        fields read as None rather than triggering a query.
+        """
+        values = [self.__dict__.get(field) for field in self.ELIGIBILITY_FIELDS]
+        try:
+            values[0] = round(float(values[0]), 2)
+            values[1] = int(values[1])
+        except (TypeError, ValueError):
+            pass
+        return tuple(values)
 
     def calculate_cgpa(self):
         results = self.results.all()
@@ -111,6 +162,63 @@ class Student(models.Model):
         return f"Student - {self.user.full_name}"
 
 
+# ============================
+# EXTRACTED RESUME TEXT
+# ============================
+class ResumeText(models.Model):
+    """
+    Text extracted from a resume file, keyed by the SHA-256 of its bytes so
+    each PDF is parsed once per upload instead of on every page load.
+    """
+    sha256 = models.CharField(max_length=64, unique=True)
+    text = models.TextField(blank=True)
+    page_count = models.PositiveIntegerField(default=0)
+    extraction_ms = models.PositiveIntegerField(null=True, blank=True)
+    truncated = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Resume text {self.sha256[:12]}"
+
+
+# ============================
+# ATS SCORING QUEUE
+# ============================
+class AtsScoringJob(models.Model):
+    """
+    A queued ATS scoring run, claimed and processed by the `run_ats_worker`
+    management command. A row with only a student scores their resume, one
+    with a student and a job scores that application, and one with only a
+    job rescores every application to the job and re-ranks the matches of
+    its eligible students.
+    """
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    )
+
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="ats_jobs", null=True, blank=True)
+    job = models.ForeignKey('Job', on_delete=models.CASCADE, related_name="ats_jobs", null=True, blank=True)
+    resume_hash = models.CharField(max_length=64, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    score = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['created_at']
+
+    def __str__(self):
+        if self.job_id and not self.student_id:
+            return f"ATS job #{self.pk} for applicants of job {self.job_id} ({self.status})"
+        return f"ATS job #{self.pk} for {self.student_id} ({self.status})"
+
+
 # ============================
 # SEMESTER RESULT
 # ============================
@@ -151,18 +259,101 @@ class Job(models.Model):
     min_cgpa = models.DecimalField(max_digits=4, decimal_places=2, default=0.00)
     max_backlogs = models.IntegerField(default=0)
     allowed_departments = models.TextField(help_text="Comma separated departments")
+    # Resolved from allowed_departments on save; used for eligibility joins
+    branches = models.ManyToManyField(Department, blank=True, related_name="jobs")
     
     qualification = models.CharField(max_length=200, blank=True, null=True)
     responsibilities = models.TextField(blank=True, null=True)
     requirements = models.TextField(blank=True, null=True)
     
     posted_on = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Last change to the text the job is scored against (description and
+    # skills_required), set in accounts.signals; keys the TF-IDF corpus refits
+    text_updated_at = models.DateTimeField(null=True, blank=True)
     deadline = models.DateTimeField()
 
+    class Meta:
+        # Open-job filters and the drive calendar's date windows. Declared as
+        # an index rather than db_index so SQLite adds it without rebuilding
+        # accounts_job, which would drop the FTS5 sync triggers (0025).
+        indexes = [models.Index(fields=['deadline'], name='accounts_job_deadline_idx')]
+
     def __str__(self):
         return f"{self.role} at {self.company}"
 
 
+# ============================
+# SKILL INDEX
+# ============================
+class StudentSkill(models.Model):
+    """
+    Inverted index of normalized skills to students, built from the
+    free-text Student.skills field and the skills found in the resume.
+    Maintained by accounts.skill_index.
+    """
+    SOURCE_CHOICES = (
+        ('profile', 'Profile'),
+        ('resume', 'Resume'),
+    )
+
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="skill_index")
+    skill = models.CharField(max_length=100)
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES)
+
+    class Meta:
+        unique_together = ('student', 'skill', 'source')
+        indexes = [models.Index(fields=['skill', 'student'])]
+
+    def __str__(self):
+        return f"{self.skill} ({self.source}) for {self.student_id}"
+
+
+# ============================
+# MATERIALIZED ELIGIBILITY
+# ============================
+class JobEligibility(models.Model):
+    """
+    One row per (student, job) pair where the student may apply: department
+    among the job's branches, CGPA, backlogs and not blacklisted. The job's
+    deadline is copied here so open jobs come from a single index range.
+    Maintained by accounts.eligibility.
+    """
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="eligible_jobs")
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="eligible_students")
+    deadline = models.DateTimeField()
+
+    class Meta:
+        unique_together = ('student', 'job')
+        indexes = [models.Index(fields=['student', 'deadline'])]
+
+    def __str__(self):
+        return f"{self.student_id} eligible for {self.job_id}"
+
+
+# ============================
+# PRECOMPUTED JOB MATCHES
+# ============================
+class JobMatch(models.Model):
+    """
+    Top-N open jobs per student by resume/JD similarity, restricted to jobs
+    the student is eligible for. Rebuilt in bulk by accounts.matching.
+    """
+    student = models.ForeignKey(Student, on_delete=models.CASCADE, related_name="job_matches")
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="student_matches")
+    score = models.DecimalField(max_digits=5, decimal_places=2)
+    rank = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('student', 'job')
+        indexes = [models.Index(fields=['student', 'rank'])]
+        ordering = ['rank']
+
+    def __str__(self):
+        return f"#{self.rank} {self.job_id} for {self.student_id} ({self.score})"
+
+
 # ============================
 # JOB APPLICATION
 # ============================
@@ -179,9 +370,14 @@ class JobApplication(models.Model):
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="applicants")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Applied')
     applied_on = models.DateTimeField(auto_now_add=True)
+    # ATS score of the student's resume against this job; null until scored
+    match_score = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
 
     class Meta:
         unique_together = ('student', 'job')
+        indexes = [
+            models.Index(fields=['job', '-match_score'], name='accounts_app_job_match_idx'),
+        ]
 
     def __str__(self):
         return f"{self.student.user.full_name} - {self.job.role}"
@@ -214,6 +410,7 @@ class Teacher(models.Model):
     designation = models.CharField(max_length=100)
     qualification = models.CharField(max_length=100)
     department = models.CharField(max_length=100)
+    branch = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, related_name="teachers")
     experience = models.CharField(max_length=50)
     position = models.CharField(max_length=50)
 
@@ -262,6 +459,7 @@ class RegistrationRequest(models.Model):
     gender = models.CharField(max_length=10)
     college = models.CharField(max_length=200)
     department = models.CharField(max_length=100)
+    branch = models.ForeignKey(Department, on_delete=models.SET_NULL, null=True, blank=True, related_name="registration_requests")
     course = models.CharField(max_length=50)
     semester = models.CharField(max_length=20)
     roll_no = models.CharField(max_length=50)
@@ -280,6 +478,8 @@ class Interview(models.Model):
     company = models.CharField(max_length=200)
     role = models.CharField(max_length=150, blank=True, null=True)
     department = models.CharField(max_length=100)
+    # Resolved from department on save; one interview can cover several ("CT, EL")
+    branches = models.ManyToManyField(Department, blank=True, related_name="interviews")
     date_time = models.DateTimeField()
     meeting_link = models.URLField(max_length=500)
     attachment = models.FileField(upload_to='interviews/', null=True, blank=True)
@@ -291,6 +491,16 @@ class Interview(models.Model):
     # Selection
     selected_students = models.ManyToManyField(Student, related_name="interviews", blank=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['date_time'], name='accounts_interview_date_idx')]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Lets a save that keeps the department skip re-resolving branches
+        instance._loaded_department = dict(zip(field_names, values)).get('department')
+        return instance
+
     def __str__(self):
         return f"Interview: {self.company} for {self.department}"
 # ============================
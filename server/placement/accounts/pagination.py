@@ -0,0 +1,86 @@
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+def _table_estimate(model):
+    """
+    Approximate row count of a whole table from planner statistics, falling
+    back to the largest primary key (an index lookup) when none are available.
+    """
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+            row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return row[0]
+        elif connection.vendor == 'sqlite':
+            # Populated by ANALYZE; "stat" starts with the row count
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'")
+            if cursor.fetchone():
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s", [table])
+                counts = [int(stat.split()[0]) for (stat,) in cursor.fetchall()]
+                if counts:
+                    return max(counts)
+    return model._default_manager.aggregate(last=Max('pk'))['last'] or 0
+
+
+def estimate_count(queryset, cap=None):
+    """
+    Total for a paginated listing without a full COUNT(*): table statistics
+    for unfiltered listings, otherwise a count that stops at `cap` rows.
+    Returns (count, exact).
+    """
+    cap = cap or settings.API_COUNT_ESTIMATE_CAP
+    if not queryset.query.where:
+        return _table_estimate(queryset.model), False
+    count = queryset.order_by()[:cap + 1].count()
+    return min(count, cap), count <= cap
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on an indexed, unique ordering (the primary key by
+    default). Every listing is paged; clients follow `next` links, and the
+    exports that need whole tables use ?stream= (accounts.streaming).
+    """
+    ordering = '-id'
+    page_size_query_param = 'page_size'
+
+    def __init__(self, ordering=None):
+        if ordering:
+            self.ordering = ordering
+        self.page_size = settings.API_PAGE_SIZE
+        self.max_page_size = settings.API_MAX_PAGE_SIZE
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count, self.count_exact = estimate_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "count_estimate": self.count,
+            "count_exact": self.count_exact,
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema['properties']['count_estimate'] = {'type': 'integer'}
+        schema['properties']['count_exact'] = {'type': 'boolean'}
+        return schema
+
+
+def paginated_response(request, queryset, serialize, ordering=None, view=None):
+    """
+    Keyset page of a plain APIView listing. `serialize` turns an iterable of
+    rows into data.
+    """
+    paginator = KeysetPagination(ordering)
+    page = paginator.paginate_queryset(queryset, request, view)
+    return paginator.get_paginated_response(serialize(page))
@@ -0,0 +1,48 @@
+from django.core.cache import caches
+
+from .ai_suggestions import request_ai_suggestions
+from .ats_utils import generate_recommendations
+
+
+def _cache():
+    return caches['recommendations']
+
+
+def recommendation_key(student, job):
+    """
+    Everything generate_recommendations depends on: the resume content, the
+    job and its last edit, plus the CGPA/backlog figures the rules read.
+    A new upload or a job edit therefore never hits a stale entry.
+    """
+    stamp = job.updated_at.timestamp() if job.updated_at else 0
+    return f"rec:{student.resume_hash}:{job.pk}:{stamp}:{student.overall_cgpa}:{student.total_backlogs}"
+
+
+def get_rule_suggestions(student, resume_text, job):
+    """
+    Memoized generate_recommendations. Entries are bounded and expire via the
+    `recommendations` cache settings (MAX_ENTRIES / TIMEOUT).
+    """
+    if not student.resume_hash:
+        return generate_recommendations(student, resume_text, job)
+
+    key = recommendation_key(student, job)
+    result = _cache().get(key)
+    if result is None:
+        result = generate_recommendations(student, resume_text, job)
+        _cache().set(key, result)
+    return result
+
+
+def get_recommendations(student, resume_text, job):
+    """
+    Rule-based suggestions right away, plus whatever the AI backend has
+    produced so far. `ai_status` is pending until the text arrives (poll
+    the ai-suggestions endpoint), or timeout/failed past the deadline.
+    """
+    ai = request_ai_suggestions(resume_text, student.resume_hash)
+    return {
+        "rule_suggestions": get_rule_suggestions(student, resume_text, job),
+        "ai_suggestions": ai["text"],
+        "ai_status": ai["status"],
+    }
@@ -0,0 +1,104 @@
+import hashlib
+import os
+
+from .models import ResumeText, Student
+from .ats_utils import extract_resume
+
+
+class ResumeExtractionError(Exception):
+    """A resume file that could not be read within the extraction budgets."""
+
+
+def hash_resume_file(file):
+    """
+    Returns the SHA-256 hex digest of a resume file, read in chunks.
+    """
+    digest = hashlib.sha256()
+    if hasattr(file, 'chunks'):
+        for chunk in file.chunks():
+            digest.update(chunk)
+    else:
+        if hasattr(file, 'seek'):
+            file.seek(0)
+        for chunk in iter(lambda: file.read(64 * 1024), b''):
+            digest.update(chunk)
+
+    if hasattr(file, 'seek'):
+        file.seek(0)
+    return digest.hexdigest()
+
+
+def save_resume_file(student, file, resume_hash):
+    """
+    Points student.resume at resumes/<sha256><ext>. The bytes are only
+    written when no earlier upload stored the same content, so re-uploads
+    don't pile up copies in media/resumes/. Does not save the student.
+    """
+    ext = os.path.splitext(getattr(file, 'name', ''))[1].lower()
+    name = student.resume.field.generate_filename(student, f"{resume_hash}{ext}")
+    storage = student.resume.storage
+    if storage.exists(name):
+        student.resume.name = name
+    else:
+        student.resume.save(os.path.basename(name), file, save=False)
+    return student.resume.name
+
+
+def store_resume_text(file, resume_hash=None):
+    """
+    Returns (resume_hash, text) for an uploaded resume. The PDF/DOCX is only
+    parsed when no text is stored yet for these exact bytes. Raises
+    ResumeExtractionError, storing nothing, when the file is over the byte
+    budget or unreadable, so it is never mistaken for a blank resume.
+    """
+    if not resume_hash:
+        resume_hash = hash_resume_file(file)
+
+    text = ResumeText.objects.filter(sha256=resume_hash).values_list('text', flat=True).first()
+    if text is not None:
+        return resume_hash, text
+
+    result = extract_resume(file)
+    if result.error:
+        raise ResumeExtractionError(result.error)
+    text = result.text or ""
+    print(f"ATS Extraction: {result.pages} page(s) in {result.elapsed_ms} ms"
+          + (" (budget reached)" if result.truncated else ""))
+    ResumeText.objects.get_or_create(sha256=resume_hash, defaults={
+        'text': text,
+        'page_count': result.pages,
+        'extraction_ms': result.elapsed_ms,
+        'truncated': result.truncated,
+    })
+    return resume_hash, text
+
+
+def get_student_resume_text(student, strict=False):
+    """
+    Returns the extracted text of the student's current resume from the store.
+    Resumes uploaded before the store existed are parsed once and their hash
+    is backfilled on the student row. A resume that cannot be extracted reads
+    as "" unless `strict`, which raises ResumeExtractionError instead.
+    """
+    if not student.resume:
+        return ""
+
+    if student.resume_hash:
+        text = ResumeText.objects.filter(sha256=student.resume_hash).values_list('text', flat=True).first()
+        if text is not None:
+            return text
+
+    try:
+        with student.resume.open('rb') as f:
+            resume_hash, text = store_resume_text(f)
+    except ResumeExtractionError as e:
+        if strict:
+            raise
+        print(f"ATS Warning: resume of student {student.pk} skipped: {e}")
+        return ""
+
+    if resume_hash != student.resume_hash:
+        # update() instead of save() so a page load doesn't re-run profile hooks
+        Student.objects.filter(pk=student.pk).update(resume_hash=resume_hash)
+        student.resume_hash = resume_hash
+    return text
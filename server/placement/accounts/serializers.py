@@ -42,7 +42,7 @@ class JobApplicationSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = JobApplication
-        fields = ['id', 'job', 'status', 'applied_on', 'job_details']
+        fields = ['id', 'job', 'status', 'applied_on', 'match_score', 'job_details']
 
 class NotificationSerializer(serializers.ModelSerializer):
     class Meta:
@@ -65,7 +65,8 @@ class InterviewSerializer(serializers.ModelSerializer):
         model = Interview
         fields = '__all__'
         extra_kwargs = {
-            'created_by': {'required': False, 'allow_null': True}
+            'created_by': {'required': False, 'allow_null': True},
+            'branches': {'read_only': True},
         }
 
 class TeacherSerializer(serializers.ModelSerializer):
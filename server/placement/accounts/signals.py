@@ -0,0 +1,174 @@
+from django.db.models.signals import post_delete, post_migrate, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import (
+    Department, Interview, Job, JobApplication, RegistrationRequest, SemesterResult, Student, Teacher, User,
+)
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_vector(sender, instance, signal, **kwargs):
+    # Deadline and other edits leave the JD vector as it is
+    if signal is post_delete or getattr(instance, '_job_text_changed', False):
+        from .ats_index import invalidate_job
+        invalidate_job(instance.pk)
+
+
+@receiver(pre_save, sender=Job)
+def track_job_changes(sender, instance, **kwargs):
+    # Applicants' match scores and the TF-IDF corpus only depend on the text
+    # a job is scored against
+    old = None
+    if instance.pk:
+        old = Job.objects.filter(pk=instance.pk).values(
+            'description', 'skills_required', 'allowed_departments'
+        ).first()
+    instance._job_text_changed = bool(old) and (
+        old['description'] != instance.description or old['skills_required'] != instance.skills_required
+    )
+    instance._departments_changed = not old or old['allowed_departments'] != instance.allowed_departments
+    if not old or instance._job_text_changed:
+        instance.text_updated_at = timezone.now()
+
+
+@receiver(post_save, sender=Job)
+def sync_job_branches(sender, instance, **kwargs):
+    if getattr(instance, '_departments_changed', True):
+        from .departments import resolve_departments
+        instance.branches.set(resolve_departments(instance.allowed_departments))
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_eligibility_rows(sender, instance, **kwargs):
+    # Registered after sync_job_branches so the job's branches are current
+    from .eligibility import refresh_job_eligibility
+    refresh_job_eligibility(instance)
+
+
+@receiver(pre_save, sender=Student)
+@receiver(pre_save, sender=Teacher)
+@receiver(pre_save, sender=RegistrationRequest)
+def sync_branch(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and 'department' not in update_fields:
+        return
+    from .departments import resolve_department
+    instance.branch_id = resolve_department(instance.department)
+
+
+@receiver(post_save, sender=Interview)
+def sync_interview_branches(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is not None and 'department' not in update_fields:
+        return
+    if not created and instance.department == getattr(instance, '_loaded_department', None):
+        return
+    from .departments import resolve_departments
+    instance.branches.set(resolve_departments(instance.department))
+    instance._loaded_department = instance.department
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def clear_department_lookups(sender, **kwargs):
+    from .departments import clear_department_cache
+    clear_department_cache()
+
+
+@receiver(post_save, sender=Job)
+def rescore_job_applicants(sender, instance, created, **kwargs):
+    # Applicants' match scores and eligible students' recommendations
+    if not created and getattr(instance, '_job_text_changed', False):
+        from .ats_queue import enqueue_job_rescoring
+        enqueue_job_rescoring(instance)
+
+
+@receiver(post_save, sender=JobApplication)
+def score_new_application(sender, instance, created, **kwargs):
+    if created:
+        from .ats_queue import enqueue_application_scoring
+        enqueue_application_scoring(instance)
+
+
+@receiver(post_save, sender=Student)
+def refresh_student_eligibility_rows(sender, instance, created, **kwargs):
+    state = instance.eligibility_state()
+    if created or state != getattr(instance, '_eligibility_state', None):
+        from .eligibility import refresh_student_eligibility
+        refresh_student_eligibility(instance)
+    instance._eligibility_state = state
+
+
+# Cached student dashboards (accounts.dashboard_cache)
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_dashboards_for_job(sender, **kwargs):
+    from .dashboard_cache import invalidate_all_dashboards
+    invalidate_all_dashboards()
+
+
+@receiver(post_save, sender=Student)
+def invalidate_dashboard_for_profile(sender, instance, **kwargs):
+    from .dashboard_cache import invalidate_student_dashboard
+    invalidate_student_dashboard(instance.pk)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+@receiver(post_save, sender=SemesterResult)
+@receiver(post_delete, sender=SemesterResult)
+def invalidate_dashboard_for_student_rows(sender, instance, **kwargs):
+    from .dashboard_cache import invalidate_student_dashboard
+    invalidate_student_dashboard(instance.student_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_dashboard_for_user(sender, instance, created, **kwargs):
+    # The dashboard shows the user's name and teachers only count active
+    # students. A new user has no student profile yet.
+    if instance.role == 'student' and not created:
+        from .dashboard_cache import invalidate_student_dashboard
+        from .teacher_dashboard import invalidate_department_stats
+        for student_id, department, branch_id in Student.objects.filter(user=instance).values_list('id', 'department', 'branch_id'):
+            invalidate_student_dashboard(student_id)
+            invalidate_department_stats(department, branch_id)
+
+
+# Cached teacher dashboard counters (accounts.teacher_dashboard)
+
+@receiver(post_save, sender=RegistrationRequest)
+@receiver(post_delete, sender=RegistrationRequest)
+@receiver(post_save, sender=Student)
+@receiver(post_delete, sender=Student)
+def invalidate_department_stats_for_row(sender, instance, **kwargs):
+    from .teacher_dashboard import invalidate_department_stats
+    invalidate_department_stats(instance.department, instance.branch_id)
+
+
+@receiver(post_save, sender=JobApplication)
+@receiver(post_delete, sender=JobApplication)
+def invalidate_department_stats_for_application(sender, instance, created=False, update_fields=None, **kwargs):
+    # Only selections feed the counters: fresh applications and score
+    # write-backs leave them alone
+    if created and instance.status != 'Selected':
+        return
+    if update_fields is not None and 'status' not in update_fields:
+        return
+    from .teacher_dashboard import invalidate_department_stats
+    for department, branch_id in Student.objects.filter(pk=instance.student_id).values_list('department', 'branch_id'):
+        invalidate_department_stats(department, branch_id)
+
+
+# FTS5 job search index (accounts.job_search)
+
+@receiver(post_migrate)
+def restore_job_search_triggers(sender, using, **kwargs):
+    # A migration that rebuilds accounts_job on SQLite drops its triggers
+    if sender.label != 'accounts':
+        return
+    from django.db import connections
+    from .job_search import ensure_job_search_triggers
+    restored = ensure_job_search_triggers(connections[using])
+    if restored:
+        print(f"Job search: restored triggers {', '.join(restored)} and reindexed jobs")
@@ -0,0 +1,60 @@
+from django.db.models import Count
+
+from .models import Student, StudentSkill
+from .departments import department_param_q
+from .ats_utils import BRANCH_SKILLS, get_skill_matcher, normalize_text, parse_skill_list
+
+# Every known skill regardless of branch, so an EL skill on a CT resume is still indexed
+ALL_SKILLS = tuple(dict.fromkeys(skill for skills in BRANCH_SKILLS.values() for skill in skills))
+
+MAX_SKILL_LENGTH = StudentSkill._meta.get_field('skill').max_length
+
+
+def normalize_skill(skill):
+    return normalize_text(skill)[:MAX_SKILL_LENGTH]
+
+
+def _replace_skills(student, source, skills):
+    """Makes the student's index rows for `source` exactly `skills`."""
+    skills = {normalize_skill(s) for s in skills if s}
+    skills.discard("")
+    StudentSkill.objects.filter(student=student, source=source).exclude(skill__in=skills).delete()
+    StudentSkill.objects.bulk_create(
+        [StudentSkill(student=student, skill=skill, source=source) for skill in skills],
+        ignore_conflicts=True,
+    )
+    return skills
+
+
+def index_profile_skills(student):
+    """Indexes the comma separated Student.skills field."""
+    return _replace_skills(student, 'profile', parse_skill_list(student.skills))
+
+
+def index_resume_skills(student, resume_text):
+    """Indexes the known skills found in the student's resume text."""
+    skills = get_skill_matcher(ALL_SKILLS).find(normalize_text(resume_text)) if resume_text else []
+    return _replace_skills(student, 'resume', skills)
+
+
+def search_students(skills, match_all=True, department=None, min_cgpa=None, max_cgpa=None):
+    """
+    Students having all (match_all) or any of `skills`, answered from the
+    (skill, student) index instead of reading profiles and resumes.
+    """
+    skills = list(dict.fromkeys(normalize_skill(s) for s in skills if s.strip()))
+    students = Student.objects.all()
+
+    if skills:
+        hits = StudentSkill.objects.filter(skill__in=skills).values('student')
+        if match_all and len(skills) > 1:
+            hits = hits.annotate(matched=Count('skill', distinct=True)).filter(matched=len(skills))
+        students = students.filter(id__in=hits.values('student'))
+
+    if department:
+        students = students.filter(department_param_q(department))
+    if min_cgpa is not None:
+        students = students.filter(overall_cgpa__gte=min_cgpa)
+    if max_cgpa is not None:
+        students = students.filter(overall_cgpa__lte=max_cgpa)
+    return students
@@ -0,0 +1,59 @@
+import hashlib
+
+from django.core.cache import caches
+from django.db.models import Count, Exists, OuterRef, Q
+
+from .departments import department_q
+from .models import JobApplication, RegistrationRequest, Student
+
+
+def _cache():
+    return caches['teacher_dashboard']
+
+
+def _keys(department, branch_id):
+    # department_q matches on the branch when resolved, else on the text
+    # (iexact), so a row can show up under either key
+    label = hashlib.md5((department or '').lower().encode()).hexdigest()
+    keys = [f"teacher_dashboard:label:{label}"]
+    if branch_id:
+        keys.append(f"teacher_dashboard:branch:{branch_id}")
+    return keys
+
+
+def _key(department, branch_id):
+    return _keys(department, branch_id)[-1]
+
+
+def department_stats(department, branch_id):
+    """
+    Teacher dashboard counters for a department: one conditional aggregate
+    over its students and one count of its pending registrations. A student
+    is placed when an EXISTS probe finds a selected application, so
+    applications are never joined and de-duplicated.
+    """
+    q = department_q(department, branch_id)
+    selected = JobApplication.objects.filter(student=OuterRef('pk'), status='Selected')
+    active = Q(user__is_active=True)
+    stats = Student.objects.filter(q).aggregate(
+        total_students=Count('pk', filter=active),
+        placed_students=Count('pk', filter=Exists(selected)),
+        incomplete_profiles=Count('pk', filter=active & Q(profile_completion__lt=100)),
+    )
+    stats.update(RegistrationRequest.objects.filter(q, status='Pending').aggregate(pending_approvals=Count('pk')))
+    return stats
+
+
+def get_department_stats(department, branch_id):
+    """department_stats() through a short-TTL cache. Returns (stats, cached)."""
+    key = _key(department, branch_id)
+    stats = _cache().get(key)
+    if stats is not None:
+        return stats, True
+    stats = department_stats(department, branch_id)
+    _cache().set(key, stats)
+    return stats, False
+
+
+def invalidate_department_stats(department, branch_id):
+    _cache().delete_many(_keys(department, branch_id))
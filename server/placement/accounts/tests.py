@@ -1,3 +1,773 @@
-from django.test import TestCase
+import functools
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from captcha.models import CaptchaStore
+from django.conf import settings
+from django.core.cache import caches
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, resolve
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from .models import (
+    DrivePoster, Interview, Job, JobApplication, Notification, PlacementOfficer,
+    RegistrationRequest, ResumeText, SemesterResult, Student, Teacher, User,
+)
+
+# Seeded volumes. Every budget below must hold at these sizes, so a view
+# that issues a query per row (student, job, interview, ...) fails here.
+STUDENTS = 40
+TEACHERS = 12
+JOBS = 20
+APPLICATIONS_PER_STUDENT = 3
+INTERVIEWS = 10
+STUDENTS_PER_INTERVIEW = 8
+PENDING_REQUESTS = 15
+NOTIFICATIONS_PER_USER = 15
+
+STUDENT_PHONE = '9000000000'
+TEACHER_PHONE = '8000000000'
+OFFICER_PHONE = '6000000000'
+PASSWORD = 'Placement@123'
+
+# Maximum number of queries per route:
+# (method, path, payload, max queries). Paths and payloads are formatted
+# with the ids of the seeded rows, see QueryBudgetTests.ids().
+QUERY_BUDGETS = [
+    # accounts
+    ('post', '/api/accounts/register/', {
+        'role': 'student', 'full_name': 'New Student', 'phone': '9111111111', 'email': 'new@gmail.com',
+        'password': PASSWORD, 'dob': '2004-01-01', 'gender': 'Female', 'college': 'GPTC', 'department': 'CT',
+        'course': 'Diploma', 'semester': '5', 'roll_no': '2200000099',
+        'captcha_key': '{captcha_key}', 'captcha_value': '{captcha_value}',
+    }, 8),
+    ('post', '/api/accounts/login/', {'phone': STUDENT_PHONE, 'password': PASSWORD, 'role': 'student'}, 2),
+    ('get', f'/api/accounts/notifications/?phone={STUDENT_PHONE}', None, 2),
+    ('get', '/api/accounts/captcha/', None, 1),
+    ('post', '/api/accounts/student-action/', {'student_id': '{student}', 'action': 'blacklist'}, 9),
+
+    # student portal
+    ('get', f'/api/student/dashboard/?phone={STUDENT_PHONE}', None, 6),
+    ('get', '/api/student/dashboard/cache-stats/', None, 0),
+    ('get', f'/api/student/jobs/search/?phone={STUDENT_PHONE}&q=pyth dev', None, 5),
+    ('post', '/api/student/apply/', {'phone': STUDENT_PHONE, 'job_id': '{open_job}'}, 10),
+    ('get', f'/api/student/calendar/?phone={STUDENT_PHONE}&start={{today}}&end={{next_month}}', None, 3),
+    ('get', f'/api/student/notifications/?phone={STUDENT_PHONE}', None, 2),
+    ('get', f'/api/student/notifications/?phone={STUDENT_PHONE}&page_size=5', None, 2),
+    ('get', f'/api/student/profile/?phone={STUDENT_PHONE}', None, 4),
+    ('patch', '/api/student/profile/', {'phone': STUDENT_PHONE, 'skills': 'python, django, sql'}, 6),
+    ('get', f'/api/student/ats-status/?phone={STUDENT_PHONE}', None, 2),
+    ('get', f'/api/student/ai-suggestions/?phone={STUDENT_PHONE}', None, 1),
+
+    # teacher portal
+    ('get', f'/api/teacher/dashboard/?phone={TEACHER_PHONE}', None, 3),
+    ('get', f'/api/teacher/registrations/pending/?phone={TEACHER_PHONE}', None, 2),
+    ('post', '/api/teacher/registrations/approve/', {'student_id': '{request}'}, 15),
+    ('post', '/api/teacher/registrations/reject/', {'student_id': '{request}'}, 3),
+    ('get', f'/api/teacher/profile/?phone={TEACHER_PHONE}', None, 2),
+    ('get', f'/api/teacher/students/?phone={TEACHER_PHONE}', None, 2),
+    ('get', f'/api/teacher/interviews/?phone={TEACHER_PHONE}', None, 4),
+    ('post', '/api/teacher/interviews/select-students/', {'interview_id': '{interview}', 'student_ids': '{students}'}, 6),
+    ('post', '/api/teacher/announcement/', {'phone': TEACHER_PHONE, 'title': 'Drive', 'message': 'Tomorrow'}, 3),
+    ('post', '/api/teacher/alert-incomplete-profiles/', {'phone': TEACHER_PHONE}, 4),
+
+    # placement portal
+    ('get', '/api/placement/dashboard/', None, 5),
+    ('get', f'/api/placement/profile/?phone={OFFICER_PHONE}', None, 2),
+    ('get', '/api/placement/', None, 0),
+    ('get', '/api/placement/jobs/', None, 4),
+    ('get', '/api/placement/jobs/?page_size=5', None, 4),
+    ('post', '/api/placement/jobs/', {
+        'company': 'Acme', 'role': 'Developer', 'location': 'Kochi', 'job_type': 'Full Time', 'salary': '4 LPA',
+        'description': 'Python developer', 'skills_required': 'python, django', 'allowed_departments': 'CT, EL',
+        'deadline': '{deadline}',
+    }, 13),
+    ('get', '/api/placement/jobs/{job}/', None, 2),
+    ('get', '/api/placement/jobs/{job}/applicants/', None, 3),
+    ('get', '/api/placement/jobs/{job}/applicants/?status=Applied&min_cgpa=7&ordering=-cgpa', None, 3),
+    ('get', '/api/placement/jobs/{job}/export_pdf/', None, 3),
+    ('get', '/api/placement/interviews/', None, 3),
+    ('get', '/api/placement/interviews/?department=CT', None, 3),
+    ('get', '/api/placement/interviews/{interview}/', None, 3),
+    ('get', '/api/placement/posters/', None, 3),
+    ('get', '/api/placement/posters/{poster}/', None, 1),
+    ('get', '/api/placement/students/', None, 3),
+    ('get', '/api/placement/students/?page_size=10', None, 3),
+    ('get', '/api/placement/students/?stream=json', None, 1),
+    ('get', '/api/placement/students/search/?skills=python,sql&match=any', None, 1),
+    ('get', '/api/placement/teachers/', None, 3),
+    ('get', '/api/placement/departments/', None, 4),
+    ('get', '/api/placement/applications/', None, 3),
+    ('get', '/api/placement/applications/?stream=ndjson', None, 1),
+    ('get', '/api/placement/students/export/', None, 1),
+    ('get', '/api/placement/teachers/export/', None, 1),
+    ('get', '/api/placement/applications/export/', None, 1),
+    ('get', '/api/placement/analysis/', None, 1),
+]
+
+# API routes deliberately left without a budget
+UNBUDGETED = {
+    'api/student/web-search/': "queries an external search engine, not the database",
+}
+
+
+RESUME_LINES = [
+    "Anjali Nair",
+    "SUMMARY",
+    "Diploma student looking for a developer role.",
+    "SKILLS",
+    "python, django, sql, html, css, git",
+    "PROJECTS",
+    "- Built a placement portal in python and django with a team of four.",
+]
+
+
+def clear_caches():
+    for alias in settings.CACHES:
+        caches[alias].clear()
+
+
+def use_temp_media(test):
+    # Uploaded resumes land in a throwaway MEDIA_ROOT
+    media = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, media, ignore_errors=True)
+    override = override_settings(MEDIA_ROOT=media)
+    override.enable()
+    test.addCleanup(override.disable)
+
+
+def make_student(phone, department='CT', password=None, **fields):
+    user = User.objects.create_user(
+        phone=phone, email=f"{phone}@gmail.com", full_name=f"Student {phone}", role='student', password=password,
+    )
+    values = {
+        'dob': '2004-01-01', 'gender': 'Male', 'college': 'GPTC', 'course': 'Diploma', 'semester': '5',
+        'roll_no': phone, 'overall_cgpa': 7.5, 'skills': 'python, sql', 'profile_completion': 60,
+    }
+    values.update(fields)
+    return Student.objects.create(user=user, department=department, **values)
+
+
+def make_job(company='Acme', days=10, **fields):
+    values = {
+        'role': 'Software Developer', 'location': 'Kochi', 'job_type': 'Full Time', 'salary': '4 LPA',
+        'description': 'Python and SQL developer', 'skills_required': 'python, sql',
+        'allowed_departments': 'CT, EL',
+    }
+    values.update(fields)
+    return Job.objects.create(company=company, deadline=timezone.now() + timedelta(days=days), **values)
+
+
+def resume_upload(lines=RESUME_LINES, name='resume.txt'):
+    if name.endswith('.pdf'):
+        from .management.commands.benchmark_ats import _build_pdf
+        return SimpleUploadedFile(name, _build_pdf(lines), content_type='application/pdf')
+    return SimpleUploadedFile(name, "\n".join(lines).encode(), content_type='text/plain')
+
+
+def _route(route):
+    # Router patterns are regexes; compare them without their anchors
+    return route.replace('^', '').replace('$', '')
+
+
+def _api_routes(patterns, prefix=''):
+    for pattern in patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLResolver):
+            yield from _api_routes(pattern.url_patterns, route)
+        elif route.startswith('api/') and 'format' not in route:
+            yield _route(route)
+
+
+def _format(value, ids):
+    if isinstance(value, dict):
+        return {key: _format(item, ids) for key, item in value.items()}
+    if isinstance(value, str) and value.startswith('{') and value.endswith('}') and value[1:-1] in ids:
+        return ids[value[1:-1]]
+    if isinstance(value, str):
+        return value.format(**ids)
+    return value
+
+
+# Budgets count the app's own queries; cache reads and writes would add a
+# constant that depends on SHARED_CACHE_URL, so the suite runs on LocMem
+LOCMEM_CACHES = {
+    alias: {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': f'budget-{alias}'}
+    for alias in settings.CACHES
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        departments = ['CT', 'EL']
+
+        jobs = [
+            Job.objects.create(
+                company=f"Company {i}", role="Software Developer", location="Kochi", job_type="Full Time",
+                salary="4 LPA", description="Python and SQL developer", skills_required="python, sql",
+                allowed_departments="CT, EL", deadline=now + timedelta(days=10 + i),
+            ) for i in range(JOBS)
+        ]
+
+        students = []
+        for i in range(STUDENTS):
+            user = User.objects.create_user(
+                phone=f"9{i:09d}", email=f"student{i}@gmail.com", full_name=f"Student {i}",
+                role='student', password=PASSWORD if i == 0 else None,
+            )
+            student = Student.objects.create(
+                user=user, dob='2004-01-01', gender='Male', college='GPTC', department=departments[i % 2],
+                course='Diploma', semester='5', roll_no=f"22{i:08d}", overall_cgpa=7.5, skills='python, sql',
+                profile_completion=60,
+            )
+            SemesterResult.objects.create(student=student, semester='1', gpa=7.5, credits=20)
+            students.append(student)
+            for job in jobs[i % (JOBS - APPLICATIONS_PER_STUDENT):][:APPLICATIONS_PER_STUDENT]:
+                JobApplication.objects.create(student=student, job=job)
+
+        for i in range(TEACHERS):
+            user = User.objects.create_user(
+                phone=f"8{i:09d}", email=f"teacher{i}@gmail.com", full_name=f"Teacher {i}", role='teacher',
+            )
+            Teacher.objects.create(
+                user=user, designation='Lecturer', qualification='M.Tech', department=departments[i % 2],
+                experience='5', position='Staff',
+            )
+
+        user = User.objects.create_user(phone=OFFICER_PHONE, email='officer@gmail.com', full_name='Officer', role='placement')
+        PlacementOfficer.objects.create(user=user, designation='TPO', office_role='Officer', experience='10', college='GPTC')
+
+        for i in range(PENDING_REQUESTS):
+            RegistrationRequest.objects.create(
+                full_name=f"Applicant {i}", email=f"applicant{i}@gmail.com", phone=f"7{i:09d}", password='x',
+                dob='2004-01-01', gender='Female', college='GPTC', department='CT', course='Diploma',
+                semester='5', roll_no=f"23{i:08d}",
+            )
+
+        for i in range(INTERVIEWS):
+            interview = Interview.objects.create(
+                company=f"Company {i}", role="Developer", department=departments[i % 2],
+                date_time=now + timedelta(days=i + 1), meeting_link="https://meet.example.com/x",
+            )
+            interview.selected_students.set(students[i:i + STUDENTS_PER_INTERVIEW])
+
+        for user in User.objects.filter(phone__in=[STUDENT_PHONE, TEACHER_PHONE]):
+            Notification.objects.bulk_create([
+                Notification(user=user, title=f"Job posted {i}", message="New drive") for i in range(NOTIFICATIONS_PER_USER)
+            ])
+
+        DrivePoster.objects.create(title="Campus drive", image='posters/drive.png')
+
+    def setUp(self):
+        self.client = APIClient()
+        clear_caches()
+
+    def ids(self):
+        student = Student.objects.get(user__phone=STUDENT_PHONE)
+        captcha = CaptchaStore.objects.get(hashkey=CaptchaStore.generate_key())
+        return {
+            'student': student.pk,
+            'students': list(Student.objects.order_by('id').values_list('id', flat=True)[:STUDENTS_PER_INTERVIEW]),
+            'job': Job.objects.order_by('id').first().pk,
+            'open_job': Job.objects.exclude(applicants__student=student).order_by('id').first().pk,
+            'interview': Interview.objects.order_by('id').first().pk,
+            'poster': DrivePoster.objects.first().pk,
+            'request': RegistrationRequest.objects.order_by('id').first().pk,
+            'captcha_key': captcha.hashkey,
+            'captcha_value': captcha.response,
+            'deadline': (timezone.now() + timedelta(days=30)).isoformat(),
+            'today': timezone.localdate().isoformat(),
+            'next_month': (timezone.localdate() + timedelta(days=31)).isoformat(),
+        }
+
+    def test_every_api_route_has_a_budget(self):
+        budgeted = {_route(resolve(path.split('?')[0].format(**self.ids())).route) for _, path, _, _ in QUERY_BUDGETS}
+        missing = [r for r in _api_routes(get_resolver().url_patterns) if r not in budgeted and r not in UNBUDGETED]
+        self.assertEqual(missing, [], "Add these routes to QUERY_BUDGETS")
+
+    def test_query_budgets(self):
+        from placement_portal.views import REPORTLAB_AVAILABLE
+
+        for method, path, payload, budget in QUERY_BUDGETS:
+            if 'export' in path and not REPORTLAB_AVAILABLE:
+                continue
+            with self.subTest(method=method, path=path):
+                ids = self.ids()
+                url = path.format(**ids)
+                data = _format(payload, ids) if payload else None
+
+                # Each route runs against the same seeded rows
+                with transaction.atomic():
+                    with CaptureQueriesContext(connection) as ctx:
+                        response = getattr(self.client, method)(url, data, format='json')
+                        if response.streaming:
+                            b''.join(response.streaming_content)
+                    transaction.set_rollback(True)
+
+                self.assertLess(response.status_code, 400, getattr(response, 'data', None))
+                self.assertLessEqual(
+                    len(ctx), budget,
+                    f"{method.upper()} {url} ran {len(ctx)} queries (budget {budget}):\n"
+                    + "\n".join(q['sql'] for q in ctx.captured_queries),
+                )
+
+
+class ResumeTextStoreTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+
+    def test_same_bytes_are_extracted_once(self):
+        from . import resume_store
+
+        with mock.patch.object(resume_store, 'extract_resume', wraps=resume_store.extract_resume) as extract:
+            first_hash, first_text = resume_store.store_resume_text(resume_upload(name='a.txt'))
+            second_hash, second_text = resume_store.store_resume_text(resume_upload(name='b.txt'))
+
+        self.assertEqual(extract.call_count, 1)
+        self.assertEqual(first_hash, second_hash)
+        self.assertEqual(first_text, second_text)
+        self.assertIn("placement portal", first_text)
+        self.assertEqual(ResumeText.objects.filter(sha256=first_hash).count(), 1)
+
+    def test_legacy_resume_is_parsed_once_and_hash_backfilled(self):
+        from .resume_store import get_student_resume_text, hash_resume_file
+
+        student = make_student('9100000001')
+        student.resume.save('legacy.txt', resume_upload(), save=False)
+        Student.objects.filter(pk=student.pk).update(resume=student.resume.name)
+
+        self.assertIn("placement portal", get_student_resume_text(student))
+        expected = hash_resume_file(resume_upload())
+        self.assertEqual(Student.objects.get(pk=student.pk).resume_hash, expected)
+        with mock.patch('accounts.resume_store.extract_resume') as extract:
+            get_student_resume_text(Student.objects.get(pk=student.pk))
+        extract.assert_not_called()
+
+
+class _ParsedDoc(list):
+    # Stand-in for a spaCy Doc with no tokens or entities
+    ents = ()
+
+
+class SingleParseTests(SimpleTestCase):
+    def setUp(self):
+        from . import ats_utils
+        ats_utils._parse_cache.clear()
+        self.addCleanup(ats_utils._parse_cache.clear)
+
+    def test_each_text_is_parsed_once_across_stages_and_calls(self):
+        from . import ats_utils
+
+        parsed = []
+
+        def nlp(text):
+            parsed.append(text)
+            return _ParsedDoc()
+
+        resume = "\n".join(RESUME_LINES)
+        with mock.patch.object(ats_utils, 'get_nlp', return_value=nlp):
+            first = ats_utils.calculate_ats_score(resume, branch="CT")
+            second = ats_utils.calculate_ats_score(resume, branch="CT")
+            ats_utils.extract_skills(resume, "CT")
+
+        self.assertEqual(first, second)
+        # The resume and the CT default JD, each parsed a single time
+        self.assertEqual(len(parsed), 2)
+        self.assertEqual(set(parsed), {ats_utils.normalize_text(resume), ats_utils.normalize_text(ats_utils.DEFAULT_JD["CT"])})
+
+
+class LazyImportTests(SimpleTestCase):
+    def test_scoring_modules_import_without_the_heavy_libraries(self):
+        code = (
+            "import sys, django; django.setup(); "
+            "import accounts.ats_utils, accounts.ats_index, accounts.ats_queue, accounts.matching; "
+            "print(','.join(m for m in ('spacy', 'sklearn', 'pdfminer', 'docx') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=settings.BASE_DIR,
+            env={**os.environ, 'DJANGO_SETTINGS_MODULE': 'placement.settings'},
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), '')
+
+
+class SkillMatcherTests(SimpleTestCase):
+    def test_skills_only_match_whole_terms(self):
+        from .ats_utils import SkillMatcher
+        matcher = SkillMatcher(['java', 'c', 'c++', 'sql'])
+        self.assertEqual(matcher.find("javascript, c++ and nosql"), ['c++'])
+        self.assertEqual(matcher.find("java, c and sql"), ['java', 'c', 'sql'])
+
+    def test_plurals_and_skills_inside_longer_ones(self):
+        from .ats_utils import SkillMatcher
+        matcher = SkillMatcher(['operating system', 'mongodb', 'mongodb compass'])
+        self.assertEqual(
+            matcher.find("used mongodb compass on both operating systems"),
+            ['operating system', 'mongodb', 'mongodb compass'],
+        )
+
+    def test_missing_skills_follow_the_branch_list(self):
+        from .ats_utils import extract_skills, find_missing_skills
+        resume_skills = extract_skills("Projects in Python and React", "CT")
+        self.assertEqual(sorted(resume_skills), ['python', 'react'])
+        self.assertEqual(find_missing_skills(resume_skills, "Python, Django and SQL developer", "CT"), ['django', 'sql'])
+
+
+class JdVectorTests(TestCase):
+    def test_job_vector_is_reused_until_the_job_is_edited(self):
+        from . import ats_utils
+        from .ats_index import ensure_corpus, job_text, job_vector_key
+
+        job = make_job(description="Embedded C developer")
+        ensure_corpus()
+        key = job_vector_key(job.pk)
+        vector = ats_utils.get_jd_vector(ats_utils.normalize_text(job_text(job)), key)
+        self.assertIs(ats_utils.get_jd_vector(ats_utils.normalize_text(job_text(job)), key), vector)
+
+        job.description = "React developer"
+        job.save()
+        self.assertNotIn(key, ats_utils._jd_vectors)
+
+    def test_corpus_is_refitted_only_when_jobs_change(self):
+        from . import ats_utils
+        from .ats_index import ensure_corpus
+
+        make_job()
+        ensure_corpus()
+        vectorizer = ats_utils.get_tfidf_vectorizer()
+        ensure_corpus()
+        self.assertIs(ats_utils.get_tfidf_vectorizer(), vectorizer)
+
+        make_job(company="Beta", description="Kubernetes operator")
+        ensure_corpus()
+        self.assertIsNot(ats_utils.get_tfidf_vectorizer(), vectorizer)
+        self.assertIn("kubernetes", ats_utils.get_tfidf_vectorizer().vocabulary_)
+
+    def test_deadline_edits_keep_the_fit_and_the_vector(self):
+        from . import ats_utils
+        from .ats_index import ensure_corpus, job_text, job_vector_key
+
+        job = make_job(description="Embedded C developer")
+        ensure_corpus()
+        vectorizer = ats_utils.get_tfidf_vectorizer()
+        key = job_vector_key(job.pk)
+        vector = ats_utils.get_jd_vector(ats_utils.normalize_text(job_text(job)), key)
+
+        job.deadline += timedelta(days=5)
+        job.save()
+        ensure_corpus()
+        self.assertIs(ats_utils.get_tfidf_vectorizer(), vectorizer)
+        self.assertIs(ats_utils.get_jd_vector(ats_utils.normalize_text(job_text(job)), key), vector)
+
+        job.skills_required = "embedded c, rtos"
+        job.save()
+        ensure_corpus()
+        self.assertIsNot(ats_utils.get_tfidf_vectorizer(), vectorizer)
+
+    def test_vectors_from_an_older_fit_are_not_reused(self):
+        from . import ats_utils
+
+        ats_utils.fit_tfidf_corpus()
+        old_fit = ats_utils.get_fitted_vectorizer()
+        ats_utils.fit_tfidf_corpus(["Kubernetes operator"])
+        # Transformed with the old vocabulary, e.g. by a thread racing the refit
+        stale = ats_utils.get_jd_vector("kubernetes operator", "job:stale", old_fit)
+        self.assertNotIn("job:stale", ats_utils._jd_vectors)
+
+        current = ats_utils.get_jd_vector("kubernetes operator", "job:stale")
+        self.assertNotEqual(current.shape, stale.shape)
+        self.assertEqual(current.shape[1], len(ats_utils.get_tfidf_vectorizer().vocabulary_))
+
+
+def attach_resume(student, lines=RESUME_LINES):
+    """Points a student at a stored resume text without going through an upload."""
+    import hashlib
+    text = "\n".join(lines)
+    resume_hash = hashlib.sha256(text.encode()).hexdigest()
+    ResumeText.objects.get_or_create(sha256=resume_hash, defaults={'text': text})
+    Student.objects.filter(pk=student.pk).update(resume=f"resumes/{resume_hash}.txt", resume_hash=resume_hash)
+    student.refresh_from_db()
+    return student
+
+
+class JobMatchTests(TestCase):
+    def test_matches_rank_eligible_jobs_by_score(self):
+        from .matching import rebuild_job_matches
+
+        student = attach_resume(make_student('9100000007'))
+        python = make_job("Python Co", description="Python Django developer", skills_required="python, django")
+        make_job("Cad Co", description="AutoCAD draughtsman", skills_required="autocad")
+        make_job("Electrical Co", description="Python Django developer", allowed_departments="EL")
+
+        self.assertEqual(rebuild_job_matches(students=[student]), 2)
+        matches = list(student.job_matches.order_by('rank').values_list('job__company', 'rank'))
+        self.assertEqual(matches, [("Python Co", 1), ("Cad Co", 2)])
+        self.assertEqual(student.job_matches.get(rank=1).job, python)
+
+    def test_top_n_bounds_the_stored_matches(self):
+        from .matching import rebuild_job_matches
+
+        student = attach_resume(make_student('9100000008'))
+        for i in range(4):
+            make_job(f"Company {i}")
+        self.assertEqual(rebuild_job_matches(students=[student], top_n=3), 3)
+        self.assertEqual(sorted(student.job_matches.values_list('rank', flat=True)), [1, 2, 3])
+
+
+class RescoreAtsCommandTests(TestCase):
+    def rescore(self, *args):
+        out = io.StringIO()
+        call_command('rescore_ats', '--workers', '1', *args, stdout=out)
+        return out.getvalue()
+
+    def test_only_stale_scores_are_recomputed(self):
+        from .ats_utils import ATS_MODEL_VERSION
+
+        stale = attach_resume(make_student('9100000010'))
+        current = attach_resume(make_student('9100000011'))
+        Student.objects.filter(pk=current.pk).update(
+            ats_score=42, ats_scored_hash=current.resume_hash, ats_model_version=ATS_MODEL_VERSION,
+            ats_scored_branch='CT',
+        )
+
+        self.assertIn("Rescored 1 resumes", self.rescore())
+        stale.refresh_from_db()
+        current.refresh_from_db()
+        self.assertGreater(stale.ats_score, 0)
+        self.assertEqual(stale.ats_model_version, ATS_MODEL_VERSION)
+        self.assertEqual(current.ats_score, 42)
+
+        self.assertIn("Rescored 2 resumes", self.rescore('--force'))
+        current.refresh_from_db()
+        self.assertNotEqual(current.ats_score, 42)
+
+    def test_scores_for_another_branch_are_stale(self):
+        from .ats_utils import ATS_MODEL_VERSION
+
+        student = attach_resume(make_student('9100000014', department='EL'))
+        Student.objects.filter(pk=student.pk).update(
+            ats_score=42, ats_scored_hash=student.resume_hash, ats_model_version=ATS_MODEL_VERSION,
+            ats_scored_branch='CT',
+        )
+        self.assertIn("Rescored 1 resumes", self.rescore())
+        student.refresh_from_db()
+        self.assertEqual(student.ats_scored_branch, 'EL')
+        self.assertIn("Rescored 0 resumes", self.rescore())
+
+    def test_dry_run_and_department_filter(self):
+        ct = attach_resume(make_student('9100000012', department='CT'))
+        el = attach_resume(make_student('9100000013', department='EL'))
+
+        output = self.rescore('--department', 'CT', '--dry-run')
+        self.assertIn("Rescored 1 resumes", output)
+        self.assertIn("would change 1", output)
+        self.assertIn(f"Student {ct.pk}:", output)
+        self.assertNotIn(f"Student {el.pk}:", output)
+        self.assertFalse(Student.objects.exclude(ats_model_version='').exists())
+
+    def test_changed_since_and_undated_uploads(self):
+        from django.core.management import CommandError
+
+        recent = attach_resume(make_student('9100000015'))
+        Student.objects.filter(pk=recent.pk).update(resume_uploaded_at=timezone.now())
+        undated = attach_resume(make_student('9100000016'))
+        old = attach_resume(make_student('9100000017'))
+        Student.objects.filter(pk=old.pk).update(resume_uploaded_at=timezone.now() - timedelta(days=30))
+        since = (timezone.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+
+        output = self.rescore('--changed-since', since, '--dry-run')
+        self.assertIn("Rescored 1 resumes", output)
+        self.assertIn(f"Student {recent.pk}:", output)
+
+        output = self.rescore('--changed-since', since, '--include-undated', '--dry-run')
+        self.assertIn("Rescored 2 resumes", output)
+        self.assertIn(f"Student {undated.pk}:", output)
+        self.assertNotIn(f"Student {old.pk}:", output)
+
+        with self.assertRaises(CommandError):
+            self.rescore('--include-undated')
+
+
+class BenchmarkAtsCommandTests(SimpleTestCase):
+    def test_count_must_be_positive(self):
+        from django.core.management import CommandError
+        with self.assertRaisesMessage(CommandError, "--count must be at least 1"):
+            call_command('benchmark_ats', '--count', '0', stdout=io.StringIO())
+
+    def test_summary_without_samples(self):
+        from .management.commands.benchmark_ats import _percentile, _summary
+        self.assertIsNone(_percentile([], 95))
+        self.assertEqual(_summary([], []), {
+            "docs": 0, "p50_ms": None, "p95_ms": None, "mean_ms": None, "docs_per_sec": None, "peak_mem_kb": None,
+        })
+
+    def test_small_run_writes_results(self):
+        import json
+
+        output = os.path.join(tempfile.mkdtemp(), 'bench.json')
+        self.addCleanup(shutil.rmtree, os.path.dirname(output), ignore_errors=True)
+        call_command('benchmark_ats', '--count', '1', '--formats', 'txt', '--no-memory', '--output', output,
+                     stdout=io.StringIO())
+        with open(output) as f:
+            results = json.load(f)
+        summary = results["stages"]["calculate_ats_score"]["txt"]
+        self.assertGreater(summary["docs"], 0)
+        self.assertLessEqual(summary["p50_ms"], summary["p95_ms"])
+
+
+class RecommendationCacheTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.client = APIClient()
+        self.student = attach_resume(make_student('9100000020'))
+        self.job = make_job()
+
+    def generated(self):
+        from . import recommendations
+        return mock.patch.object(
+            recommendations, 'generate_recommendations', wraps=recommendations.generate_recommendations
+        )
+
+    def test_repeated_profile_views_reuse_the_suggestions(self):
+        with self.generated() as generate:
+            first = self.client.get('/api/student/profile/?phone=9100000020')
+            second = self.client.get('/api/student/profile/?phone=9100000020')
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(
+            first.data['recommendations']['rule_suggestions'], second.data['recommendations']['rule_suggestions'],
+        )
+
+    def test_job_edit_and_new_resume_miss_the_cache(self):
+        from .recommendations import get_rule_suggestions
+
+        with self.generated() as generate:
+            get_rule_suggestions(self.student, "python", self.job)
+            get_rule_suggestions(self.student, "python", self.job)
+            self.assertEqual(generate.call_count, 1)
+
+            self.job.skills_required = "python, sql, docker"
+            self.job.save()
+            self.job.refresh_from_db()
+            suggestions = get_rule_suggestions(self.student, "python", self.job)
+            self.assertEqual(generate.call_count, 2)
+            self.assertIn("Add missing skills: sql, docker", suggestions)
+
+            attach_resume(self.student, RESUME_LINES + ["docker"])
+            get_rule_suggestions(self.student, "python", self.job)
+            self.assertEqual(generate.call_count, 3)
+
+
+@override_settings(AI_SUGGESTION_BACKEND='local', AI_SUGGESTION_TIMEOUT=1, AI_SUGGESTION_LOCAL_DELAY=0,
+                   AI_SUGGESTION_LOCAL_FAIL=False)
+class AiSuggestionTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.client = APIClient()
+        self.student = attach_resume(make_student('9100000030'))
+        make_job()
+
+    def poll(self):
+        import time
+        for _ in range(50):
+            data = self.client.get('/api/student/ai-suggestions/?phone=9100000030').data
+            if data['ai_status'] != 'pending':
+                return data
+            time.sleep(0.05)
+        return data
+
+    def test_rule_suggestions_come_at_once_and_ai_text_follows(self):
+        profile = self.client.get('/api/student/profile/?phone=9100000030').data
+        self.assertTrue(profile['recommendations']['rule_suggestions'])
+        self.assertIn(profile['recommendations']['ai_status'], ('pending', 'ready'))
+
+        data = self.poll()
+        self.assertEqual(data['ai_status'], 'ready')
+        self.assertIn("Quantify your work", data['ai_suggestions'])
+
+    @override_settings(AI_SUGGESTION_TIMEOUT=0.1, AI_SUGGESTION_LOCAL_DELAY=0.3)
+    def test_slow_backend_times_out(self):
+        self.assertEqual(self.client.get('/api/student/ai-suggestions/?phone=9100000030').data['ai_status'], 'pending')
+        data = self.poll()
+        self.assertEqual(data['ai_status'], 'timeout')
+        self.assertIsNone(data['ai_suggestions'])
+
+    @override_settings(AI_SUGGESTION_LOCAL_FAIL=True)
+    def test_failing_backend_reports_failed_and_blocking_call_falls_back(self):
+        from .ai_suggestions import FALLBACK_SUGGESTION, get_ai_suggestions
+
+        data = self.poll()
+        self.assertEqual(data['ai_status'], 'failed')
+        self.assertIsNone(data['ai_suggestions'])
+        self.assertEqual(get_ai_suggestions("some resume text"), FALLBACK_SUGGESTION)
+
+    def test_pending_entry_from_another_process_is_not_resubmitted(self):
+        import time
+
+        from . import ai_suggestions
+
+        key = ai_suggestions.suggestion_key(Student.objects.get(pk=self.student.pk).resume_hash)
+        caches['ai_suggestions'].set(key, {"status": 'pending', "text": None, "started": time.time()})
+        with mock.patch.object(ai_suggestions, '_get_executor') as executor:
+            data = self.client.get('/api/student/ai-suggestions/?phone=9100000030').data
+        self.assertEqual(data['ai_status'], 'pending')
+        executor.assert_not_called()
+
+
+class ResumeExtractionBudgetTests(TestCase):
+    def pdf(self, pages):
+        lines = [f"Page {page} line {line}" for page in range(pages) for line in range(55)]
+        return resume_upload(lines, name='portfolio.pdf')
+
+    def test_truncated_only_when_pages_remain(self):
+        from .ats_utils import extract_resume
+
+        exact = extract_resume(self.pdf(3), max_pages=3)
+        self.assertEqual(exact.pages, 3)
+        self.assertFalse(exact.truncated)
+        self.assertIn("Page 2 line 0", exact.text)
+
+        longer = extract_resume(self.pdf(4), max_pages=3)
+        self.assertEqual(longer.pages, 3)
+        self.assertTrue(longer.truncated)
+        self.assertNotIn("Page 3", longer.text)
+
+    def test_character_budget_cuts_the_text(self):
+        from .ats_utils import extract_resume
+        result = extract_resume(self.pdf(2), max_chars=500)
+        self.assertTrue(result.truncated)
+        self.assertLessEqual(len(result.text), 500)
+
+    def test_byte_budget_fails_the_scoring_job_with_a_reason(self):
+        from .ats_utils import extract_resume
+
+        result = extract_resume(resume_upload(), max_bytes=10)
+        self.assertEqual(result.text, "")
+        self.assertFalse(result.truncated)
+        self.assertIn("over the 10 byte budget", result.error)
+
+        use_temp_media(self)
+        make_student('9100000040')
+        client = APIClient()
+        client.patch('/api/student/profile/', {'phone': '9100000040', 'resume': resume_upload()}, format='multipart')
+        tight = functools.partial(extract_resume, max_bytes=10)
+        with mock.patch('accounts.resume_store.extract_resume', tight):
+            call_command('run_ats_worker', '--once', stdout=io.StringIO())
+
+        status = client.get('/api/student/ats-status/?phone=9100000040').data
+        self.assertEqual(status['ats_status'], 'failed')
+        self.assertIn("over the 10 byte budget", status['error'])
+        self.assertFalse(ResumeText.objects.exists())
@@ -6,13 +6,7 @@ from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from .models import User, Teacher, Notification, Student, RegistrationRequest, PlacementOfficer
 from .serializers import UserRegistrationSerializer
-from .ats_utils import (
-    extract_resume_text,
-    calculate_ats_score,
-    extract_skills,
-    find_missing_skills,
-    check_resume_sections
-)
+from .pagination import paginated_response
 
 from django.contrib.auth.hashers import make_password
 from captcha.models import CaptchaStore
@@ -140,14 +134,16 @@ class RegisterView(APIView):
                 # Notify teachers of the department
                 department = student_data.get('department')
                 if department:
-                    teachers = Teacher.objects.filter(department__iexact=department)
-                    for teacher in teachers:
-                        Notification.objects.create(
-                            user=teacher.user,
+                    from .departments import department_param_q
+                    teachers = Teacher.objects.filter(department_param_q(department))
+                    Notification.objects.bulk_create([
+                        Notification(
+                            user_id=teacher.user_id,
                             title="New Registration Request",
                             message=f"Student {req.full_name} from {department} department has requested registration.",
                             extra_data=notification_payload
-                        )
+                        ) for teacher in teachers
+                    ])
 
                 return Response({
                     "message": "Registration request submitted. Please wait for teacher approval.",
@@ -183,7 +179,7 @@ class NotificationListView(APIView):
             return Response({"error": "Phone required"}, status=status.HTTP_400_BAD_REQUEST)
             
         notifications = Notification.objects.filter(user__phone=phone).order_by('-created_at')
-        data = [{
+        return paginated_response(request, notifications, lambda rows: [{
             "id": n.id,
             "title": n.title,
             "message": n.message,
@@ -191,9 +187,7 @@ class NotificationListView(APIView):
             "extra_data": n.extra_data,
             "created_at": n.created_at,
             "type": "registration_request" if n.extra_data and n.extra_data.get("type") == "registration_request" else ("info" if "Job" in n.title else "success")
-        } for n in notifications]
-        
-        return Response(data)
+        } for n in rows], view=self)
 
     def delete(self, request):
         phone = request.query_params.get('phone')
@@ -88,6 +88,68 @@ DATABASES = {
 }
 
 
+# Caches
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+# The dashboard caches are invalidated from other processes as well (the ATS
+# worker, rescore_ats, rebuild_job_matches) and AI suggestion polls may land
+# on any web process, so these caches need a backend every process shares: Redis at SHARED_CACHE_URL. With DEBUG and no URL set they
+# fall back to a per-process LocMem cache, which is only right for a single
+# runserver; the worker's invalidations then reach it through the TTLs.
+SHARED_CACHE_URL = config('SHARED_CACHE_URL', default='' if DEBUG else 'redis://127.0.0.1:6379/1')
+if SHARED_CACHE_URL:
+    SHARED_CACHE = {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': SHARED_CACHE_URL}
+else:
+    SHARED_CACHE = {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'placement-shared'}
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'placement-default',
+    },
+    # Memoized resume recommendations, see accounts/recommendations.py
+    'recommendations': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'placement-recommendations',
+        'TIMEOUT': 60 * 60 * 6,
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    },
+    # Pending/ready/failed state of async AI suggestions, see
+    # accounts/ai_suggestions.py. Shared, so a poll served by another process
+    # sees the job already submitted instead of starting it again.
+    'ai_suggestions': {
+        **SHARED_CACHE,
+        'KEY_PREFIX': 'ai',
+        'TIMEOUT': 60 * 60 * 6,
+    },
+    # Assembled student dashboards, see accounts/dashboard_cache.py. The short
+    # timeout bounds staleness from deadlines passing, which no signal covers.
+    'dashboard': {
+        **SHARED_CACHE,
+        'KEY_PREFIX': 'student',
+        'TIMEOUT': 60 * 5,
+    },
+    # Teacher dashboard counters per department, see accounts/teacher_dashboard.py.
+    # Signals drop entries on changes; the TTL covers queryset update()s.
+    'teacher_dashboard': {
+        **SHARED_CACHE,
+        'KEY_PREFIX': 'teacher',
+        'TIMEOUT': 60,
+    },
+}
+
+# AI resume suggestions, see accounts/ai_suggestions.py.
+# 'huggingface' needs HUGGINGFACE_API_KEY; 'local' is a deterministic
+# offline stand-in. Requests never wait on the backend; past the timeout
+# only the rule-based suggestions are shown.
+AI_SUGGESTION_BACKEND = config('AI_SUGGESTION_BACKEND', default='huggingface')
+AI_SUGGESTION_TIMEOUT = config('AI_SUGGESTION_TIMEOUT', default=8, cast=float)
+AI_SUGGESTION_WORKERS = config('AI_SUGGESTION_WORKERS', default=2, cast=int)
+AI_SUGGESTION_RETRY_AFTER = 300
+AI_SUGGESTION_LOCAL_DELAY = config('AI_SUGGESTION_LOCAL_DELAY', default=0, cast=float)
+AI_SUGGESTION_LOCAL_FAIL = config('AI_SUGGESTION_LOCAL_FAIL', default=False, cast=bool)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -146,4 +208,11 @@ REST_FRAMEWORK = {
         'user': '1000/day',
         'anon': '100/day'
     }
-}
\ No newline at end of file
+}
+# Keyset pagination for list endpoints (accounts.pagination); every listing
+# is paged, ?page_size= picks up to the max. Totals are estimated up to the cap.
+API_PAGE_SIZE = config('API_PAGE_SIZE', default=50, cast=int)
+API_MAX_PAGE_SIZE = config('API_MAX_PAGE_SIZE', default=500, cast=int)
+API_COUNT_ESTIMATE_CAP = config('API_COUNT_ESTIMATE_CAP', default=1000, cast=int)
+# Rows fetched per database round trip for ?stream=json|ndjson exports
+API_STREAM_CHUNK_SIZE = config('API_STREAM_CHUNK_SIZE', default=2000, cast=int)
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'placement.settings')
 
 application = get_wsgi_application()
+
+# Optional warm-up for prefork servers (e.g. gunicorn --preload): load the ATS
+# NLP model once in the master so workers share it copy-on-write.
+if os.environ.get('ATS_PRELOAD') == '1':
+    from accounts.ats_utils import warm_up
+    warm_up()
@@ -0,0 +1,253 @@
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from accounts.models import AtsScoringJob, JobApplication
+from accounts.tests import attach_resume, clear_caches, make_job, make_student
+from student_portal.tests import run_worker
+
+CAD_RESUME = ["Arjun Nair", "SKILLS", "autocad, surveying, estimation", "EXPERIENCE", "Draughtsman intern"]
+
+
+class ApplicantMatchScoreTests(TestCase):
+    def setUp(self):
+        clear_caches()
+        self.client = APIClient()
+        self.job = make_job()
+        self.python = attach_resume(make_student('9300000001'))
+        self.cad = attach_resume(make_student('9300000002'), CAD_RESUME)
+        self.late = make_student('9300000003')
+
+    def apply(self, student):
+        response = self.client.post('/api/student/apply/', {'phone': student.user.phone, 'job_id': self.job.id})
+        self.assertEqual(response.status_code, 201)
+
+    def applicants(self, **params):
+        return self.client.get(f'/api/placement/jobs/{self.job.id}/applicants/', params)
+
+    def ranked_ids(self, **params):
+        return [row['student_id'] for row in self.applicants(**params).data['applicants']]
+
+    def test_new_applications_are_scored_and_ranked_by_match(self):
+        self.apply(self.cad)
+        self.apply(self.python)
+        self.assertEqual(AtsScoringJob.objects.filter(job=self.job, student__isnull=False).count(), 2)
+        run_worker()
+        self.apply(self.late)
+
+        scores = dict(JobApplication.objects.values_list('student_id', 'match_score'))
+        self.assertGreater(scores[self.python.id], scores[self.cad.id])
+        self.assertIsNone(scores[self.late.id])
+        # Unscored applications go last in either direction
+        self.assertEqual(self.ranked_ids(), [self.python.id, self.cad.id, self.late.id])
+        self.assertEqual(self.ranked_ids(ordering='match_score'), [self.cad.id, self.python.id, self.late.id])
+
+    def test_applicants_without_a_resume_stay_unscored(self):
+        self.apply(self.late)
+        self.apply(self.python)
+        run_worker()
+
+        scores = dict(JobApplication.objects.values_list('student_id', 'match_score'))
+        self.assertIsNone(scores[self.late.id])
+        self.assertIsNotNone(scores[self.python.id])
+        self.assertEqual(self.ranked_ids(ordering='match_score'), [self.python.id, self.late.id])
+
+    def test_editing_the_description_rescores_every_applicant(self):
+        self.apply(self.python)
+        self.apply(self.cad)
+        run_worker()
+        self.assertEqual(self.ranked_ids()[0], self.python.id)
+
+        self.job.description = "AutoCAD draughtsman for surveying and estimation"
+        self.job.skills_required = "autocad, surveying, estimation"
+        self.job.save()
+        self.assertTrue(AtsScoringJob.objects.filter(job=self.job, student__isnull=True, status='pending').exists())
+        run_worker()
+        self.assertEqual(self.ranked_ids()[0], self.cad.id)
+
+    def test_unknown_ordering_is_rejected(self):
+        self.assertEqual(self.applicants(ordering='salary').status_code, 400)
+
+
+class StudentSkillSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.both = make_student('9300000011', skills='Verilog, PCB Design', department='EL', overall_cgpa=8.2)
+        self.verilog = make_student('9300000012', skills='verilog', department='EL', overall_cgpa=6.5)
+        self.ct = make_student('9300000013', skills='verilog, python', overall_cgpa=9.0)
+        for student in (self.both, self.verilog, self.ct):
+            self.client.patch('/api/student/profile/', {'phone': student.user.phone, 'skills': student.skills})
+
+    def search(self, **params):
+        response = self.client.get('/api/placement/students/search/', params)
+        self.assertEqual(response.status_code, 200)
+        return {row['id'] for row in response.data}
+
+    def test_all_and_any_queries(self):
+        self.assertEqual(self.search(skills='verilog,pcb design'), {self.both.id})
+        self.assertEqual(self.search(skills='pcb design,python', match='any'), {self.both.id, self.ct.id})
+
+    def test_department_and_cgpa_filters(self):
+        self.assertEqual(self.search(skills='verilog', department='EL'), {self.both.id, self.verilog.id})
+        self.assertEqual(self.search(skills='verilog', min_cgpa=7, max_cgpa=8.5), {self.both.id})
+
+    def test_profile_edits_reindex_the_student(self):
+        self.client.patch('/api/student/profile/', {'phone': self.verilog.user.phone, 'skills': 'pcb design'})
+        self.assertEqual(self.search(skills='verilog'), {self.both.id, self.ct.id})
+        self.assertEqual(self.search(skills='pcb design'), {self.both.id, self.verilog.id})
+
+    def test_resume_skills_are_indexed_by_the_worker(self):
+        attach_resume(self.verilog)
+        from accounts.ats_queue import enqueue_ats_scoring
+        enqueue_ats_scoring(self.verilog)
+        run_worker()
+        self.assertEqual(self.search(skills='django'), {self.verilog.id})
+
+    def test_invalid_parameters_are_rejected(self):
+        url = '/api/placement/students/search/'
+        self.assertEqual(self.client.get(url, {'skills': 'verilog', 'match': 'some'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'skills': 'verilog', 'min_cgpa': 'high'}).status_code, 400)
+
+
+@override_settings(API_PAGE_SIZE=2, API_MAX_PAGE_SIZE=3)
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.ids = [make_student(f"93000001{i:02d}").id for i in range(5)]
+
+    def page(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_listings_are_paged_by_default(self):
+        page = self.page('/api/placement/students/')
+        self.assertEqual([row['id'] for row in page['results']], self.ids[::-1][:2])
+        self.assertIsNone(page['previous'])
+        self.assertIsNotNone(page['next'])
+        self.assertEqual(len(self.page('/api/placement/students/', page_size=50)['results']), 3)
+
+    def test_next_and_previous_walk_the_whole_table_once(self):
+        seen, pages, url = [], [], '/api/placement/students/'
+        while url:
+            page = self.page(url)
+            pages.append(page)
+            seen += [row['id'] for row in page['results']]
+            url = page['next']
+        self.assertEqual(seen, self.ids[::-1])
+        self.assertEqual(len(pages), 3)
+
+        back = self.page(pages[-1]['previous'])
+        self.assertEqual(back['results'], pages[1]['results'])
+
+    def test_count_estimate_without_a_full_count(self):
+        page = self.page('/api/placement/students/')
+        self.assertGreaterEqual(page['count_estimate'], 5)
+        self.assertFalse(page['count_exact'])
+
+        from accounts.models import Notification
+        user = make_student('9300000199').user
+        Notification.objects.bulk_create([Notification(user=user, title='t', message='m') for _ in range(3)])
+        page = self.page('/api/student/notifications/', phone=user.phone)
+        self.assertEqual((page['count_estimate'], page['count_exact']), (3, True))
+        self.assertEqual(len(page['results']), 2)
+
+
+@override_settings(API_STREAM_CHUNK_SIZE=2)
+class StreamingExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.students = [make_student(f"93000002{i:02d}", overall_cgpa=7 + i / 10) for i in range(5)]
+        job = make_job()
+        for student in self.students[:3]:
+            JobApplication.objects.create(student=student, job=job)
+
+    def stream(self, url, fmt):
+        import json
+
+        response = self.client.get(url, {'stream': fmt})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        body = b''.join(response.streaming_content).decode()
+        if fmt == 'json':
+            self.assertEqual(response['Content-Type'], 'application/json')
+            return json.loads(body)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertTrue(body.endswith('\n'))
+        return [json.loads(line) for line in body.splitlines()]
+
+    def test_json_and_ndjson_carry_every_row(self):
+        for fmt in ('json', 'ndjson'):
+            rows = self.stream('/api/placement/students/', fmt)
+            self.assertEqual([row['id'] for row in rows], [s.id for s in self.students])
+            self.assertEqual(rows[0]['full_name'], self.students[0].user.full_name)
+            self.assertEqual(rows[4]['overall_cgpa'], 7.4)
+
+        rows = self.stream('/api/placement/applications/', 'ndjson')
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[0]['company'], 'Acme')
+        self.assertRegex(rows[0]['applied_on'], r'^\d{4}-\d{2}-\d{2}$')
+
+    def test_teachers_stream(self):
+        from teacher_portal.tests import make_teacher
+
+        teachers = [make_teacher(f"93000003{i:02d}", 'CT') for i in range(3)]
+        rows = self.stream('/api/placement/teachers/', 'json')
+        self.assertEqual([row['id'] for row in rows], [t.id for t in teachers])
+        self.assertEqual(rows[0]['full_name'], teachers[0].user.full_name)
+        self.assertEqual(rows[0]['designation'], 'Lecturer')
+
+    def test_empty_tables_stream_valid_documents(self):
+        JobApplication.objects.all().delete()
+        self.assertEqual(self.stream('/api/placement/applications/', 'json'), [])
+        response = self.client.get('/api/placement/applications/', {'stream': 'ndjson'})
+        self.assertEqual(b''.join(response.streaming_content), b'')
+
+    def test_unknown_formats_are_rejected(self):
+        self.assertEqual(self.client.get('/api/placement/students/', {'stream': 'csv'}).status_code, 400)
+
+
+class ApplicantsEndpointTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.job = make_job(min_cgpa=6)
+        rows = [('9300000301', 8.9, 0, 'Shortlisted', 71), ('9300000302', 7.1, 2, 'Applied', 55),
+                ('9300000303', 6.4, 0, 'Applied', 80)]
+        self.students = {}
+        for phone, cgpa, backlogs, status, score in rows:
+            student = make_student(phone, overall_cgpa=cgpa, total_backlogs=backlogs)
+            JobApplication.objects.create(student=student, job=self.job, status=status)
+            JobApplication.objects.filter(student=student).update(match_score=score)
+            self.students[phone] = student
+
+    def applicants(self, **params):
+        response = self.client.get(f'/api/placement/jobs/{self.job.id}/applicants/', params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def phones(self, **params):
+        return [row['phone'] for row in self.applicants(**params)['applicants']]
+
+    def test_job_header_once_and_student_details_per_row(self):
+        data = self.applicants()
+        self.assertEqual(data['job']['company'], 'Acme')
+        self.assertEqual(sorted(data['job']['departments']), ['CT', 'EL'])
+        self.assertEqual(data['count'], 3)
+        row = data['applicants'][0]
+        self.assertNotIn('job', row)
+        self.assertEqual(
+            (row['phone'], row['student_name'], row['cgpa'], row['backlogs'], row['match_score'], row['status']),
+            ('9300000303', 'Student 9300000303', Decimal('6.4'), 0, Decimal('80'), 'Applied'),
+        )
+
+    def test_filters_and_sorting(self):
+        self.assertEqual(self.phones(status='Applied', ordering='-cgpa'), ['9300000302', '9300000303'])
+        self.assertEqual(self.phones(min_cgpa=7, ordering='cgpa'), ['9300000302', '9300000301'])
+        self.assertEqual(self.phones(max_backlogs=0, min_score=75), ['9300000303'])
+        self.assertEqual(self.phones(status='Applied,Shortlisted', ordering='status'),
+                         ['9300000302', '9300000303', '9300000301'])
+
+    def test_non_numeric_filters_are_rejected(self):
+        response = self.client.get(f'/api/placement/jobs/{self.job.id}/applicants/', {'min_cgpa': 'seven'})
+        self.assertEqual(response.status_code, 400)
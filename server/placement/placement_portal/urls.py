@@ -4,7 +4,7 @@ from .views import (
     PlacementDashboardView, JobViewSet, PlacementOfficerProfileView,
     RegisteredStudentsView, TotalApplicationsView, ExportStudentsPDFView, ExportApplicationsPDFView,
     RegisteredTeachersView, ExportTeachersPDFView, DepartmentListView, InterviewViewSet,
-    DrivePosterViewSet, PlacementAnalysisView
+    DrivePosterViewSet, PlacementAnalysisView, StudentSkillSearchView
 )
 
 router = DefaultRouter()
@@ -18,6 +18,7 @@ urlpatterns = [
     path('profile/', PlacementOfficerProfileView.as_view(), name='placement-profile'),
     path('', include(router.urls)),
     path('students/', RegisteredStudentsView.as_view(), name='registered-students'),
+    path('students/search/', StudentSkillSearchView.as_view(), name='student-skill-search'),
     path('teachers/', RegisteredTeachersView.as_view(), name='registered-teachers'),
     path('departments/', DepartmentListView.as_view(), name='department-list'),
     path('applications/', TotalApplicationsView.as_view(), name='total-applications'),
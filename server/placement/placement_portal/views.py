@@ -3,12 +3,15 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from django.http import HttpResponse
+from django.db.models import Count, F, Prefetch, Q
 from accounts.models import Job, JobApplication, Student, PlacementOfficer, Teacher, Interview, DrivePoster, PlacementReport
-from accounts.serializers import JobSerializer, JobApplicationSerializer, InterviewSerializer, DrivePosterSerializer
+from accounts.serializers import JobSerializer, InterviewSerializer, DrivePosterSerializer
 from django.conf import settings
 import io
 import os
 from .analysis_utils import analyze_placement_data
+from accounts.pagination import KeysetPagination, paginated_response
+from accounts.streaming import STREAM_FORMATS, streaming_response
 
 # Try to import reportlab, if not available, we will handle it
 try:
@@ -24,6 +27,7 @@ except ImportError:
 class DrivePosterViewSet(viewsets.ModelViewSet):
     queryset = DrivePoster.objects.all().order_by('-posted_on')
     serializer_class = DrivePosterSerializer
+    pagination_class = KeysetPagination
 
     def perform_create(self, serializer):
         phone = self.request.data.get('phone')
@@ -52,18 +56,84 @@ class PlacementDashboardView(APIView):
         return Response(data)
 
 class JobViewSet(viewsets.ModelViewSet):
-    queryset = Job.objects.all().order_by('-posted_on')
+    queryset = Job.objects.all().prefetch_related('branches').order_by('-posted_on')
     serializer_class = JobSerializer
+    pagination_class = KeysetPagination
     
     def get_serializer_class(self):
         return JobSerializer
 
+    # ?ordering= values accepted by the applicants action, prefix with - to reverse
+    APPLICANT_ORDERING = {
+        'match_score': 'match_score',
+        'applied_on': 'applied_on',
+        'cgpa': 'student__overall_cgpa',
+        'ats_score': 'student__ats_score',
+        'status': 'status',
+    }
+
     @action(detail=True, methods=['get'])
     def applicants(self, request, pk=None):
+        # ?status=Applied,Shortlisted&min_cgpa=7&max_backlogs=0&min_score=60&min_ats=50&ordering=-cgpa
         job = self.get_object()
-        applicants = JobApplication.objects.filter(job=job)
-        serializer = JobApplicationSerializer(applicants, many=True)
-        return Response(serializer.data)
+        params = request.query_params
+        ordering = params.get('ordering', '-match_score')
+        field = self.APPLICANT_ORDERING.get(ordering.lstrip('-'))
+        if field is None:
+            return Response({"error": f"Invalid ordering '{ordering}'"}, status=status.HTTP_400_BAD_REQUEST)
+        order = F(field).desc(nulls_last=True) if ordering.startswith('-') else F(field).asc(nulls_last=True)
+
+        # Ranked by the (job, -match_score) index; unscored applications last
+        applicants = JobApplication.objects.filter(job=job).select_related('student__user').only(
+            'id', 'status', 'applied_on', 'match_score', 'student__id', 'student__department',
+            'student__overall_cgpa', 'student__total_backlogs', 'student__ats_score',
+            'student__user__full_name', 'student__user__email', 'student__user__phone',
+        ).order_by(order, 'applied_on')
+
+        statuses = [s.strip() for s in params.get('status', '').split(',') if s.strip()]
+        if statuses:
+            applicants = applicants.filter(status__in=statuses)
+        try:
+            if params.get('min_cgpa'):
+                applicants = applicants.filter(student__overall_cgpa__gte=float(params['min_cgpa']))
+            if params.get('max_backlogs'):
+                applicants = applicants.filter(student__total_backlogs__lte=int(params['max_backlogs']))
+            if params.get('min_score'):
+                applicants = applicants.filter(match_score__gte=float(params['min_score']))
+            if params.get('min_ats'):
+                applicants = applicants.filter(student__ats_score__gte=float(params['min_ats']))
+        except ValueError:
+            return Response({"error": "Filters must be numbers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = [{
+            "id": app.id,
+            "student_id": app.student.id,
+            "student_name": app.student.user.full_name,
+            "email": app.student.user.email,
+            "phone": app.student.user.phone,
+            "department": app.student.department,
+            "cgpa": app.student.overall_cgpa,
+            "backlogs": app.student.total_backlogs,
+            "ats_score": app.student.ats_score,
+            "match_score": app.match_score,
+            "status": app.status,
+            "applied_on": app.applied_on,
+        } for app in applicants]
+
+        # The job is sent once rather than nested in every row
+        return Response({
+            "job": {
+                "id": job.id,
+                "company": job.company,
+                "role": job.role,
+                "deadline": job.deadline,
+                "min_cgpa": job.min_cgpa,
+                "max_backlogs": job.max_backlogs,
+                "departments": [branch.code for branch in job.branches.all()],
+            },
+            "count": len(rows),
+            "applicants": rows,
+        })
 
     @action(detail=True, methods=['get'])
     def export_pdf(self, request, pk=None):
@@ -72,7 +142,7 @@ class JobViewSet(viewsets.ModelViewSet):
                             status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         
         job = self.get_object()
-        applications = JobApplication.objects.filter(job=job)
+        applications = JobApplication.objects.filter(job=job).select_related('student__user')
         
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter)
@@ -117,14 +187,18 @@ class JobViewSet(viewsets.ModelViewSet):
         return response
 
 class InterviewViewSet(viewsets.ModelViewSet):
-    queryset = Interview.objects.all().order_by('-date_time')
+    # selected_students_details reads each student's user
+    queryset = Interview.objects.all().prefetch_related(
+        'branches', Prefetch('selected_students', queryset=Student.objects.select_related('user'))
+    ).order_by('-date_time')
     serializer_class = InterviewSerializer
 
     def get_queryset(self):
         # Allow checking interviews by department if needed
         dept = self.request.query_params.get('department')
         if dept:
-            return Interview.objects.filter(department=dept).order_by('-date_time')
+            from accounts.departments import interview_department_q, resolve_department
+            return super().get_queryset().filter(interview_department_q(dept, resolve_department(dept)))
         return super().get_queryset()
 
 class PlacementOfficerProfileView(APIView):
@@ -182,9 +256,59 @@ class PlacementOfficerProfileView(APIView):
             traceback.print_exc()
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+def _stream_format(request):
+    # ?stream=json|ndjson; (format, error response)
+    fmt = request.query_params.get('stream')
+    if fmt and fmt not in STREAM_FORMATS:
+        return None, Response({"error": f"stream must be one of {', '.join(STREAM_FORMATS)}"}, status=status.HTTP_400_BAD_REQUEST)
+    return fmt, None
+
 class RegisteredStudentsView(APIView):
     def get(self, request):
+        fmt, error = _stream_format(request)
+        if error:
+            return error
+        if fmt:
+            # Whole table, streamed straight from the cursor
+            rows = Student.objects.order_by('id').values(
+                'id', 'department', 'course', 'overall_cgpa', 'is_blacklisted',
+                full_name=F('user__full_name'), email=F('user__email'), phone=F('user__phone'),
+            )
+            return streaming_response(rows, fmt)
+
         students = Student.objects.all().select_related('user')
+        return paginated_response(request, students, lambda rows: [{
+            "id": s.id,
+            "full_name": s.user.full_name,
+            "email": s.user.email,
+            "phone": s.user.phone,
+            "department": s.department,
+            "course": s.course,
+            "overall_cgpa": s.overall_cgpa,
+            "is_blacklisted": s.is_blacklisted
+        } for s in rows], view=self)
+
+class StudentSkillSearchView(APIView):
+    # ?skills=verilog,pcb design&match=all|any&department=EL&min_cgpa=7&max_cgpa=9
+    def get(self, request):
+        from accounts.skill_index import search_students
+
+        skills = [s for s in request.query_params.get('skills', '').split(',') if s.strip()]
+        match = request.query_params.get('match', 'all').lower()
+        if match not in ('all', 'any'):
+            return Response({"error": "match must be 'all' or 'any'"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            min_cgpa = request.query_params.get('min_cgpa')
+            max_cgpa = request.query_params.get('max_cgpa')
+            min_cgpa = float(min_cgpa) if min_cgpa else None
+            max_cgpa = float(max_cgpa) if max_cgpa else None
+        except ValueError:
+            return Response({"error": "CGPA filters must be numbers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        students = search_students(
+            skills, match_all=(match == 'all'), department=request.query_params.get('department'),
+            min_cgpa=min_cgpa, max_cgpa=max_cgpa,
+        ).select_related('user').order_by('-overall_cgpa')
         data = [{
             "id": s.id,
             "full_name": s.user.full_name,
@@ -193,22 +317,36 @@ class RegisteredStudentsView(APIView):
             "department": s.department,
             "course": s.course,
             "overall_cgpa": s.overall_cgpa,
+            "ats_score": s.ats_score,
             "is_blacklisted": s.is_blacklisted
         } for s in students]
         return Response(data)
 
+def _format_applied_on(row):
+    row['applied_on'] = row['applied_on'].strftime("%Y-%m-%d")
+    return row
+
 class TotalApplicationsView(APIView):
     def get(self, request):
+        fmt, error = _stream_format(request)
+        if error:
+            return error
+        if fmt:
+            rows = JobApplication.objects.order_by('id').values(
+                'id', 'status', 'applied_on',
+                student_name=F('student__user__full_name'), company=F('job__company'), role=F('job__role'),
+            )
+            return streaming_response(rows, fmt, transform=_format_applied_on)
+
         applications = JobApplication.objects.all().select_related('student__user', 'job')
-        data = [{
+        return paginated_response(request, applications, lambda rows: [{
             "id": app.id,
             "student_name": app.student.user.full_name,
             "company": app.job.company,
             "role": app.job.role,
             "status": app.status,
             "applied_on": app.applied_on.strftime("%Y-%m-%d")
-        } for app in applications]
-        return Response(data)
+        } for app in rows], view=self)
 
 class ExportStudentsPDFView(APIView):
     def get(self, request):
@@ -218,7 +356,8 @@ class ExportStudentsPDFView(APIView):
         students = Student.objects.all().select_related('user')
         department = request.query_params.get('department')
         if department and department != 'All':
-            students = students.filter(department=department)
+            from accounts.departments import department_param_q
+            students = students.filter(department_param_q(department))
             
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=letter)
@@ -295,8 +434,18 @@ class ExportApplicationsPDFView(APIView):
 
 class RegisteredTeachersView(APIView):
     def get(self, request):
+        fmt, error = _stream_format(request)
+        if error:
+            return error
+        if fmt:
+            rows = Teacher.objects.order_by('id').values(
+                'id', 'department', 'designation', 'position',
+                full_name=F('user__full_name'), email=F('user__email'), phone=F('user__phone'),
+            )
+            return streaming_response(rows, fmt)
+
         teachers = Teacher.objects.all().select_related('user')
-        data = [{
+        return paginated_response(request, teachers, lambda rows: [{
             "id": t.id,
             "full_name": t.user.full_name,
             "email": t.user.email,
@@ -304,8 +453,7 @@ class RegisteredTeachersView(APIView):
             "department": t.department,
             "designation": t.designation,
             "position": t.position
-        } for t in teachers]
-        return Response(data)
+        } for t in rows], view=self)
 
 class ExportTeachersPDFView(APIView):
     def get(self, request):
@@ -348,25 +496,32 @@ class DepartmentListView(APIView):
         student_depts = Student.objects.values_list('department', flat=True).distinct()
         all_depts = sorted(list(set(list(teacher_depts) + list(student_depts))))
         
-        data = []
-        for dept in all_depts:
-            teachers = Teacher.objects.filter(department=dept).select_related('user')
-            students_count = Student.objects.filter(department=dept).count()
-            placed_count = Student.objects.filter(department=dept, applications__status='Selected').distinct().count()
-            
-            teacher_list = [{
+        # Counts and teacher lists for every department in three queries
+        student_counts = {
+            row['department']: row for row in Student.objects.values('department').annotate(
+                total=Count('id', distinct=True),
+                placed=Count('id', filter=Q(applications__status='Selected'), distinct=True),
+            )
+        }
+        teachers_by_dept = {}
+        for t in Teacher.objects.select_related('user').order_by('id'):
+            teachers_by_dept.setdefault(t.department, []).append({
                 "id": t.id,
                 "full_name": t.user.full_name,
                 "designation": t.designation,
                 "email": t.user.email,
                 "phone": t.user.phone
-            } for t in teachers]
-            
+            })
+
+        data = []
+        for dept in all_depts:
+            teacher_list = teachers_by_dept.get(dept, [])
+            counts = student_counts.get(dept, {})
             data.append({
                 "name": dept,
-                "teachers_count": teachers.count(),
-                "students_count": students_count,
-                "placed_count": placed_count,
+                "teachers_count": len(teacher_list),
+                "students_count": counts.get('total', 0),
+                "placed_count": counts.get('placed', 0),
                 "teachers": teacher_list
             })
         return Response(data)
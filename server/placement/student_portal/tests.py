@@ -0,0 +1,368 @@
+import io
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import AtsScoringJob, Job, JobMatch, Student
+from accounts.tests import RESUME_LINES, clear_caches, make_job, make_student, resume_upload, use_temp_media
+
+PHONE = '9200000001'
+
+
+def run_worker():
+    call_command('run_ats_worker', '--once', stdout=io.StringIO())
+
+
+class AtsWorkerTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+        clear_caches()
+        self.client = APIClient()
+        self.student = make_student(PHONE)
+        make_job()
+
+    def upload(self, **kwargs):
+        return self.client.patch(
+            '/api/student/profile/', {'phone': PHONE, 'resume': resume_upload(**kwargs)}, format='multipart'
+        )
+
+    def status(self):
+        return self.client.get(f'/api/student/ats-status/?phone={PHONE}').data
+
+    def test_upload_returns_pending_and_the_worker_lands_the_score(self):
+        response = self.upload()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['ats_status'], 'pending')
+        self.assertEqual(self.status()['ats_status'], 'pending')
+
+        run_worker()
+
+        status = self.status()
+        self.assertEqual(status['ats_status'], 'done')
+        self.assertIsNotNone(status['finished_at'])
+        self.assertIsNone(status['error'])
+        student = Student.objects.get(pk=self.student.pk)
+        self.assertGreater(student.ats_score, 0)
+        self.assertEqual(status['ats_score'], student.ats_score)
+        self.assertEqual(student.ats_scored_hash, student.resume_hash)
+
+    def test_job_for_a_replaced_resume_fails_as_superseded(self):
+        self.upload()
+        first = AtsScoringJob.objects.get(student=self.student)
+        # Claimed before the second upload could drop it from the queue
+        AtsScoringJob.objects.filter(pk=first.pk).update(status='running', started_at=timezone.now())
+        self.upload(lines=["Rahul Menon", "SKILLS", "autocad, plc"])
+
+        run_worker()
+
+        first.refresh_from_db()
+        self.assertEqual(first.status, 'running')
+        from accounts.ats_queue import run_scoring_job
+        self.assertEqual(run_scoring_job(first.pk), 'failed')
+        first.refresh_from_db()
+        self.assertEqual(first.error, "Superseded by a newer resume upload")
+        self.assertEqual(self.status()['ats_status'], 'done')
+
+    def test_stale_running_jobs_are_requeued(self):
+        self.upload()
+        AtsScoringJob.objects.update(status='running', started_at=timezone.now() - timedelta(hours=1))
+
+        run_worker()
+
+        self.assertEqual(self.status()['ats_status'], 'done')
+
+
+class ResumeDedupeTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+        clear_caches()
+        self.client = APIClient()
+        self.student = make_student(PHONE)
+        make_job()
+
+    def patch(self, data):
+        return self.client.patch('/api/student/profile/', dict(data, phone=PHONE), format='multipart')
+
+    def stored_resumes(self):
+        import os
+        from django.conf import settings
+        return os.listdir(os.path.join(settings.MEDIA_ROOT, 'resumes'))
+
+    def test_identical_reupload_keeps_the_file_and_the_score(self):
+        self.patch({'resume': resume_upload(name='cv.txt')})
+        run_worker()
+        scored = Student.objects.get(pk=self.student.pk)
+
+        response = self.patch({'resume': resume_upload(name='cv-final.txt')})
+        self.assertEqual(response.data['ats_status'], 'done')
+        self.assertEqual(AtsScoringJob.objects.filter(student=self.student).count(), 1)
+        self.assertEqual(len(self.stored_resumes()), 1)
+        student = Student.objects.get(pk=self.student.pk)
+        self.assertEqual((student.resume.name, student.ats_score), (scored.resume.name, scored.ats_score))
+
+        response = self.patch({'resume': resume_upload(lines=["Rahul Menon", "SKILLS", "python, react"])})
+        self.assertEqual(response.data['ats_status'], 'pending')
+        self.assertEqual(len(self.stored_resumes()), 2)
+
+    def test_department_change_rescores_for_the_new_branch(self):
+        self.patch({'resume': resume_upload()})
+        run_worker()
+        self.assertEqual(Student.objects.get(pk=self.student.pk).ats_scored_branch, 'CT')
+
+        response = self.patch({'department': 'EL'})
+        self.assertEqual(response.data['ats_status'], 'pending')
+        run_worker()
+        student = Student.objects.get(pk=self.student.pk)
+        self.assertEqual(student.ats_scored_branch, 'EL')
+
+        from accounts.ats_queue import needs_ats_scoring
+        self.assertFalse(needs_ats_scoring(student))
+        self.assertIsNone(self.patch({'department': 'EL', 'skills': 'python'}).data['ats_status'])
+
+    def test_unresolved_departments_score_as_their_nearest_branch(self):
+        from accounts.ats_queue import exclude_current_scores, needs_ats_scoring
+        from accounts.ats_utils import score_resumes
+
+        self.patch({'department': 'Nanoelectronics', 'resume': resume_upload()})
+        run_worker()
+        student = Student.objects.get(pk=self.student.pk)
+        self.assertIsNone(student.branch_id)
+        self.assertEqual(student.ats_scored_branch, 'Nanoelectronics')
+        self.assertFalse(needs_ats_scoring(student))
+        self.assertFalse(exclude_current_scores(Student.objects.filter(pk=student.pk)).exists())
+
+        text = "\n".join(RESUME_LINES)
+        self.assertEqual(score_resumes([(text, 'Nanoelectronics')]), score_resumes([(text, 'EL')]))
+
+
+class DashboardEligibilityTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+        clear_caches()
+        self.client = APIClient()
+        self.student = make_student(PHONE)
+        self.job = make_job("Python Co", description="Python Django developer", skills_required="python, django")
+        self.client.patch('/api/student/profile/', {'phone': PHONE, 'resume': resume_upload()}, format='multipart')
+        run_worker()
+
+    def recommended(self):
+        response = self.client.get(f'/api/student/dashboard/?phone={PHONE}')
+        return [job['id'] for job in response.data['recommended_jobs']]
+
+    def reload(self):
+        # Fresh instance, as a view would load it
+        return Student.objects.get(pk=self.student.pk)
+
+    def test_blacklisted_students_lose_their_matches(self):
+        self.assertEqual(self.recommended(), [self.job.id])
+
+        student = self.reload()
+        student.is_blacklisted = True
+        student.save()
+
+        self.assertFalse(JobMatch.objects.filter(student=student).exists())
+        self.assertEqual(self.recommended(), [])
+        response = self.client.post('/api/student/apply/', {'phone': PHONE, 'job_id': self.job.id})
+        self.assertEqual(response.status_code, 403)
+
+    def test_new_jobs_reach_recommendations_through_the_worker(self):
+        new = make_job("Django Co", description="Django REST developer", skills_required="django, python")
+        self.assertTrue(AtsScoringJob.objects.filter(job=new, student__isnull=True, status='pending').exists())
+        run_worker()
+        self.assertCountEqual(self.recommended(), [self.job.id, new.id])
+
+        make_job("Closed Co", allowed_departments="EL")
+        run_worker()
+        self.assertCountEqual(self.recommended(), [self.job.id, new.id])
+
+    def test_cgpa_changes_add_and_remove_matches(self):
+        strict = make_job("Strict Co", description="Python developer", skills_required="python", min_cgpa=8.5)
+        run_worker()
+        self.assertEqual(self.recommended(), [self.job.id])
+
+        student = self.reload()
+        student.overall_cgpa = 9.0
+        student.save()
+        run_worker()
+        self.assertCountEqual(self.recommended(), [self.job.id, strict.id])
+
+        student = self.reload()
+        student.overall_cgpa = 8.0
+        student.save()
+        self.assertEqual(self.recommended(), [self.job.id])
+
+    def test_unresolved_department_changes_refresh_eligibility(self):
+        from accounts.eligibility import eligible_jobs_for
+
+        mechanical = make_job("Mech Co", allowed_departments="Mechanical")
+        civil = make_job("Civil Co", allowed_departments="Civil")
+        student = self.reload()
+        student.department = 'Mechanical'
+        student.save()
+        self.assertIsNone(student.branch_id)
+        self.assertEqual(list(eligible_jobs_for(student)), [mechanical])
+
+        student = self.reload()
+        student.department = 'Civil'
+        student.save()
+        self.assertEqual(list(eligible_jobs_for(student)), [civil])
+
+
+class DashboardCacheTests(TestCase):
+    def setUp(self):
+        use_temp_media(self)
+        clear_caches()
+        self.client = APIClient()
+        self.student = make_student(PHONE)
+        self.job = make_job()
+
+    def cache_status(self):
+        response = self.client.get(f'/api/student/dashboard/?phone={PHONE}')
+        self.assertEqual(response.status_code, 200)
+        return response['X-Dashboard-Cache']
+
+    def test_repeat_requests_hit_and_are_counted(self):
+        before = self.client.get('/api/student/dashboard/cache-stats/').data
+        self.assertEqual([self.cache_status() for _ in range(3)], ['MISS', 'HIT', 'HIT'])
+        after = self.client.get('/api/student/dashboard/cache-stats/').data
+        self.assertEqual((after['hits'] - before['hits'], after['misses'] - before['misses']), (2, 1))
+
+    def test_student_and_job_saves_invalidate(self):
+        self.cache_status()
+        student = Student.objects.get(pk=self.student.pk)
+        student.skills = 'python, django'
+        student.save()
+        self.assertEqual(self.cache_status(), 'MISS')
+
+        self.job.salary = '5 LPA'
+        self.job.save()
+        self.assertEqual(self.cache_status(), 'MISS')
+        self.assertEqual(self.cache_status(), 'HIT')
+
+    def test_worker_invalidations_reach_the_web_process(self):
+        self.client.patch('/api/student/profile/', {'phone': PHONE, 'resume': resume_upload()}, format='multipart')
+        self.cache_status()
+        run_worker()
+        self.assertEqual(self.cache_status(), 'MISS')
+
+    def test_hits_do_not_write(self):
+        self.cache_status()
+        # The student lookup; the entry comes from the cache and the counters
+        # stay in process
+        with self.assertNumQueries(1):
+            self.assertEqual(self.cache_status(), 'HIT')
+
+
+class JobSearchTests(TestCase):
+    def setUp(self):
+        from accounts.job_search import fts_available
+        if not fts_available():
+            self.skipTest("SQLite without FTS5 uses the icontains fallback")
+        self.client = APIClient()
+        make_student(PHONE)
+        self.role = make_job("Infosys", role="Django Developer", description="Web team", skills_required="html")
+        self.body = make_job("Wipro", role="Trainee", description="Some django work", skills_required="excel")
+        self.cad = make_job("L&T", role="Draughtsman", description="AutoCAD drawings", skills_required="autocad")
+
+    def search(self, q, **params):
+        response = self.client.get('/api/student/jobs/search/', dict(params, phone=PHONE, q=q))
+        self.assertEqual(response.status_code, 200)
+        return [row['company'] for row in response.data['results']]
+
+    def test_prefix_terms_must_all_match(self):
+        self.assertEqual(self.search('autoc'), ['L&T'])
+        self.assertEqual(self.search('dja web'), ['Infosys'])
+        self.assertEqual(self.search('autocad django'), [])
+
+    def test_role_matches_rank_above_description_matches(self):
+        # bm25 needs the term to be rare across jobs to give it any weight
+        for i in range(6):
+            make_job(f"Filler {i}", role="Electrician", description="Wiring", skills_required="plc")
+        self.assertEqual(self.search('django'), ['Infosys', 'Wipro'])
+        response = self.client.get('/api/student/jobs/search/', {'phone': PHONE, 'q': 'django'})
+        scores = [row['search_score'] for row in response.data['results']]
+        self.assertGreater(scores[0], scores[1])
+
+    def test_updates_and_deletes_reach_the_index(self):
+        self.cad.description = "Revit and AutoCAD drawings"
+        self.cad.save()
+        self.assertEqual(self.search('revit'), ['L&T'])
+        # Queryset updates bypass signals; the triggers still see them
+        Job.objects.filter(pk=self.body.pk).update(role="Flask Developer")
+        self.assertEqual(self.search('flask'), ['Wipro'])
+        self.role.delete()
+        self.assertEqual(self.search('django'), ['Wipro'])
+
+    def test_only_eligible_jobs_unless_asked(self):
+        make_job("Bosch", role="Django Engineer", allowed_departments="EL")
+        self.assertNotIn('Bosch', self.search('django'))
+        self.assertIn('Bosch', self.search('django', eligible='false'))
+
+    def test_post_migrate_restores_dropped_triggers(self):
+        from django.core.management.sql import emit_post_migrate_signal
+        from django.db import connection
+
+        # What SQLite does to the triggers when a migration rebuilds accounts_job
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER accounts_job_fts_ai")
+            cursor.execute("DROP TRIGGER accounts_job_fts_au")
+        make_job("Tata Elxsi", role="Embedded Engineer")
+        self.assertEqual(self.search('embedded'), [])
+
+        with mock.patch('builtins.print'):
+            emit_post_migrate_signal(0, False, 'default')
+        self.assertEqual(self.search('embedded'), ['Tata Elxsi'])
+        make_job("Kerala Startup", role="Embedded Intern")
+        self.assertCountEqual(self.search('embedded'), ['Tata Elxsi', 'Kerala Startup'])
+
+
+class DriveCalendarTests(TestCase):
+    def setUp(self):
+        from accounts.models import Interview
+
+        self.client = APIClient()
+        make_student(PHONE)
+        today = timezone.localdate()
+        self.window = {'start': str(today + timedelta(days=5)), 'end': str(today + timedelta(days=15))}
+        self.inside = make_job("Inside", days=10)
+        make_job("Outside", days=30)
+        for company, department in (("CT Interview", "CT"), ("EL Interview", "EL")):
+            Interview.objects.create(
+                company=company, department=department, date_time=timezone.now() + timedelta(days=8),
+                meeting_link='https://meet.example.com/x',
+            )
+
+    def calendar(self, **headers):
+        return self.client.get('/api/student/calendar/', dict(self.window, phone=PHONE), headers=headers)
+
+    def test_window_merges_drives_and_department_interviews(self):
+        response = self.calendar()
+        self.assertEqual(response.status_code, 200)
+        entries = [(e['type'], e['company']) for e in response.data['entries']]
+        self.assertEqual(entries, [('interview', 'CT Interview'), ('drive', 'Inside')])
+        self.assertEqual(str(response.data['start']), self.window['start'])
+
+    def test_unchanged_windows_revalidate_with_304(self):
+        first = self.calendar()
+        etag = first['ETag']
+        self.assertIn('no-cache', first['Cache-Control'])
+
+        again = self.calendar(if_none_match=etag)
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.content, b'')
+
+        self.inside.role = "Senior Developer"
+        self.inside.save()
+        changed = self.calendar(if_none_match=etag)
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], etag)
+
+    def test_invalid_windows_are_rejected(self):
+        for params in ({'month': '2026-13'}, {'start': '2026-11-10', 'end': '2026-11-01'},
+                       {'start': '2026-01-01', 'end': '2027-06-01'}, {'start': '2026-11-01'},
+                       {'month': '9999-12'}, {'start': '9999-12-31', 'end': '9999-12-31'}):
+            self.assertEqual(self.client.get('/api/student/calendar/', params).status_code, 400, params)
@@ -1,10 +1,15 @@
 from django.urls import path
-from .views import StudentDashboardView, JobApplicationView, NotificationListView, StudentProfileView, WebSearchView
+from .views import StudentDashboardView, JobApplicationView, NotificationListView, StudentProfileView, WebSearchView, AtsStatusView, AiSuggestionsView, DashboardCacheStatsView, JobSearchView, DriveCalendarView
 
 urlpatterns = [
     path('dashboard/', StudentDashboardView.as_view(), name='student-dashboard'),
+    path('dashboard/cache-stats/', DashboardCacheStatsView.as_view(), name='dashboard-cache-stats'),
+    path('jobs/search/', JobSearchView.as_view(), name='job-search'),
+    path('calendar/', DriveCalendarView.as_view(), name='drive-calendar'),
     path('apply/', JobApplicationView.as_view(), name='job-apply'),
     path('notifications/', NotificationListView.as_view(), name='notifications'),
     path('profile/', StudentProfileView.as_view(), name='student-profile'),
+    path('ats-status/', AtsStatusView.as_view(), name='ats-status'),
+    path('ai-suggestions/', AiSuggestionsView.as_view(), name='ai-suggestions'),
     path('web-search/', WebSearchView.as_view(), name='web-search'),
 ]
@@ -2,9 +2,14 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from datetime import timedelta
 from django.utils import timezone
-from accounts.models import Student, Job, JobApplication, Notification
+from accounts.models import Student, Job, JobApplication, JobMatch, Notification
 from accounts.serializers import JobSerializer, JobApplicationSerializer, NotificationSerializer
+from accounts.pagination import paginated_response
+
+# Days of drive dates embedded in the dashboard payload
+DASHBOARD_CALENDAR_DAYS = 62
 
 class StudentDashboardView(APIView):
     # permission_classes = [IsAuthenticated]
@@ -14,7 +19,7 @@ class StudentDashboardView(APIView):
         phone = request.query_params.get('phone')
         try:
             if phone:
-                student = Student.objects.get(user__phone=phone)
+                student = Student.objects.select_related('user').get(user__phone=phone)
             else:
                 # Fallback to first student for demo if no session/param
                 student = Student.objects.first()
@@ -24,18 +29,33 @@ class StudentDashboardView(APIView):
         if not student:
              return Response({"error": "No student profile exists"}, status=status.HTTP_404_NOT_FOUND)
 
-        # 1. Eligibility Filtering for Jobs (By Branch/Department)
-        if student.is_blacklisted:
-            eligible_jobs = Job.objects.none()
+        # Assembled payloads are cached per student and dropped by model
+        # signals (accounts.signals) when anything shown here changes
+        from accounts.dashboard_cache import cache_dashboard, get_cached_dashboard
+        cached, jobs_version = get_cached_dashboard(student.pk)
+        if cached is not None:
+            response = Response(cached)
+            response['X-Dashboard-Cache'] = 'HIT'
+            return response
+
+        # 1. Open jobs the student is eligible for (department, CGPA, backlogs,
+        # blacklist), materialized in JobEligibility by accounts.eligibility
+        from accounts.eligibility import eligible_jobs_for
+        eligible_jobs = eligible_jobs_for(student).prefetch_related('branches')[:10]
+
+        # Ranked matches precomputed by accounts.matching (one indexed lookup),
+        # limited to jobs the student is still eligible for
+        matches = list(
+            JobMatch.objects.filter(
+                student=student, job__eligible_students__student=student,
+                job__eligible_students__deadline__gte=timezone.now(),
+            )
+            .select_related('job').prefetch_related('job__branches').order_by('rank')
+        )
+        if matches:
+            recommended_jobs = [dict(JobSerializer(m.job).data, match_score=m.score) for m in matches]
         else:
-            branch = student.department if student.department else ""
-            eligible_jobs = Job.objects.filter(
-                allowed_departments__icontains=branch
-            ).order_by('-posted_on')[:10]
-            
-            # If no branch specific jobs, show latest jobs
-            if not eligible_jobs.exists():
-                eligible_jobs = Job.objects.all().order_by('-posted_on')[:10]
+            recommended_jobs = JobSerializer(eligible_jobs, many=True).data
 
         # 2. Stats Calculation
         stats = [
@@ -45,15 +65,18 @@ class StudentDashboardView(APIView):
             {"label": "Profile Strength", "value": f"{student.profile_completion}%", "trend": "Update Skills"},
         ]
 
-        # 4. Collection of all drive dates for the calendar
-        all_drives = Job.objects.filter(deadline__gte=timezone.now()).order_by('deadline')
+        # 4. Drive dates for the calendar widget over the next few weeks; other
+        # months are served by the calendar endpoint
+        calendar_end = timezone.now() + timedelta(days=DASHBOARD_CALENDAR_DAYS)
         drive_dates = [
             {
-                "id": drive.id,
-                "date": drive.deadline.strftime('%Y-%m-%d'),
-                "company": drive.company,
-                "role": drive.role
-            } for drive in all_drives
+                "id": pk,
+                "date": deadline.strftime('%Y-%m-%d'),
+                "company": company,
+                "role": role
+            } for pk, company, role, deadline in Job.objects.filter(
+                deadline__gte=timezone.now(), deadline__lt=calendar_end
+            ).order_by('deadline').values_list('id', 'company', 'role', 'deadline')
         ]
 
         # 3. Formatted Dashboard Data
@@ -65,7 +88,7 @@ class StudentDashboardView(APIView):
                 "image": student.image.url if student.image else None
             },
             "stats": stats,
-            "recommended_jobs": JobSerializer(eligible_jobs, many=True).data,
+            "recommended_jobs": recommended_jobs,
             "upcoming_drives": [
                 {"id": j.id, "company": j.company, "role": j.role, "month": j.deadline.strftime('%b').upper(), "day": j.deadline.strftime('%d'), "time": j.deadline.strftime('%H:%M %p')}
                 for j in eligible_jobs[:3]
@@ -75,23 +98,91 @@ class StudentDashboardView(APIView):
         }
 
         # Generate Recommendations if resume exists
-        if student.resume and eligible_jobs.exists():
+        if student.resume and (matches or eligible_jobs.exists()):
             try:
-                from accounts.ats_utils import extract_resume_text, final_recommendation
-                # Open the file and extract text
-                with student.resume.open('rb') as f:
-                    resume_text = extract_resume_text(f)
+                from accounts.recommendations import get_recommendations
+                from accounts.resume_store import get_student_resume_text
+                # Extracted once per upload and served from the resume text store
+                resume_text = get_student_resume_text(student)
                 
                 if resume_text:
-                    # Use first eligible job for recommendations
-                    target_job = eligible_jobs.first()
-                    data["recommendations"] = final_recommendation(student, resume_text, target_job)
+                    # Use the best-matching job, or the first eligible one
+                    target_job = matches[0].job if matches else eligible_jobs.first()
+                    data["recommendations"] = get_recommendations(student, resume_text, target_job)
             except Exception as e:
                 import traceback
                 print(f"Recommendation generation error: {e}")
                 traceback.print_exc()
 
-        return Response(data)
+        cache_dashboard(student.pk, data, jobs_version)
+        response = Response(data)
+        response['X-Dashboard-Cache'] = 'MISS'
+        return response
+
+class DashboardCacheStatsView(APIView):
+    def get(self, request):
+        from accounts.dashboard_cache import get_dashboard_cache_stats
+        return Response(get_dashboard_cache_stats())
+
+class JobSearchView(APIView):
+    # ?phone=...&q=python dev&eligible=false&limit=20
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"error": "Search query 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
+        phone = request.query_params.get('phone')
+        try:
+            student = Student.objects.get(user__phone=phone)
+        except Student.DoesNotExist:
+            return Response({"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 50)
+        except ValueError:
+            return Response({"error": "limit must be a number"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Jobs the student may apply to unless ?eligible=false
+        from accounts.job_search import search_jobs
+        eligible_only = request.query_params.get('eligible', 'true').lower() != 'false'
+        results = search_jobs(query, student if eligible_only else None, limit)
+        return Response({
+            "query": query,
+            "count": len(results),
+            "results": [dict(JobSerializer(job).data, search_score=score) for job, score in results],
+        })
+
+class DriveCalendarView(APIView):
+    # ?phone=...&month=2026-11 or ?start=2026-11-01&end=2026-12-15
+    def get(self, request):
+        from django.utils.cache import get_conditional_response, patch_cache_control
+        from accounts.drive_calendar import calendar_entries, calendar_etag, parse_window
+
+        params = request.query_params
+        try:
+            start, end = parse_window(params.get('month'), params.get('start'), params.get('end'))
+        except ValueError as e:
+            return Response({"error": f"Invalid calendar window: {e}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        student = None
+        phone = params.get('phone')
+        if phone:
+            student = Student.objects.filter(user__phone=phone).first()
+            if not student:
+                return Response({"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        entries = calendar_entries(start, end, student)
+        etag = calendar_etag(entries)
+
+        # Browsers keep the response and revalidate it with If-None-Match
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response({
+                "start": start.date(),
+                "end": (end - timedelta(days=1)).date(),
+                "entries": entries,
+            })
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
 class JobApplicationView(APIView):
     # permission_classes = [IsAuthenticated]
@@ -104,12 +195,12 @@ class JobApplicationView(APIView):
             student = Student.objects.get(user__phone=phone)
             job = Job.objects.get(id=job_id)
             
-            # Check eligibility again for safety
-            if student.is_blacklisted:
-                return Response({"error": "You have been blacklisted and cannot apply for jobs."}, status=status.HTTP_403_FORBIDDEN)
-                
-            if student.overall_cgpa < job.min_cgpa or student.total_backlogs > job.max_backlogs:
-                return Response({"error": "You are not eligible for this job"}, status=status.HTTP_400_BAD_REQUEST)
+            # Same rule the dashboard's eligible jobs are materialized from
+            from accounts.eligibility import check_eligibility
+            eligible, reason = check_eligibility(student, job)
+            if not eligible:
+                code = status.HTTP_403_FORBIDDEN if student.is_blacklisted else status.HTTP_400_BAD_REQUEST
+                return Response({"error": reason}, status=code)
 
             application, created = JobApplication.objects.get_or_create(student=student, job=job)
             
@@ -134,8 +225,9 @@ class NotificationListView(APIView):
     def get(self, request):
         phone = request.query_params.get('phone')
         notifications = Notification.objects.filter(user__phone=phone)
-        serializer = NotificationSerializer(notifications, many=True)
-        return Response(serializer.data)
+        return paginated_response(
+            request, notifications, lambda rows: NotificationSerializer(rows, many=True).data, view=self
+        )
 
 class StudentProfileView(APIView):
     # permission_classes = [IsAuthenticated]
@@ -143,7 +235,7 @@ class StudentProfileView(APIView):
     def get(self, request):
         phone = request.query_params.get('phone')
         try:
-            student = Student.objects.get(user__phone=phone)
+            student = Student.objects.select_related('user').get(user__phone=phone)
             # We want to return both User and Student fields
             data = {
                 "full_name": student.user.full_name,
@@ -166,14 +258,14 @@ class StudentProfileView(APIView):
             }
 
             # Fetch jobs allowed for student's branch (relaxed filter for profile view)
-            branch = student.department if student.department else ""
+            from accounts.departments import job_department_q
             eligible_jobs = Job.objects.filter(
-                allowed_departments__icontains=branch
-            ).order_by('-posted_on')[:10]
+                job_department_q(student.department, student.branch_id)
+            ).prefetch_related('branches').order_by('-posted_on')[:10]
             
             # If no branch matches, just show latest jobs so section is never empty
             if not eligible_jobs.exists():
-                eligible_jobs = Job.objects.all().order_by('-posted_on')[:10]
+                eligible_jobs = Job.objects.all().prefetch_related('branches').order_by('-posted_on')[:10]
             
             job_serializer = JobSerializer(eligible_jobs, many=True)
             data["eligible_jobs"] = job_serializer.data
@@ -182,15 +274,15 @@ class StudentProfileView(APIView):
             data["recommendations"] = None
             if student.resume and eligible_jobs.exists():
                 try:
-                    from accounts.ats_utils import extract_resume_text, final_recommendation
-                    # Open the file and extract text
-                    with student.resume.open('rb') as f:
-                        resume_text = extract_resume_text(f)
+                    from accounts.recommendations import get_recommendations
+                    from accounts.resume_store import get_student_resume_text
+                    # Extracted once per upload and served from the resume text store
+                    resume_text = get_student_resume_text(student)
                     
                     if resume_text:
                         # Use first eligible job for recommendations
                         target_job = eligible_jobs.first()
-                        data["recommendations"] = final_recommendation(student, resume_text, target_job)
+                        data["recommendations"] = get_recommendations(student, resume_text, target_job)
                 except Exception as e:
                     import traceback
                     print(f"Recommendation generation error: {e}")
@@ -229,31 +321,35 @@ class StudentProfileView(APIView):
             
             if 'image' in request.FILES:
                 student.image = request.FILES['image']
+            resume_uploaded = False
             if 'resume' in request.FILES:
+                from accounts.resume_store import hash_resume_file, save_resume_file
                 resume_file = request.FILES['resume']
-                student.resume = resume_file
-                # Auto-calculate ATS score on upload
-                try:
-                    from accounts.ats_utils import extract_resume_text, calculate_ats_score
-                    # Use the file object from request.FILES which is seekable/readable
-                    resume_text = extract_resume_text(resume_file)
-                    if resume_text:
-                        print(f"ATS Debug: Extracted {len(resume_text)} chars from {resume_file.name}")
-                        print(f"ATS Debug: Text preview: {resume_text[:100]}...")
-                        # Map department to branch code for ATS
-                        branch = student.department if student.department else "CT"
-                        student.ats_score = calculate_ats_score(resume_text, branch=branch)
-                        print(f"ATS Success ({branch}): {student.ats_score}% for {student.user.full_name}")
-                    else:
-                        print(f"ATS Error: Extraction returned EMPTY text for {resume_file.name}")
-                        student.ats_score = 0
-                except Exception as e:
-                    import traceback
-                    print(f"ATS Exception: {e}")
-                    traceback.print_exc()
-                    student.ats_score = 0
+                resume_hash = hash_resume_file(resume_file)
+                # Re-uploading the same bytes keeps the stored file and score
+                if resume_hash != student.resume_hash or not student.resume:
+                    save_resume_file(student, resume_file, resume_hash)
+                    student.resume_hash = resume_hash
+                    student.resume_uploaded_at = timezone.now()
+                resume_uploaded = True
                 
             student.save()
+
+            if 'skills' in request.data:
+                from accounts.skill_index import index_profile_skills
+                index_profile_skills(student)
+
+            # ATS scoring (extraction, spaCy, TF-IDF) runs in the background worker;
+            # the client polls the ats-status endpoint for the result. A new
+            # department also rescores, since the score uses branch keywords.
+            ats_status = None
+            if resume_uploaded or (student.resume and 'department' in request.data):
+                from accounts.ats_queue import enqueue_ats_scoring, needs_ats_scoring
+                if needs_ats_scoring(student):
+                    ats_status = enqueue_ats_scoring(student).status
+                elif resume_uploaded:
+                    ats_status = 'done'
+
             return Response({
                 "message": "Profile updated successfully",
                 "full_name": student.user.full_name,
@@ -271,6 +367,7 @@ class StudentProfileView(APIView):
                 "total_backlogs": student.total_backlogs,
                 "profile_completion": student.profile_completion,
                 "ats_score": student.ats_score,
+                "ats_status": ats_status,
                 "resume": student.resume.url if student.resume else None,
                 "image": student.image.url if student.image else None
             })
@@ -281,6 +378,38 @@ class StudentProfileView(APIView):
             traceback.print_exc()
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+class AtsStatusView(APIView):
+    # permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        phone = request.query_params.get('phone')
+        try:
+            student = Student.objects.get(user__phone=phone)
+        except Student.DoesNotExist:
+            return Response({"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        from accounts.ats_queue import get_ats_status
+        return Response(get_ats_status(student))
+
+class AiSuggestionsView(APIView):
+    # permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        phone = request.query_params.get('phone')
+        try:
+            student = Student.objects.get(user__phone=phone)
+        except Student.DoesNotExist:
+            return Response({"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        from accounts.ai_suggestions import request_ai_suggestions
+        from accounts.resume_store import get_student_resume_text
+        resume_text = get_student_resume_text(student)
+        if not resume_text:
+            return Response({"ai_status": None, "ai_suggestions": None})
+
+        ai = request_ai_suggestions(resume_text, student.resume_hash)
+        return Response({"ai_status": ai["status"], "ai_suggestions": ai["text"]})
+
 class WebSearchView(APIView):
     def get(self, request):
         query = request.query_params.get('query')
@@ -0,0 +1,129 @@
+import itertools
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import Interview, JobApplication, RegistrationRequest, Student, Teacher, User
+
+PHONES = (f"84{n:08d}" for n in itertools.count())
+
+
+def make_teacher(phone, department):
+    user = User.objects.create_user(
+        phone=phone, email=f"{phone}@gmail.com", full_name=f"Teacher {phone}", role='teacher',
+    )
+    return Teacher.objects.create(
+        user=user, designation='Lecturer', qualification='M.Tech', department=department,
+        experience='5', position='Staff',
+    )
+
+
+def make_interview(department, company='Acme'):
+    return Interview.objects.create(
+        company=company, role='Developer', department=department,
+        date_time=timezone.now() + timedelta(days=3), meeting_link='https://meet.example.com/x',
+    )
+
+
+class TeacherInterviewTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.joint = make_interview('CT, Electronics', company='Joint')
+        self.ct = make_interview('CT', company='Solo')
+
+    def companies(self, department):
+        teacher = make_teacher(next(PHONES), department)
+        response = self.client.get('/api/teacher/interviews/', {'phone': teacher.user.phone})
+        self.assertEqual(response.status_code, 200)
+        return {row['company'] for row in response.data}
+
+    def test_multi_department_interviews_reach_every_listed_department(self):
+        self.assertEqual(set(self.joint.branches.values_list('code', flat=True)), {'CT', 'EL'})
+        self.assertEqual(self.companies('Computer Technology'), {'Joint', 'Solo'})
+        self.assertEqual(self.companies('EL'), {'Joint'})
+        self.assertEqual(self.companies('EEE'), set())
+
+    def test_unresolved_departments_fall_back_to_a_text_match(self):
+        make_interview('Mechanical, Civil', company='Core')
+        self.assertEqual(self.companies('Civil'), {'Core'})
+
+    def test_department_edits_resync_branches(self):
+        self.ct.department = 'EL'
+        self.ct.save()
+        self.assertEqual(list(self.ct.branches.values_list('code', flat=True)), ['EL'])
+        self.assertEqual(self.companies('EL'), {'Joint', 'Solo'})
+
+    def test_placement_interviews_filter_by_department(self):
+        response = self.client.get('/api/placement/interviews/', {'department': 'electronics'})
+        self.assertEqual([row['company'] for row in response.data], ['Joint'])
+
+
+class TeacherDashboardStatsTests(TestCase):
+    def setUp(self):
+        from accounts.tests import clear_caches, make_job, make_student
+
+        clear_caches()
+        self.client = APIClient()
+        self.teacher = make_teacher(next(PHONES), 'Computer Technology')
+        placed = make_student('9400000001')
+        # save() derives profile_completion from the filled fields
+        Student.objects.filter(pk=placed.pk).update(profile_completion=100)
+        self.applicant = make_student('9400000002')
+        make_student('9400000003')
+        inactive = make_student('9400000004')
+        inactive.user.is_active = False
+        inactive.user.save()
+        make_student('9400000005', department='EL')
+
+        # Two selections for one student still count one placement
+        for company in ('Acme', 'Globex'):
+            JobApplication.objects.create(student=placed, job=make_job(company), status='Selected')
+        self.application = JobApplication.objects.create(student=self.applicant, job=make_job('Initech'))
+
+        rows = [('CT', 'Pending'), ('CT', 'Pending'), ('CT', 'Approved'), ('EL', 'Pending')]
+        for i, (department, status) in enumerate(rows):
+            RegistrationRequest.objects.create(
+                full_name=f"Applicant {i}", email=f"applicant{i}@gmail.com", phone=f"94100000{i:02d}",
+                password='x', dob='2005-01-01', gender='Female', college='GPTC', department=department,
+                course='Diploma', semester='1', roll_no=f"R{i}", status=status,
+            )
+        self.pending_ct = RegistrationRequest.objects.filter(department='CT', status='Pending').first()
+
+    def dashboard(self):
+        response = self.client.get('/api/teacher/dashboard/', {'phone': self.teacher.user.phone})
+        self.assertEqual(response.status_code, 200)
+        stats = {row['label']: int(row['value']) for row in response.data['stats']}
+        stats['Incomplete Profiles'] = response.data['incomplete_profiles']
+        return stats, response['X-Dashboard-Cache']
+
+    def test_counter_values(self):
+        stats, cache = self.dashboard()
+        self.assertEqual(cache, 'MISS')
+        self.assertEqual(stats, {
+            'Total Students': 3, 'Placed Students': 1, 'Pending Approvals': 2, 'Incomplete Profiles': 2,
+        })
+
+    def test_department_stats_matches_the_view(self):
+        from accounts.teacher_dashboard import department_stats
+
+        stats = department_stats(self.teacher.department, self.teacher.branch_id)
+        self.assertEqual(stats, {
+            'total_students': 3, 'placed_students': 1, 'incomplete_profiles': 2, 'pending_approvals': 2,
+        })
+        self.assertEqual(set(department_stats('Mechanical', None).values()), {0})
+
+    def test_cached_until_a_selection_or_registration_changes(self):
+        self.dashboard()
+        self.assertEqual(self.dashboard()[1], 'HIT')
+
+        self.application.status = 'Selected'
+        self.application.save()
+        stats, cache = self.dashboard()
+        self.assertEqual((cache, stats['Placed Students']), ('MISS', 2))
+
+        self.pending_ct.status = 'Rejected'
+        self.pending_ct.save()
+        stats, cache = self.dashboard()
+        self.assertEqual((cache, stats['Pending Approvals']), ('MISS', 1))
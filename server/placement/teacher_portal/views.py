@@ -3,7 +3,9 @@ from rest_framework.response import Response
 from rest_framework import status, permissions
 from accounts.models import Student, User, Teacher, RegistrationRequest, Notification, PlacementOfficer, Interview
 from accounts.serializers import InterviewSerializer, StudentSimpleSerializer
-from django.db.models import Count
+from django.db.models import Count, Prefetch
+from accounts.departments import department_q, interview_department_q
+from accounts.teacher_dashboard import get_department_stats
 
 class TeacherDashboardView(APIView):
     def get(self, request):
@@ -14,23 +16,21 @@ class TeacherDashboardView(APIView):
         try:
             teacher = Teacher.objects.get(user__phone=phone)
             dept = teacher.department
-            
-            total_students = Student.objects.filter(department__iexact=dept, user__is_active=True).count()
-            pending_approvals = RegistrationRequest.objects.filter(department__iexact=dept, status='Pending').count()
-            # Placeholder for placed students until that logic is implemented
-            placed_students = Student.objects.filter(department__iexact=dept, applications__status='Selected').distinct().count()
-            incomplete_profiles = Student.objects.filter(department__iexact=dept, user__is_active=True, profile_completion__lt=100).count()
+
+            stats, cached = get_department_stats(dept, teacher.branch_id)
 
             data = {
                 "message": f"Welcome to the {dept} Teacher Dashboard",
                 "stats": [
-                    {"label": "Total Students", "value": str(total_students)},
-                    {"label": "Placed Students", "value": str(placed_students)},
-                    {"label": "Pending Approvals", "value": str(pending_approvals)},
+                    {"label": "Total Students", "value": str(stats["total_students"])},
+                    {"label": "Placed Students", "value": str(stats["placed_students"])},
+                    {"label": "Pending Approvals", "value": str(stats["pending_approvals"])},
                 ],
-                "incomplete_profiles": incomplete_profiles
+                "incomplete_profiles": stats["incomplete_profiles"]
             }
-            return Response(data)
+            response = Response(data)
+            response['X-Dashboard-Cache'] = 'HIT' if cached else 'MISS'
+            return response
         except Teacher.DoesNotExist:
             return Response({"error": "Teacher profile not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -44,7 +44,7 @@ class PendingRegistrationsView(APIView):
         try:
             teacher = Teacher.objects.get(user__phone=phone)
             pending_requests = RegistrationRequest.objects.filter(
-                department__iexact=teacher.department, 
+                department_q(teacher.department, teacher.branch_id),
                 status='Pending'
             ).order_by('-created_at')
             
@@ -221,7 +221,7 @@ class TeacherStudentListView(APIView):
             
         try:
             teacher = Teacher.objects.get(user__phone=phone)
-            students = Student.objects.filter(department__iexact=teacher.department, user__is_active=True).order_by('roll_no')
+            students = Student.objects.filter(department_q(teacher.department, teacher.branch_id), user__is_active=True).select_related('user').order_by('roll_no')
             
             data = [{
                 "id": s.id,
@@ -250,8 +250,12 @@ class TeacherInterviewView(APIView):
         phone = request.query_params.get('phone')
         try:
             teacher = Teacher.objects.get(user__phone=phone)
-            # Find interviews that match the teacher's department exactly or partially
-            interviews = Interview.objects.filter(department__icontains=teacher.department).order_by('-date_time')
+            # Interviews scheduled for the teacher's department
+            interviews = Interview.objects.filter(
+                interview_department_q(teacher.department, teacher.branch_id)
+            ).prefetch_related(
+                'branches', Prefetch('selected_students', queryset=Student.objects.select_related('user'))
+            ).order_by('-date_time')
             serializer = InterviewSerializer(interviews, many=True)
             return Response(serializer.data)
         except Teacher.DoesNotExist:
@@ -264,20 +268,23 @@ class SelectStudentsForInterviewView(APIView):
         
         try:
             interview = Interview.objects.get(id=interview_id)
-            students = Student.objects.filter(id__in=student_ids)
+            students = list(Student.objects.filter(id__in=student_ids))
             
             # Update selected students
             interview.selected_students.set(students)
             interview.save()
             
-            # Notify students
-            for student in students:
-                Notification.objects.get_or_create(
-                    user=student.user,
-                    title="Interview Invitation",
-                    message=f"You have been selected for the {interview.company} interview on {interview.date_time.strftime('%H:%M %p, %d %b %Y')}.",
-                    extra_data={"interview_id": interview.id, "type": "interview_invitation", "link": interview.meeting_link}
-                )
+            # Notify students, skipping those already invited (one lookup, one insert)
+            title = "Interview Invitation"
+            message = f"You have been selected for the {interview.company} interview on {interview.date_time.strftime('%H:%M %p, %d %b %Y')}."
+            extra_data = {"interview_id": interview.id, "type": "interview_invitation", "link": interview.meeting_link}
+            notified = set(Notification.objects.filter(
+                user_id__in=[s.user_id for s in students], title=title, message=message, extra_data=extra_data
+            ).values_list('user_id', flat=True))
+            Notification.objects.bulk_create([
+                Notification(user_id=s.user_id, title=title, message=message, extra_data=extra_data)
+                for s in students if s.user_id not in notified
+            ])
             
             return Response({"message": f"Successfully selected {len(students)} students and notified them."})
         except Interview.DoesNotExist:
@@ -295,15 +302,15 @@ class TeacherAnnouncementView(APIView):
             return Response({"error": "Phone, title, and message are required"}, status=status.HTTP_400_BAD_REQUEST)
             
         try:
-            teacher = Teacher.objects.get(user__phone=phone)
-            students = Student.objects.filter(department__iexact=teacher.department, user__is_active=True)
+            teacher = Teacher.objects.select_related('user').get(user__phone=phone)
+            students = Student.objects.filter(department_q(teacher.department, teacher.branch_id), user__is_active=True)
             
             # Create notifications for all students in the department
             notifications = []
             for student in students:
                 notifications.append(
                     Notification(
-                        user=student.user,
+                        user_id=student.user_id,
                         title=f"Announcement: {title}",
                         message=message,
                         extra_data={"type": "announcement", "teacher": teacher.user.full_name, "department": teacher.department}
@@ -327,9 +334,9 @@ class AlertIncompleteProfilesView(APIView):
             return Response({"error": "Phone is required"}, status=status.HTTP_400_BAD_REQUEST)
             
         try:
-            teacher = Teacher.objects.get(user__phone=phone)
+            teacher = Teacher.objects.select_related('user').get(user__phone=phone)
             incomplete_students = Student.objects.filter(
-                department__iexact=teacher.department, 
+                department_q(teacher.department, teacher.branch_id),
                 user__is_active=True, 
                 profile_completion__lt=100
             )
@@ -353,7 +360,7 @@ class AlertIncompleteProfilesView(APIView):
                 
                 notifications.append(
                     Notification(
-                        user=student.user,
+                        user_id=student.user_id,
                         title="Action Required: Incomplete Profile",
                         message=f"Please complete your profile to be eligible for placements. You are missing: {details}.",
                         extra_data={"type": "profile_alert", "teacher": teacher.user.full_name}